@@ -7,10 +7,14 @@ from zoneinfo import ZoneInfo
 from flask import Flask
 from dotenv import load_dotenv
 
+from app.clients.openai_clients import warmup_openai_clients
+from app.common.event_loop import submit_async
 from app.common.exception.error_handler import register_error_handlers
 from app.blueprints.standard import standard_blueprint
 from app.blueprints.agreement import agreement_blueprint
 from app.blueprints.common import healthcheck_blueprint
+from app.services.common.model_registry import warmup_models
+from config.app_config import AppConfig
 
 load_dotenv()
 
@@ -51,4 +55,10 @@ def create_app():
     app.register_blueprint(standard_blueprint.standards)
     app.register_blueprint(agreement_blueprint.agreements)
 
+    # 워커 시작 시 외부 API 연결 미리 수립
+    if AppConfig.PREWARM_CLIENTS:
+        submit_async(warmup_openai_clients())
+    if AppConfig.PREWARM_MODELS:
+        submit_async(warmup_models())
+
     return app
@@ -4,12 +4,13 @@ from flask import Blueprint
 
 from app.blueprints.agreement.agreement_exception import AgreementException
 from app.common.decorators import parse_request
+from app.common.event_loop import run_async
 from app.common.exception.error_code import ErrorCode
-from app.common.file_type import FileType
-from app.schemas.analysis_response import AnalysisResponse
+from app.common.file_type import FileType, OCR_FILE_TYPES
 from app.schemas.document_request import DocumentRequest
 from app.schemas.success_code import SuccessCode
 from app.schemas.success_response import SuccessResponse
+from app.services.agreement.analysis_flight import run_analysis_once
 from app.services.common.ingestion_pipeline import extract_file_type, \
   pdf_agreement_service, ocr_service
 
@@ -21,15 +22,16 @@ agreements = Blueprint('agreements', __name__, url_prefix="/flask/agreements")
 def process_agreements_pdf_from_s3(document_request: DocumentRequest):
 
   file_type = extract_file_type(document_request.url)
-  if file_type in (FileType.PNG, FileType.JPG, FileType.JPEG):
-    chunks, total_chunks, total_page = ocr_service(document_request)
+  # 여러 장의 이미지나 스캔 PDF 묶음은 페이지별 OCR 경로로 처리
+  if document_request.urls or file_type in OCR_FILE_TYPES:
+    service = ocr_service
   elif file_type == FileType.PDF:
-    chunks, total_chunks, total_page = pdf_agreement_service(document_request)
+    service = pdf_agreement_service
   else:
     raise AgreementException(ErrorCode.UNSUPPORTED_FILE_TYPE)
 
-  return SuccessResponse(SuccessCode.REVIEW_SUCCESS,
-                         AnalysisResponse(total_page=total_page,
-                                          chunks=chunks,
-                                          total_chunks=total_chunks)
-                         ).of(), HTTPStatus.OK
+  # 타임아웃 재시도로 같은 요청이 겹치면 먼저 들어온 요청의 결과를 함께 받음
+  response = run_async(run_analysis_once(service, document_request))
+
+  return SuccessResponse(SuccessCode.REVIEW_SUCCESS, response).of(), \
+    HTTPStatus.OK
@@ -1,7 +1,13 @@
 from flask import Blueprint, jsonify
 
+from app.common import metrics
+
 health = Blueprint('health', __name__)
 
 @health.route('/health-check', methods=['GET'])
 def health_check():
-  return jsonify({"status": "healthy"}), 200
\ No newline at end of file
+  return jsonify({"status": "healthy"}), 200
+
+@health.route('/metrics', methods=['GET'])
+def worker_metrics():
+  return jsonify(metrics.snapshot()), 200
@@ -1,4 +1,3 @@
-import asyncio
 from http import HTTPStatus
 
 from flask import Blueprint
@@ -6,16 +5,14 @@ from flask import Blueprint
 from app.blueprints.agreement.agreement_exception import AgreementException
 from app.common.constants import SUCCESS
 from app.common.decorators import parse_request
+from app.common.event_loop import run_async
 from app.common.exception.error_code import ErrorCode
 from app.schemas.analysis_response import StandardResponse
 from app.schemas.document_request import DocumentRequest
 from app.schemas.success_code import SuccessCode
 from app.schemas.success_response import SuccessResponse
-from app.services.common.ingestion_pipeline import preprocess_pdf, \
-  chunk_standard_texts, normalize_spacing
+from app.services.common.ingestion_pipeline import standard_ingestion_service
 from app.services.standard.vector_delete import delete_by_standard_id
-from app.services.standard.vector_store.vector_processor import \
-  vectorize_and_save
 
 standards = Blueprint('standards', __name__, url_prefix="/flask/standards")
 
@@ -24,12 +21,7 @@ standards = Blueprint('standards', __name__, url_prefix="/flask/standards")
 @parse_request(DocumentRequest)
 def process_standards_pdf_from_s3(document_request: DocumentRequest):
 
-  documents, _ = preprocess_pdf(document_request)
-  chunks = chunk_standard_texts(documents, document_request.categoryName)
-
-  asyncio.run(vectorize_and_save(chunks, document_request))
-
-  contents = [normalize_spacing(doc.page_content) for doc in documents]
+  contents = run_async(standard_ingestion_service(document_request))
   return SuccessResponse(SuccessCode.ANALYSIS_COMPLETE,
                          StandardResponse(result=SUCCESS, contents=contents)).of(), HTTPStatus.OK
 
@@ -43,5 +35,5 @@ def delete_standard(categoryName: str, standardId: str):
     raise AgreementException(ErrorCode.CANNOT_CONVERT_TO_NUM)
 
   success_code = (
-    asyncio.run(delete_by_standard_id(int(standardId), categoryName)))
+    run_async(delete_by_standard_id(int(standardId), categoryName)))
   return SuccessResponse(success_code, SUCCESS).of(), HTTPStatus.OK
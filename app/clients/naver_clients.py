@@ -1,13 +1,20 @@
+import asyncio
 import os
 from typing import Tuple
 
+import httpx
 from dotenv import load_dotenv
 
 from app.blueprints.agreement.agreement_exception import AgreementException
+from app.common.event_loop import register_shutdown_hook
 from app.common.exception.error_code import ErrorCode
+from config.app_config import AppConfig
 
 load_dotenv()
 
+_ocr_http_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
 
 def get_naver_ocr_client() -> Tuple[str, dict]:
   api_url = os.getenv("NAVER_CLOVA_API_URL")
@@ -19,4 +26,35 @@ def get_naver_ocr_client() -> Tuple[str, dict]:
   headers = {
     "X-OCR-SECRET": api_key
   }
-  return api_url, headers
\ No newline at end of file
+  return api_url, headers
+
+
+def get_ocr_http_client() -> httpx.AsyncClient:
+  # 페이지 이미지 다운로드와 CLOVA 요청이 함께 쓰는 커넥션 풀 (루프가 바뀐 경우에만 새로 생성)
+  global _ocr_http_client, _client_loop
+
+  loop = asyncio.get_running_loop()
+  if _ocr_http_client is None or _client_loop is not loop:
+    _ocr_http_client = httpx.AsyncClient(
+        timeout=httpx.Timeout(timeout=AppConfig.OCR_TIMEOUT, connect=10.0),
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=AppConfig.OCR_MAX_CONNECTIONS,
+            max_keepalive_connections=AppConfig.OCR_MAX_CONNECTIONS,
+            keepalive_expiry=AppConfig.OCR_KEEPALIVE_EXPIRY
+        )
+    )
+    _client_loop = loop
+  return _ocr_http_client
+
+
+async def close_ocr_http_client() -> None:
+  global _ocr_http_client, _client_loop
+
+  client, loop = _ocr_http_client, _client_loop
+  _ocr_http_client, _client_loop = None, None
+  if client is not None and loop is asyncio.get_running_loop():
+    await client.aclose()
+
+
+register_shutdown_hook(close_ocr_http_client)
@@ -1,12 +1,15 @@
+import asyncio
 import logging
 import os
-from contextlib import asynccontextmanager, contextmanager
+import threading
 
 import httpx
 from dotenv import load_dotenv
 from openai import AsyncAzureOpenAI, AzureOpenAI
 
-from app.common.constants import EMBEDDING_MODEL, PROMPT_MODEL
+from app.common.constants import EMBEDDING_MODEL, PROMPT_MODEL, LLM_TIMEOUT
+from app.common.event_loop import register_shutdown_hook
+from config.app_config import AppConfig
 
 load_dotenv() # 루트로 고정
 
@@ -14,46 +17,131 @@ load_dotenv() # 루트로 고정
 # sync_openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
 
-@asynccontextmanager
-async def get_dense_embedding_async_client():
-  async with AsyncAzureOpenAI(
-      api_key=os.getenv("AZURE_EMBEDDING_API_KEY"),
-      api_version="2023-05-15",
-      azure_endpoint=os.getenv("AZURE_EMBEDDING_OPENAI_ENDPOINT"),
-  ) as client:
-    yield client
+class AzureOpenAIClientPool:
+  def __init__(self, api_key_env: str, endpoint_env: str, api_version: str,
+      timeout: httpx.Timeout):
+    self.api_key_env = api_key_env
+    self.endpoint_env = endpoint_env
+    self.api_version = api_version
+    self.timeout = timeout
 
+    self._async_client: AsyncAzureOpenAI | None = None
+    self._async_http_client: httpx.AsyncClient | None = None
+    self._client_loop: asyncio.AbstractEventLoop | None = None
+    self._sync_client: AzureOpenAI | None = None
+    self._sync_lock = threading.Lock()
+
+  def get_async_client(self) -> AsyncAzureOpenAI:
+    # httpx 커넥션 풀은 이벤트 루프에 묶이므로 루프가 바뀐 경우에만 새로 생성
+    loop = asyncio.get_running_loop()
+    if self._async_client is None or self._client_loop is not loop:
+      self._async_http_client = httpx.AsyncClient(
+          timeout=self.timeout,
+          http2=AppConfig.OPENAI_HTTP2,
+          limits=self._limits()
+      )
+      self._async_client = AsyncAzureOpenAI(
+          api_key=os.getenv(self.api_key_env),
+          api_version=self.api_version,
+          azure_endpoint=os.getenv(self.endpoint_env),
+          http_client=self._async_http_client
+      )
+      self._client_loop = loop
+      logging.info(f"[AzureOpenAIClientPool]: endpoint: "
+                   f"{os.getenv(self.endpoint_env)} (http2={AppConfig.OPENAI_HTTP2})")
+    return self._async_client
+
+  def get_sync_client(self) -> AzureOpenAI:
+    with self._sync_lock:
+      if self._sync_client is None:
+        self._sync_client = AzureOpenAI(
+            api_key=os.getenv(self.api_key_env),
+            api_version=self.api_version,
+            azure_endpoint=os.getenv(self.endpoint_env),
+            http_client=httpx.Client(timeout=self.timeout,
+                                     limits=self._limits())
+        )
+      return self._sync_client
+
+  async def warmup(self, connections: int) -> None:
+    endpoint = os.getenv(self.endpoint_env)
+    if not endpoint:
+      return
+
+    self.get_async_client()
+    # HTTP/2는 하나의 연결을 다중화하므로 한 번만 연결해 두면 충분
+    count = 1 if AppConfig.OPENAI_HTTP2 else connections
+    results = await asyncio.gather(
+        *[self._async_http_client.head(endpoint) for _ in range(count)],
+        return_exceptions=True)
+
+    failures = [r for r in results if isinstance(r, Exception)]
+    if failures:
+      logging.warning(
+          f"[AzureOpenAIClientPool]: {self.endpoint_env} 사전 연결 실패 {failures[0]}")
+
+  async def close(self) -> None:
+    client, loop = self._async_client, self._client_loop
+    self._async_client, self._async_http_client, self._client_loop = \
+      None, None, None
+    if client is not None and loop is asyncio.get_running_loop():
+      await client.close()
+
+    with self._sync_lock:
+      if self._sync_client is not None:
+        self._sync_client.close()
+        self._sync_client = None
+
+  @staticmethod
+  def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=AppConfig.OPENAI_MAX_CONNECTIONS,
+        max_keepalive_connections=AppConfig.OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=AppConfig.OPENAI_KEEPALIVE_EXPIRY
+    )
+
+
+embedding_client_pool = AzureOpenAIClientPool(
+    api_key_env="AZURE_EMBEDDING_API_KEY",
+    endpoint_env="AZURE_EMBEDDING_OPENAI_ENDPOINT",
+    api_version="2023-05-15",
+    timeout=httpx.Timeout(timeout=60.0, connect=10.0)
+)
+
+prompt_client_pool = AzureOpenAIClientPool(
+    api_key_env="AZURE_PROMPT_API_KEY",
+    endpoint_env="AZURE_PROMPT_OPENAI_ENDPOINT",
+    api_version="2025-01-01-preview",
+    timeout=httpx.Timeout(timeout=LLM_TIMEOUT, connect=30.0)
+)
 
-@contextmanager
-def get_embedding_sync_client():
-  client = AzureOpenAI(
-      api_key=os.getenv("AZURE_EMBEDDING_API_KEY"),
-      api_version="2023-05-15",
-      azure_endpoint=os.getenv("AZURE_EMBEDDING_OPENAI_ENDPOINT")
-  )
-  try:
-    yield client
-  finally:
-    client.close()
+
+def get_dense_embedding_async_client() -> AsyncAzureOpenAI:
+  return embedding_client_pool.get_async_client()
+
+
+def get_embedding_sync_client() -> AzureOpenAI:
+  return embedding_client_pool.get_sync_client()
 
 embedding_deployment_name = EMBEDDING_MODEL
 
 
-@asynccontextmanager
-async def get_prompt_async_client():
-  httpx_client = httpx.AsyncClient(
-      timeout=httpx.Timeout(timeout=30.0, connect=30.0),
-      http2=False
-  )
-  async with httpx_client:
-    async with AsyncAzureOpenAI(
-        api_key=os.getenv("AZURE_PROMPT_API_KEY"),
-        api_version="2025-01-01-preview",
-        azure_endpoint=os.getenv("AZURE_PROMPT_OPENAI_ENDPOINT"),
-        http_client=httpx_client
-    ) as client:
-      ad = os.getenv("AZURE_PROMPT_OPENAI_ENDPOINT")
-      logging.info(f"endpoint: {ad}")
-      yield client
+def get_prompt_async_client() -> AsyncAzureOpenAI:
+  return prompt_client_pool.get_async_client()
 
 prompt_deployment_name = PROMPT_MODEL
+
+
+async def warmup_openai_clients() -> None:
+  await asyncio.gather(
+      embedding_client_pool.warmup(AppConfig.OPENAI_PREWARM_CONNECTIONS),
+      prompt_client_pool.warmup(AppConfig.OPENAI_PREWARM_CONNECTIONS)
+  )
+
+
+async def close_openai_clients() -> None:
+  await embedding_client_pool.close()
+  await prompt_client_pool.close()
+
+
+register_shutdown_hook(close_openai_clients)
@@ -1,9 +1,55 @@
+import asyncio
+import logging
+
+import httpx
 from qdrant_client import AsyncQdrantClient
+
+from app.common.event_loop import register_shutdown_hook
 from config.app_config import AppConfig
 
+_qdrant_client: AsyncQdrantClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
 def get_qdrant_client() -> AsyncQdrantClient:
+  # 커넥션 풀은 이벤트 루프에 묶이므로 루프가 바뀐 경우에만 새로 생성
+  global _qdrant_client, _client_loop
+
+  loop = asyncio.get_running_loop()
+  if _qdrant_client is None or _client_loop is not loop:
+    _qdrant_client = create_qdrant_client()
+    _client_loop = loop
+  return _qdrant_client
+
+
+def create_qdrant_client() -> AsyncQdrantClient:
+  logging.info(
+      f"[create_qdrant_client]: {AppConfig.QDRANT_HOST} "
+      f"(prefer_grpc={AppConfig.QDRANT_PREFER_GRPC})")
   return AsyncQdrantClient(
       host=AppConfig.QDRANT_HOST,
       port=AppConfig.QDRANT_PORT,
-      timeout=60
-  )
\ No newline at end of file
+      grpc_port=AppConfig.QDRANT_GRPC_PORT,
+      prefer_grpc=AppConfig.QDRANT_PREFER_GRPC,
+      timeout=AppConfig.QDRANT_TIMEOUT,
+      limits=httpx.Limits(
+          max_connections=AppConfig.QDRANT_MAX_CONNECTIONS,
+          max_keepalive_connections=AppConfig.QDRANT_MAX_KEEPALIVE_CONNECTIONS,
+          keepalive_expiry=AppConfig.QDRANT_KEEPALIVE_EXPIRY
+      ),
+      grpc_options={
+        "grpc.keepalive_time_ms": int(AppConfig.QDRANT_KEEPALIVE_EXPIRY * 1000)
+      }
+  )
+
+
+async def close_qdrant_client() -> None:
+  global _qdrant_client, _client_loop
+
+  client, loop = _qdrant_client, _client_loop
+  _qdrant_client, _client_loop = None, None
+  if client is not None and loop is asyncio.get_running_loop():
+    await client.close()
+
+
+register_shutdown_hook(close_qdrant_client)
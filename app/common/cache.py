@@ -0,0 +1,170 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+SQLITE_TIMEOUT = 30.0
+EVICTION_CHECK_INTERVAL = 100
+
+
+class LRUCache:
+  def __init__(self, max_bytes: int):
+    self.max_bytes = max_bytes
+    self._entries: OrderedDict[str, bytes] = OrderedDict()
+    self._size = 0
+    self._lock = threading.Lock()
+
+  def get(self, key: str) -> Optional[bytes]:
+    with self._lock:
+      value = self._entries.get(key)
+      if value is not None:
+        self._entries.move_to_end(key)
+      return value
+
+  def set(self, key: str, value: bytes) -> None:
+    if len(value) > self.max_bytes:
+      return
+
+    with self._lock:
+      previous = self._entries.pop(key, None)
+      if previous is not None:
+        self._size -= len(previous)
+
+      self._entries[key] = value
+      self._size += len(value)
+      while self._size > self.max_bytes:
+        _, evicted = self._entries.popitem(last=False)
+        self._size -= len(evicted)
+
+  def delete(self, key: str) -> None:
+    with self._lock:
+      value = self._entries.pop(key, None)
+      if value is not None:
+        self._size -= len(value)
+
+  def clear(self) -> None:
+    with self._lock:
+      self._entries.clear()
+      self._size = 0
+
+
+class SqliteCache:
+  # 여러 gunicorn 워커가 같은 파일을 공유하는 로컬 영속 캐시
+  def __init__(self, path: str, max_bytes: int,
+      ttl_seconds: Optional[float] = None):
+    self.path = path
+    self.max_bytes = max_bytes
+    self.ttl_seconds = ttl_seconds
+    self._local = threading.local()
+    self._writes = 0
+    self._write_lock = threading.Lock()
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with self._connection() as conn:
+      conn.execute(
+          "CREATE TABLE IF NOT EXISTS cache ("
+          "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+          "accessed_at REAL NOT NULL, expires_at REAL)")
+      conn.execute(
+          "CREATE INDEX IF NOT EXISTS cache_accessed_at ON cache (accessed_at)")
+
+  def _connection(self) -> sqlite3.Connection:
+    conn = getattr(self._local, "conn", None)
+    if conn is None or getattr(self._local, "pid", None) != os.getpid():
+      conn = sqlite3.connect(self.path, timeout=SQLITE_TIMEOUT,
+                             isolation_level=None)
+      conn.execute("PRAGMA journal_mode=WAL")
+      conn.execute("PRAGMA synchronous=NORMAL")
+      self._local.conn = conn
+      self._local.pid = os.getpid()
+    return conn
+
+  def get(self, key: str) -> Optional[bytes]:
+    return self.get_many([key]).get(key)
+
+  def get_many(self, keys: Iterable[str]) -> Dict[str, bytes]:
+    keys = list(keys)
+    found: Dict[str, bytes] = {}
+    if not keys:
+      return found
+
+    now = time.time()
+    try:
+      conn = self._connection()
+      # sqlite 바인딩 변수 개수 제한을 넘지 않도록 나눠서 조회
+      for i in range(0, len(keys), 500):
+        batch = keys[i:i + 500]
+        placeholders = ",".join("?" * len(batch))
+        rows = conn.execute(
+            f"SELECT key, value FROM cache WHERE key IN ({placeholders}) "
+            f"AND (expires_at IS NULL OR expires_at > ?)",
+            (*batch, now)).fetchall()
+        found.update(rows)
+
+      if found:
+        conn.executemany("UPDATE cache SET accessed_at = ? WHERE key = ?",
+                         [(now, key) for key in found])
+    except sqlite3.Error as e:
+      logging.warning(f"[SqliteCache]: 조회 실패 {e}")
+    return found
+
+  def set(self, key: str, value: bytes) -> None:
+    self.set_many({key: value})
+
+  def set_many(self, entries: Dict[str, bytes]) -> None:
+    if not entries:
+      return
+
+    now = time.time()
+    expires_at = now + self.ttl_seconds if self.ttl_seconds else None
+    try:
+      conn = self._connection()
+      conn.executemany(
+          "INSERT OR REPLACE INTO cache "
+          "(key, value, size, accessed_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+          [(key, value, len(value), now, expires_at) for key, value in
+           entries.items()])
+    except sqlite3.Error as e:
+      logging.warning(f"[SqliteCache]: 저장 실패 {e}")
+      return
+
+    with self._write_lock:
+      self._writes += len(entries)
+      should_evict = self._writes >= EVICTION_CHECK_INTERVAL
+      if should_evict:
+        self._writes = 0
+    if should_evict:
+      self.evict()
+
+  def delete(self, key: str) -> None:
+    try:
+      self._connection().execute("DELETE FROM cache WHERE key = ?", (key,))
+    except sqlite3.Error as e:
+      logging.warning(f"[SqliteCache]: 삭제 실패 {e}")
+
+  def evict(self) -> None:
+    try:
+      conn = self._connection()
+      conn.execute("DELETE FROM cache WHERE expires_at IS NOT NULL "
+                   "AND expires_at <= ?", (time.time(),))
+      total = conn.execute(
+          "SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+      if total <= self.max_bytes:
+        return
+
+      # 오래 사용되지 않은 항목부터 용량 한도의 90%까지 제거
+      overflow = total - int(self.max_bytes * 0.9)
+      rows: List = conn.execute(
+          "SELECT key, size FROM cache ORDER BY accessed_at").fetchall()
+      victims = []
+      for key, size in rows:
+        if overflow <= 0:
+          break
+        victims.append((key,))
+        overflow -= size
+      conn.executemany("DELETE FROM cache WHERE key = ?", victims)
+    except sqlite3.Error as e:
+      logging.warning(f"[SqliteCache]: 용량 정리 실패 {e}")
@@ -11,6 +11,12 @@ NUMBER_HEADER_PATTERN = r'(\d+\.\s*[^\n:：]+)\s*[:：]?\s*(.*?)(?=\d+\.\s|$)'
 
 CLAUSE_HEADER_PATTERN = r'(①|1\.|\(1\))'
 
+# 구조 파서용: 위 청크 패턴을 헤더와 본문 경계 토큰으로 분리한 것
+ARTICLE_SECTION_HEADER_PATTERN = r'제\s*\d+\s*조\s*(?:【[^】\n]*】?|[^】\n]*】|\([^)\\n]*\)?|\[[^\]\n]*\]?)'
+ARTICLE_BOUNDARY_PATTERN = r'제\s*\d+\s*조'
+NUMBER_SECTION_HEADER_PATTERN = r'(\d+\.\s*[^\n:：]+)\s*[:：]?\s*'
+NUMBER_BOUNDARY_PATTERN = r'\d+\.\s'
+
 CLAUSE_TEXT_SEPARATOR = "!!!"
 ARTICLE_CLAUSE_SEPARATOR = "+"
 
@@ -18,4 +24,7 @@ MAX_RETRIES = 5
 LLM_TIMEOUT = 30.0
 
 PROMPT_MODEL = "gpt-4.1-mini"
-EMBEDDING_MODEL = "text-embedding-3-small"
\ No newline at end of file
+# 계약서 교정 프롬프트 문구나 응답 형식을 바꾸면 올려서 캐시된 분석 결과를 무효화
+PROMPT_VERSION = 1
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_DIMENSION = 1536
\ No newline at end of file
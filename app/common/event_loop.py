@@ -0,0 +1,105 @@
+import asyncio
+import atexit
+import logging
+import os
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Coroutine, List, TypeVar
+
+from app.common.loop_monitor import EventLoopLagMonitor
+from config.app_config import AppConfig
+
+T = TypeVar("T")
+
+SHUTDOWN_TIMEOUT = 10.0
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_thread: threading.Thread | None = None
+_loop_pid: int | None = None
+_monitor: EventLoopLagMonitor | None = None
+_lock = threading.Lock()
+_shutdown_hooks: List[Callable[[], Awaitable[None]]] = []
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+  # 워커 프로세스마다 하나의 이벤트 루프를 백그라운드 스레드에서 유지
+  global _loop, _loop_thread, _loop_pid, _monitor
+
+  with _lock:
+    if _loop is None or _loop_pid != os.getpid():
+      _loop = asyncio.new_event_loop()
+      _loop_thread = threading.Thread(target=_run_loop, args=(_loop,),
+                                      name="worker-event-loop", daemon=True)
+      _loop_thread.start()
+      _loop_pid = os.getpid()
+
+      if AppConfig.EVENT_LOOP_MONITOR_ENABLED:
+        _monitor = EventLoopLagMonitor(
+            _loop, _loop_thread,
+            interval=AppConfig.EVENT_LOOP_MONITOR_INTERVAL,
+            threshold=AppConfig.EVENT_LOOP_LAG_THRESHOLD)
+        _monitor.start()
+    return _loop
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+  asyncio.set_event_loop(loop)
+  loop.run_forever()
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+  return submit_async(coro).result()
+
+
+def submit_async(coro: Coroutine[Any, Any, T]) -> Future:
+  loop = get_event_loop()
+  if _is_running_in(loop):
+    coro.close()
+    raise RuntimeError("run_async는 워커 이벤트 루프 내부에서 호출할 수 없음")
+  return asyncio.run_coroutine_threadsafe(coro, loop)
+
+
+def _is_running_in(loop: asyncio.AbstractEventLoop) -> bool:
+  try:
+    return asyncio.get_running_loop() is loop
+  except RuntimeError:
+    return False
+
+
+def register_shutdown_hook(hook: Callable[[], Awaitable[None]]) -> None:
+  _shutdown_hooks.append(hook)
+
+
+def shutdown_event_loop() -> None:
+  global _loop, _loop_thread, _monitor
+
+  with _lock:
+    loop, thread = _loop, _loop_thread
+    if loop is None or _loop_pid != os.getpid():
+      return
+    _loop, _loop_thread = None, None
+    if _monitor is not None:
+      _monitor.stop()
+      _monitor = None
+
+  try:
+    asyncio.run_coroutine_threadsafe(_run_shutdown_hooks(), loop).result(
+        SHUTDOWN_TIMEOUT)
+  except Exception as e:
+    logging.warning(f"[shutdown_event_loop]: 종료 훅 실행 실패 {e}")
+
+  loop.call_soon_threadsafe(loop.stop)
+  thread.join(SHUTDOWN_TIMEOUT)
+  if not loop.is_running():
+    loop.close()
+
+
+async def _run_shutdown_hooks() -> None:
+  for hook in reversed(_shutdown_hooks):
+    try:
+      await hook()
+    except Exception as e:
+      logging.warning(f"[shutdown_event_loop]: {hook.__name__} 실패 {e}")
+
+
+atexit.register(shutdown_event_loop)
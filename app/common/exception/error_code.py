@@ -35,6 +35,7 @@ class ErrorCode(Enum):
   NO_TEXTS_EXTRACTED = (HTTPStatus.INTERNAL_SERVER_ERROR, "C016", "해당 파일에서 추출된 텍스트 없음")
   PDF_LOAD_FAILED = (HTTPStatus.INTERNAL_SERVER_ERROR, "C017", "PDF 로딩 실패")
   LLM_RESPONSE_TIMEOUT = (HTTPStatus.INTERNAL_SERVER_ERROR, "C018", "LLM 응답 시간 초과")
+  FILE_SIZE_EXCEEDED = (HTTPStatus.BAD_REQUEST, "C019", "허용된 최대 파일 크기 초과")
 
   # agreement 관련 에러
   AGREEMENT_REVIEW_FAIL = (HTTPStatus.INTERNAL_SERVER_ERROR, "A001", "AI 검토 보고서 생성 작업 중 에러 발생")
@@ -48,6 +49,7 @@ class ErrorCode(Enum):
   NOT_SUPPORTED_FORMAT = (HTTPStatus.BAD_REQUEST, "A009", "지원되지 않는 문서 형식")
   NAVER_OCR_REQUEST_FAIL = (HTTPStatus.INTERNAL_SERVER_ERROR, "A010", "네이버 OCR 요청 실패")
   NAVER_OCR_SETTING_LOAD_FAIL = (HTTPStatus.INTERNAL_SERVER_ERROR, "A011", "API_URL 또는 API_KEY 환경변수가 설정되지 않음")
+  OCR_PAGE_LIMIT_EXCEEDED = (HTTPStatus.BAD_REQUEST, "A012", "OCR 가능한 최대 페이지 수 초과")
 
   def __init__(self, status: HTTPStatus, code: str, message: str):
     self.status = status
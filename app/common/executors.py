@@ -0,0 +1,47 @@
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from app.common.event_loop import register_shutdown_hook
+from config.app_config import AppConfig
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_pid: Optional[int] = None
+_lock = threading.Lock()
+
+
+def get_cpu_executor() -> ThreadPoolExecutor:
+  # 이벤트 루프를 막는 CPU 작업(PDF 검색, 정규식 정리, 청킹)만 받는 크기 제한 풀
+  global _executor, _executor_pid
+
+  with _lock:
+    if _executor is None or _executor_pid != os.getpid():
+      _executor = ThreadPoolExecutor(
+          max_workers=AppConfig.CPU_EXECUTOR_WORKERS,
+          thread_name_prefix="cpu-bound")
+      _executor_pid = os.getpid()
+    return _executor
+
+
+async def run_cpu_bound(func: Callable[..., T], *args: Any,
+    **kwargs: Any) -> T:
+  loop = asyncio.get_running_loop()
+  return await loop.run_in_executor(get_cpu_executor(),
+                                    functools.partial(func, *args, **kwargs))
+
+
+async def close_cpu_executor() -> None:
+  global _executor
+
+  with _lock:
+    executor, _executor = _executor, None
+  if executor is not None and _executor_pid == os.getpid():
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+register_shutdown_hook(close_cpu_executor)
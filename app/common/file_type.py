@@ -6,4 +6,10 @@ class FileType(str, Enum):
   JPEG = "JPEG"
   JPG = "JPG"
   PNG = "PNG"
+  TIF = "TIF"
+  TIFF = "TIFF"
   TXT = "TXT"
+
+
+OCR_FILE_TYPES = (FileType.PNG, FileType.JPG, FileType.JPEG, FileType.TIF,
+                  FileType.TIFF)
@@ -0,0 +1,68 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import Future
+from typing import Optional
+
+from app.common import metrics
+
+STACK_LIMIT = 15
+
+
+class EventLoopLagMonitor:
+  # 하트비트 코루틴으로 루프 지연을 측정해 메트릭으로 내보내고,
+  # 감시 스레드가 지연 중인 루프 스레드의 스택을 기록해 어떤 콜백이 막고 있는지 남김
+  def __init__(self, loop: asyncio.AbstractEventLoop,
+      loop_thread: threading.Thread, interval: float, threshold: float):
+    self.loop = loop
+    self.loop_thread = loop_thread
+    self.interval = interval
+    self.threshold = threshold
+    self._last_beat = time.monotonic()
+    self._reported_beat: Optional[float] = None
+    self._stopped = threading.Event()
+    self._watchdog: Optional[threading.Thread] = None
+    self._heartbeat_future: Optional[Future] = None
+
+  def start(self) -> None:
+    self._heartbeat_future = asyncio.run_coroutine_threadsafe(
+        self._heartbeat(), self.loop)
+    self._watchdog = threading.Thread(target=self._watch,
+                                      name="event-loop-watchdog", daemon=True)
+    self._watchdog.start()
+
+  def stop(self) -> None:
+    self._stopped.set()
+    if self._heartbeat_future is not None:
+      self._heartbeat_future.cancel()
+
+  async def _heartbeat(self) -> None:
+    while not self._stopped.is_set():
+      started = time.monotonic()
+      self._last_beat = started
+      await asyncio.sleep(self.interval)
+
+      lag = time.monotonic() - started - self.interval
+      metrics.observe("event_loop.lag_seconds", lag)
+      if lag > self.threshold:
+        metrics.increment("event_loop.slow_callbacks")
+        logging.warning(f"[EventLoopLagMonitor]: 이벤트 루프 {lag:.3f}초 지연")
+
+  def _watch(self) -> None:
+    while not self._stopped.wait(self.interval):
+      beat = self._last_beat
+      stalled = time.monotonic() - beat - self.interval
+      if stalled <= self.threshold or self._reported_beat == beat:
+        continue
+
+      # 같은 지연은 한 번만 기록
+      self._reported_beat = beat
+      frame = sys._current_frames().get(self.loop_thread.ident)
+      if frame is None:
+        continue
+      stack = "".join(traceback.format_stack(frame, limit=STACK_LIMIT))
+      logging.warning(
+          f"[EventLoopLagMonitor]: 이벤트 루프가 {stalled:.3f}초 이상 막힘\n{stack}")
@@ -0,0 +1,32 @@
+import threading
+from collections import defaultdict
+from typing import Dict
+
+_lock = threading.Lock()
+_counters: Dict[str, float] = defaultdict(float)
+_observations: Dict[str, Dict[str, float]] = {}
+
+
+def increment(name: str, value: float = 1) -> None:
+  with _lock:
+    _counters[name] += value
+
+
+def observe(name: str, value: float) -> None:
+  with _lock:
+    stats = _observations.get(name)
+    if stats is None:
+      _observations[name] = {"count": 1, "sum": value, "max": value}
+      return
+    stats["count"] += 1
+    stats["sum"] += value
+    stats["max"] = max(stats["max"], value)
+
+
+def snapshot() -> dict:
+  with _lock:
+    return {
+      "counters": dict(_counters),
+      "observations": {name: dict(stats) for name, stats in
+                       _observations.items()}
+    }
@@ -0,0 +1,176 @@
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Optional
+
+from app.common import metrics
+
+SQLITE_TIMEOUT = 30.0
+
+
+def is_process_alive(pid: int) -> bool:
+  try:
+    os.kill(pid, 0)
+  except ProcessLookupError:
+    return False
+  except PermissionError:
+    return True
+  return True
+
+
+class SingleFlight:
+  # 같은 키의 작업이 동시에 들어오면 하나만 실행하고 나머지는 그 결과를 받음
+  # 워커 안에서는 Future 를 공유하고, 워커 간에는 SQLite 리스 행으로 리더를 정함
+  def __init__(self, path: str, lease_seconds: float, wait_seconds: float,
+      poll_interval: float):
+    self.path = path
+    self.lease_seconds = lease_seconds
+    self.wait_seconds = wait_seconds
+    self.poll_interval = poll_interval
+    self._flights: Dict[str, asyncio.Future] = {}
+    self._local = threading.local()
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with self._connection() as conn:
+      conn.execute(
+          "CREATE TABLE IF NOT EXISTS flights ("
+          "key TEXT PRIMARY KEY, owner_pid INTEGER NOT NULL, "
+          "expires_at REAL NOT NULL)")
+      conn.execute(
+          "CREATE TABLE IF NOT EXISTS results ("
+          "key TEXT PRIMARY KEY, value BLOB NOT NULL, completed_at REAL NOT NULL)")
+
+  def _connection(self) -> sqlite3.Connection:
+    conn = getattr(self._local, "conn", None)
+    if conn is None or getattr(self._local, "pid", None) != os.getpid():
+      conn = sqlite3.connect(self.path, timeout=SQLITE_TIMEOUT,
+                             isolation_level=None)
+      conn.execute("PRAGMA journal_mode=WAL")
+      conn.execute("PRAGMA synchronous=NORMAL")
+      self._local.conn = conn
+      self._local.pid = os.getpid()
+    return conn
+
+  async def run(self, key: str, func: Callable[[], Awaitable[bytes]]) -> bytes:
+    flight = self._flights.get(key)
+    if flight is not None:
+      metrics.increment("single_flight.joined")
+      return await asyncio.shield(flight)
+
+    flight = asyncio.get_running_loop().create_future()
+    self._flights[key] = flight
+    try:
+      value = await self._run_across_workers(key, func)
+    except BaseException as e:
+      flight.set_exception(e)
+      # 기다리는 요청이 없어도 미회수 예외 경고가 남지 않도록 표시
+      flight.exception()
+      raise
+    else:
+      flight.set_result(value)
+      return value
+    finally:
+      self._flights.pop(key, None)
+
+  async def _run_across_workers(self, key: str,
+      func: Callable[[], Awaitable[bytes]]) -> bytes:
+    started = time.time()
+    waited = False
+    while not await asyncio.to_thread(self._try_acquire, key):
+      if time.time() - started > self.wait_seconds:
+        # 리더가 너무 오래 걸리면 더 기다리지 않고 직접 실행
+        metrics.increment("single_flight.wait_timeout")
+        return await func()
+      waited = True
+      await asyncio.sleep(self.poll_interval)
+
+    try:
+      if waited:
+        # 다른 워커의 리더가 방금 끝낸 결과가 있으면 재사용, 리더가 실패했으면 직접 실행
+        value = await asyncio.to_thread(self._get_result, key, started)
+        if value is not None:
+          metrics.increment("single_flight.joined")
+          return value
+
+      # 실행 시간이 리스보다 길어져도 다른 워커가 리더를 빼앗아 중복 실행하지 않도록 리스를 주기적으로 연장
+      heartbeat = asyncio.create_task(self._keep_lease(key))
+      try:
+        value = await func()
+      finally:
+        heartbeat.cancel()
+      await asyncio.to_thread(self._set_result, key, value)
+      return value
+    finally:
+      await asyncio.to_thread(self._release, key)
+
+  async def _keep_lease(self, key: str) -> None:
+    while True:
+      await asyncio.sleep(self.lease_seconds / 3)
+      await asyncio.to_thread(self._renew, key)
+
+  def _try_acquire(self, key: str) -> bool:
+    now = time.time()
+    try:
+      conn = self._connection()
+      conn.execute("BEGIN IMMEDIATE")
+      try:
+        row = conn.execute(
+            "SELECT owner_pid, expires_at FROM flights WHERE key = ?",
+            (key,)).fetchone()
+        if row and row[1] > now and is_process_alive(row[0]):
+          conn.execute("ROLLBACK")
+          return False
+        conn.execute(
+            "INSERT OR REPLACE INTO flights (key, owner_pid, expires_at) "
+            "VALUES (?, ?, ?)", (key, os.getpid(), now + self.lease_seconds))
+        conn.execute("COMMIT")
+      except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    except sqlite3.Error as e:
+      # 조정에 실패해도 요청 자체는 처리되도록 워커 간 중복 제거만 포기
+      logging.warning(f"[SingleFlight]: 리스 획득 실패 {e}")
+    return True
+
+  def _renew(self, key: str) -> None:
+    try:
+      self._connection().execute(
+          "UPDATE flights SET expires_at = ? WHERE key = ? AND owner_pid = ?",
+          (time.time() + self.lease_seconds, key, os.getpid()))
+    except sqlite3.Error as e:
+      logging.warning(f"[SingleFlight]: 리스 연장 실패 {e}")
+
+  def _release(self, key: str) -> None:
+    try:
+      self._connection().execute(
+          "DELETE FROM flights WHERE key = ? AND owner_pid = ?",
+          (key, os.getpid()))
+    except sqlite3.Error as e:
+      logging.warning(f"[SingleFlight]: 리스 해제 실패 {e}")
+
+  def _get_result(self, key: str, since: float) -> Optional[bytes]:
+    # 기다리기 시작한 뒤에 끝난 실행의 결과만 인정해 이전 요청의 결과를 재사용하지 않음
+    try:
+      row = self._connection().execute(
+          "SELECT value FROM results WHERE key = ? AND completed_at >= ?",
+          (key, since)).fetchone()
+    except sqlite3.Error as e:
+      logging.warning(f"[SingleFlight]: 결과 조회 실패 {e}")
+      return None
+    return row[0] if row else None
+
+  def _set_result(self, key: str, value: bytes) -> None:
+    now = time.time()
+    try:
+      conn = self._connection()
+      conn.execute(
+          "INSERT OR REPLACE INTO results (key, value, completed_at) "
+          "VALUES (?, ?, ?)", (key, value, now))
+      # 결과는 대기 중인 요청에게만 필요하므로 최대 대기 시간이 지난 항목은 정리
+      conn.execute("DELETE FROM results WHERE completed_at < ?",
+                   (now - self.wait_seconds,))
+    except sqlite3.Error as e:
+      logging.warning(f"[SingleFlight]: 결과 저장 실패 {e}")
@@ -1,7 +1,9 @@
 from app.clients.openai_clients import embedding_deployment_name, prompt_deployment_name
+from app.services.common.embedding_cache import create_embedding_cache
 from app.services.common.embedding_service import EmbeddingService
 from app.services.common.prompt_service import PromptService
 
 
-embedding_service = EmbeddingService(embedding_deployment_name)
+embedding_service = EmbeddingService(embedding_deployment_name,
+                                     create_embedding_cache())
 prompt_service = PromptService(prompt_deployment_name)
@@ -1,5 +1,8 @@
 from dataclasses import dataclass
 
+import numpy as np
+from qdrant_client.http.models import SparseVector
+
 
 @dataclass
 class VectorPayload:
@@ -22,3 +25,13 @@ class VectorPayload:
 
   def embedding_input(self) -> str:
     return self.proof_text
+
+
+@dataclass
+class SparseEmbedding:
+  indices: np.ndarray
+  values: np.ndarray
+
+  def to_qdrant(self) -> SparseVector:
+    return SparseVector(indices=self.indices.tolist(),
+                        values=self.values.tolist())
@@ -1,3 +1,5 @@
+from typing import List, Optional
+
 from pydantic import BaseModel
 
 
@@ -5,3 +7,8 @@ class DocumentRequest(BaseModel):
   url: str
   categoryName: str
   id: int
+  # 여러 장으로 나뉜 계약서 이미지 (있으면 url 대신 순서대로 페이지로 사용)
+  urls: Optional[List[str]] = None
+
+  def page_urls(self) -> List[str]:
+    return self.urls or [self.url]
@@ -0,0 +1,110 @@
+import asyncio
+import dataclasses
+import json
+import logging
+import os
+import threading
+from typing import Optional, Tuple
+
+from app.clients.qdrant_client import get_qdrant_client
+from app.common import metrics
+from app.common.cache import SqliteCache
+from app.common.constants import EMBEDDING_MODEL, PROMPT_MODEL, PROMPT_VERSION
+from app.schemas.analysis_response import AnalysisResponse, ClauseData, \
+  RagResult
+from app.services.common.collection_version import get_collection_version
+from config.app_config import AppConfig
+
+# 저장 형식이 바뀌면 올려서 이전 결과를 무효화
+ANALYSIS_CACHE_VERSION = 1
+
+_cache: Optional["AnalysisCache"] = None
+_cache_lock = threading.Lock()
+
+
+def make_cache_key(document_hash: str, category_name: str,
+    collection_version: str) -> str:
+  # 같은 문서라도 기준 문서 집합이나 프롬프트·모델이 바뀌면 결과가 달라지므로 키에 포함
+  params = ":".join(str(value) for value in (
+    ANALYSIS_CACHE_VERSION, PROMPT_VERSION, PROMPT_MODEL, EMBEDDING_MODEL))
+  return (f"analysis:{params}:{category_name}:{collection_version}:"
+          f"{document_hash}")
+
+
+def encode_analysis_response(response: AnalysisResponse) -> bytes:
+  return json.dumps(dataclasses.asdict(response), ensure_ascii=False,
+                    separators=(",", ":")).encode("utf-8")
+
+
+def decode_analysis_response(value: bytes) -> AnalysisResponse:
+  data = json.loads(value)
+  return AnalysisResponse(
+      total_page=data["total_page"],
+      total_chunks=data["total_chunks"],
+      chunks=[
+        RagResult(**{**chunk, "clause_data": [
+          ClauseData(**clause) for clause in chunk["clause_data"]]})
+        for chunk in data["chunks"]
+      ])
+
+
+class AnalysisCache:
+  # 문서 내용 해시 기준으로 완성된 분석 응답을 워커 간에 공유
+  def __init__(self, path: str, max_bytes: int, ttl_seconds: float):
+    self.disk = SqliteCache(path, max_bytes, ttl_seconds=ttl_seconds)
+
+  def get(self, key: str) -> Optional[AnalysisResponse]:
+    value = self.disk.get(key)
+    if value is None:
+      metrics.increment("analysis_cache.miss")
+      return None
+
+    try:
+      response = decode_analysis_response(value)
+    except (ValueError, KeyError, TypeError) as e:
+      logging.warning(f"[AnalysisCache]: 캐시 항목 손상 {e}")
+      self.disk.delete(key)
+      metrics.increment("analysis_cache.miss")
+      return None
+    metrics.increment("analysis_cache.hit")
+    return response
+
+  def set(self, key: str, response: AnalysisResponse) -> None:
+    self.disk.set(key, encode_analysis_response(response))
+
+
+def get_analysis_cache() -> Optional[AnalysisCache]:
+  global _cache
+
+  if not AppConfig.ANALYSIS_CACHE_ENABLED:
+    return None
+  with _cache_lock:
+    if _cache is None:
+      _cache = AnalysisCache(
+          path=os.path.join(AppConfig.CACHE_DIR, "analysis.sqlite3"),
+          max_bytes=AppConfig.ANALYSIS_CACHE_DISK_BYTES,
+          ttl_seconds=AppConfig.ANALYSIS_CACHE_TTL_SECONDS)
+    return _cache
+
+
+async def find_cached_analysis(document_hash: str, category_name: str) -> \
+    Tuple[Optional[str], Optional[AnalysisResponse]]:
+  # 키는 분석 시작 시점의 컬렉션 버전으로 고정해, 분석 도중 기준 문서가 바뀌면 저장된 결과가 조회되지 않게 함
+  analysis_cache = get_analysis_cache()
+  if not analysis_cache:
+    return None, None
+
+  collection_version = await get_collection_version(get_qdrant_client(),
+                                                    category_name)
+  if collection_version is None:
+    return None, None
+
+  cache_key = make_cache_key(document_hash, category_name, collection_version)
+  return cache_key, await asyncio.to_thread(analysis_cache.get, cache_key)
+
+
+async def store_analysis(cache_key: Optional[str],
+    response: AnalysisResponse) -> None:
+  analysis_cache = get_analysis_cache()
+  if analysis_cache and cache_key:
+    await asyncio.to_thread(analysis_cache.set, cache_key, response)
@@ -0,0 +1,61 @@
+import hashlib
+import os
+import threading
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from app.common.single_flight import SingleFlight
+from app.schemas.analysis_response import AnalysisResponse, RagResult
+from app.schemas.document_request import DocumentRequest
+from app.services.agreement.analysis_cache import decode_analysis_response, \
+  encode_analysis_response
+from config.app_config import AppConfig
+
+AnalysisService = Callable[[DocumentRequest],
+                           Awaitable[Tuple[List[RagResult], int, int]]]
+
+_single_flight: Optional[SingleFlight] = None
+_single_flight_lock = threading.Lock()
+
+
+def get_single_flight() -> Optional[SingleFlight]:
+  global _single_flight
+
+  if not AppConfig.SINGLE_FLIGHT_ENABLED:
+    return None
+  with _single_flight_lock:
+    if _single_flight is None:
+      _single_flight = SingleFlight(
+          path=os.path.join(AppConfig.CACHE_DIR, "single_flight.sqlite3"),
+          lease_seconds=AppConfig.SINGLE_FLIGHT_LEASE_SECONDS,
+          wait_seconds=AppConfig.SINGLE_FLIGHT_WAIT_SECONDS,
+          poll_interval=AppConfig.SINGLE_FLIGHT_POLL_INTERVAL)
+    return _single_flight
+
+
+def make_flight_key(document_request: DocumentRequest) -> str:
+  # 프론트 재시도는 같은 url 목록과 카테고리로 들어오므로 이 둘을 기준으로 동일 요청을 판별
+  raw = "\n".join([document_request.categoryName,
+                   *document_request.page_urls()])
+  return "analysis:" + hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+async def analyze(service: AnalysisService,
+    document_request: DocumentRequest) -> AnalysisResponse:
+  chunks, total_chunks, total_page = await service(document_request)
+  return AnalysisResponse(total_page=total_page, chunks=chunks,
+                          total_chunks=total_chunks)
+
+
+async def run_analysis_once(service: AnalysisService,
+    document_request: DocumentRequest) -> AnalysisResponse:
+  single_flight = get_single_flight()
+  if not single_flight:
+    return await analyze(service, document_request)
+
+  async def analyze_encoded() -> bytes:
+    return encode_analysis_response(await analyze(service, document_request))
+
+  # 요청마다 별도 객체를 받도록 공유된 직렬화 결과를 각자 복원
+  value = await single_flight.run(make_flight_key(document_request),
+                                  analyze_encoded)
+  return decode_analysis_response(value)
@@ -0,0 +1,70 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import List, Optional
+
+from app.common import metrics
+from app.common.cache import SqliteCache
+from config.app_config import AppConfig
+
+# 전처리 방식이나 필드 형식이 바뀌면 올려서 이전 결과를 무효화
+OCR_CACHE_VERSION = 1
+
+_cache: Optional["OcrCache"] = None
+_cache_lock = threading.Lock()
+
+
+def preprocess_params() -> str:
+  # 같은 이미지라도 전처리 설정이 다르면 OCR 결과가 달라지므로 키에 포함
+  return ":".join(str(value) for value in (
+    OCR_CACHE_VERSION, AppConfig.OCR_TARGET_TEXT_HEIGHT,
+    AppConfig.OCR_TARGET_DPI, AppConfig.OCR_MAX_IMAGE_SIDE,
+    AppConfig.OCR_JPEG_QUALITY))
+
+
+def make_cache_key(image_data: bytes) -> str:
+  image_hash = hashlib.sha256(image_data).hexdigest()
+  return f"ocr:{preprocess_params()}:{image_hash}"
+
+
+class OcrCache:
+  # 이미지 내용 해시 기준으로 파싱된 OCR 필드(텍스트, 상대 좌표)를 워커 간에 공유
+  def __init__(self, path: str, max_bytes: int, ttl_seconds: float):
+    self.disk = SqliteCache(path, max_bytes, ttl_seconds=ttl_seconds)
+
+  def get(self, key: str) -> Optional[List[dict]]:
+    value = self.disk.get(key)
+    if value is None:
+      metrics.increment("ocr_cache.miss")
+      return None
+
+    try:
+      fields = json.loads(value)
+    except ValueError as e:
+      logging.warning(f"[OcrCache]: 캐시 항목 손상 {e}")
+      self.disk.delete(key)
+      metrics.increment("ocr_cache.miss")
+      return None
+    metrics.increment("ocr_cache.hit")
+    return fields
+
+  def set(self, key: str, fields: List[dict]) -> None:
+    value = json.dumps(fields, ensure_ascii=False,
+                       separators=(",", ":")).encode("utf-8")
+    self.disk.set(key, value)
+
+
+def get_ocr_cache() -> Optional[OcrCache]:
+  global _cache
+
+  if not AppConfig.OCR_CACHE_ENABLED:
+    return None
+  with _cache_lock:
+    if _cache is None:
+      _cache = OcrCache(
+          path=os.path.join(AppConfig.CACHE_DIR, "ocr.sqlite3"),
+          max_bytes=AppConfig.OCR_CACHE_DISK_BYTES,
+          ttl_seconds=AppConfig.OCR_CACHE_TTL_SECONDS)
+    return _cache
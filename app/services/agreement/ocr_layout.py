@@ -0,0 +1,78 @@
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+
+class OcrLayout:
+  # 이미지당 한 번 만들어 모든 조항의 위치 검색에 재사용하는 OCR 필드 색인
+  def __init__(self, fields: List[dict]):
+    self.fields = fields
+    self.full_text = " ".join(field['text'] for field in fields)
+    self.starts = [field['start_idx'] for field in fields]
+
+    self.centers: List[float] = []
+    self.heights: List[float] = []
+    boxes = np.empty((len(fields), 4), dtype=np.float64)
+    for i, field in enumerate(fields):
+      xs = [vertex['x'] for vertex in field['bounding_box']]
+      ys = [vertex['y'] for vertex in field['bounding_box']]
+      self.centers.append(sum(ys) / len(ys))
+      self.heights.append(max(ys) - min(ys))
+      boxes[i] = (min(xs), min(ys), max(xs), max(ys))
+    self.boxes = boxes
+
+  def find(self, text: str, base_start: int = 0) -> Tuple[int, int]:
+    start_idx = self.full_text.find(text, base_start)
+    end_idx = start_idx + len(text) if start_idx != -1 else -1
+    return start_idx, end_idx
+
+  def field_range(self, start_idx: int, end_idx: int) -> range:
+    # 시작 오프셋이 [start_idx, end_idx) 에 드는 필드 구간
+    return range(bisect_left(self.starts, start_idx),
+                 bisect_left(self.starts, end_idx))
+
+  def extract_bboxes(self, start_idx: int, end_idx: int) -> List[tuple]:
+    indices = self.field_range(start_idx, end_idx)
+    if not indices:
+      return []
+
+    # 첫 필드 높이의 절반 이내인 줄에 묶음. 줄 중심을 정렬해 두고 이웃 구간만 확인
+    epsilon = self.heights[indices[0]] * 0.5
+    groups: Dict[float, List[int]] = {}
+    group_order: Dict[float, int] = {}
+    sorted_centers: List[float] = []
+
+    for i in indices:
+      center_y = self.centers[i]
+      # 반올림 오차를 감안해 넓게 자른 뒤 기존과 같은 조건으로 거름
+      lo = bisect_left(sorted_centers, center_y - 2 * epsilon)
+      hi = bisect_right(sorted_centers, center_y + 2 * epsilon)
+      candidates = [c for c in sorted_centers[lo:hi]
+                    if c - epsilon < center_y < c + epsilon]
+
+      if candidates:
+        groups[min(candidates, key=group_order.get)].append(i)
+        continue
+      if center_y not in groups:
+        sorted_centers.insert(bisect_left(sorted_centers, center_y), center_y)
+        group_order[center_y] = len(group_order)
+      groups[center_y] = [i]
+
+    points_list = []
+    unique_relative_points = set()
+    for members in groups.values():
+      boxes = self.boxes[members]
+      min_x_group = float(boxes[:, 0].min())
+      min_y_group = float(boxes[:, 1].min())
+      max_x_group = float(boxes[:, 2].max())
+      max_y_group = float(boxes[:, 3].max())
+
+      points_tuple = (min_x_group * 100, min_y_group * 100,
+                      (max_x_group - min_x_group) * 100,
+                      (max_y_group - min_y_group) * 100)
+      if points_tuple not in unique_relative_points:
+        unique_relative_points.add(points_tuple)
+        points_list.append(points_tuple)
+
+    return points_list
@@ -0,0 +1,171 @@
+import io
+import logging
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+
+from app.common.exception.custom_exception import CommonException
+from app.common.exception.error_code import ErrorCode
+from config.app_config import AppConfig
+
+PDF_SIGNATURE = b"%PDF"
+TIFF_SIGNATURES = (b"II*\x00", b"MM\x00*")
+
+# 글자 높이 추정용 축소본의 긴 변 길이와, 추정을 믿기 위한 최소 글자 수
+TEXT_PROBE_SIDE = 1024
+MIN_TEXT_COMPONENTS = 20
+
+
+@dataclass
+class PreprocessedImage:
+  content: bytes
+  format: str
+  width: int
+  height: int
+  scale: float
+
+  @property
+  def mime_type(self) -> str:
+    return "image/png" if self.format == "png" else "image/jpeg"
+
+
+def split_image_pages(image_data: bytes) -> List[bytes]:
+  # 다중 프레임 TIFF 와 스캔 PDF 는 페이지별 이미지로 나누고, 그 외 이미지는 한 페이지로 취급
+  if image_data.startswith(PDF_SIGNATURE):
+    return render_scanned_pdf(image_data)
+  if image_data.startswith(TIFF_SIGNATURES):
+    return split_tiff_frames(image_data)
+  return [image_data]
+
+
+def render_scanned_pdf(pdf_data: bytes) -> List[bytes]:
+  import fitz
+
+  from app.services.common.pdf_service import fitz_lock, render_pdf_pages
+
+  try:
+    with fitz_lock:
+      doc = fitz.open(stream=pdf_data, filetype="pdf")
+  except Exception:
+    raise CommonException(ErrorCode.FILE_FORMAT_INVALID)
+  try:
+    check_page_count(doc.page_count)
+    return render_pdf_pages(doc, list(range(doc.page_count)),
+                            AppConfig.OCR_PDF_RENDER_DPI)
+  finally:
+    with fitz_lock:
+      doc.close()
+
+
+def split_tiff_frames(tiff_data: bytes) -> List[bytes]:
+  from PIL import Image, ImageSequence
+
+  try:
+    with Image.open(io.BytesIO(tiff_data)) as image:
+      frame_count = getattr(image, "n_frames", 1)
+      if frame_count == 1:
+        return [tiff_data]
+      check_page_count(frame_count)
+
+      # 프레임별로 무손실 PNG 로 옮겨 이후 전처리가 같은 경로를 타도록 함
+      pages = []
+      for frame in ImageSequence.Iterator(image):
+        buffer = io.BytesIO()
+        frame.convert("L").save(buffer, format="PNG", compress_level=1)
+        pages.append(buffer.getvalue())
+      return pages
+  except CommonException:
+    raise
+  except Exception:
+    raise CommonException(ErrorCode.FILE_FORMAT_INVALID)
+
+
+def check_page_count(page_count: int) -> None:
+  if page_count > AppConfig.OCR_MAX_PAGES:
+    raise CommonException(ErrorCode.OCR_PAGE_LIMIT_EXCEEDED)
+
+
+def preprocess_image(image_data: bytes) -> PreprocessedImage:
+  import cv2
+
+  image = cv2.imdecode(np.frombuffer(image_data, np.uint8),
+                       cv2.IMREAD_GRAYSCALE)
+  if image is None:
+    raise CommonException(ErrorCode.FILE_FORMAT_INVALID)
+
+  # 1. 해상도 조정: 글자 크기(없으면 DPI)로 목표 배율을 정하고, 확대는 하지 않음
+  height, width = image.shape[:2]
+  scale = choose_scale(image, read_dpi(image_data))
+  if scale < 1:
+    image = cv2.resize(image, (max(int(width * scale), 1),
+                               max(int(height * scale), 1)),
+                       interpolation=cv2.INTER_AREA)
+
+  # 2. 이진화 (OTSU : 자동으로 최적의 Thresholding)
+  _, binarized_img = cv2.threshold(image, 0, 255,
+                                   cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+
+  # 3. 1비트 PNG 와 품질을 맞춘 JPEG 중 더 작은 쪽을 전송
+  png = cv2.imencode('.png', binarized_img, [cv2.IMWRITE_PNG_BILEVEL, 1,
+                                             cv2.IMWRITE_PNG_COMPRESSION, 3])[1]
+  jpeg = cv2.imencode('.jpg', binarized_img,
+                      [cv2.IMWRITE_JPEG_QUALITY, AppConfig.OCR_JPEG_QUALITY])[1]
+  content, image_format = (png, "png") if png.nbytes <= jpeg.nbytes \
+    else (jpeg, "jpg")
+
+  image_height, image_width = binarized_img.shape[:2]
+  return PreprocessedImage(content=content.tobytes(), format=image_format,
+                           width=image_width, height=image_height, scale=scale)
+
+
+def choose_scale(image: np.ndarray, dpi: Optional[float]) -> float:
+  height, width = image.shape[:2]
+  scale = 1.0
+
+  text_height = estimate_text_height(image)
+  if text_height:
+    scale = AppConfig.OCR_TARGET_TEXT_HEIGHT / text_height
+  elif dpi:
+    scale = AppConfig.OCR_TARGET_DPI / dpi
+
+  scale = min(scale, AppConfig.OCR_MAX_IMAGE_SIDE / max(height, width), 1.0)
+  return scale
+
+
+def read_dpi(image_data: bytes) -> Optional[float]:
+  from PIL import Image
+
+  # 헤더만 읽어 DPI 를 확인 (휴대폰 사진은 72 등 의미 없는 값이 많아 글자 크기를 우선)
+  try:
+    with Image.open(io.BytesIO(image_data)) as image:
+      dpi = image.info.get("dpi")
+  except Exception as e:
+    logging.debug(f"[read_dpi]: DPI 확인 실패 {e}")
+    return None
+  if not dpi or not dpi[0]:
+    return None
+  return float(dpi[0])
+
+
+def estimate_text_height(image: np.ndarray) -> Optional[float]:
+  import cv2
+
+  # 축소본을 이진화해 연결 요소 높이의 중앙값을 원본 해상도 기준 글자 높이로 환산
+  height, width = image.shape[:2]
+  probe_scale = min(TEXT_PROBE_SIDE / max(height, width), 1.0)
+  probe = cv2.resize(image, (max(int(width * probe_scale), 1),
+                             max(int(height * probe_scale), 1)),
+                     interpolation=cv2.INTER_AREA) if probe_scale < 1 else image
+  _, inverted = cv2.threshold(probe, 0, 255,
+                              cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+
+  _, _, stats, _ = cv2.connectedComponentsWithStats(inverted, connectivity=8)
+  heights = stats[1:, cv2.CC_STAT_HEIGHT]
+  widths = stats[1:, cv2.CC_STAT_WIDTH]
+  # 잡음 점과 표 테두리·그림처럼 글자가 아닌 요소는 제외
+  glyphs = (heights >= 3) & (heights <= probe.shape[0] / 10) \
+           & (widths <= heights * 4)
+  if np.count_nonzero(glyphs) < MIN_TEXT_COMPONENTS:
+    return None
+  return float(np.median(heights[glyphs])) / probe_scale
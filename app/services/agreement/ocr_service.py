@@ -4,63 +4,151 @@ import logging
 import time
 import uuid
 from asyncio import Semaphore
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
-import cv2
-import numpy as np
-import requests
-from qdrant_client import AsyncQdrantClient
-from qdrant_client.http.models import SparseVector
+import fitz
+import httpx
+from openai import AsyncAzureOpenAI
 
 from app.blueprints.agreement.agreement_exception import AgreementException
-from app.clients.naver_clients import get_naver_ocr_client
+from app.clients.naver_clients import get_naver_ocr_client, \
+  get_ocr_http_client
 from app.clients.openai_clients import get_dense_embedding_async_client, \
   get_prompt_async_client
 from app.clients.qdrant_client import get_qdrant_client
+from app.common import metrics
 from app.common.chunk_status import ChunkProcessStatus, ChunkProcessResult
-from app.common.decorators import async_measure_time, measure_time
+from app.common.constants import CLAUSE_TEXT_SEPARATOR
+from app.common.decorators import async_measure_time
+from app.common.exception.custom_exception import CommonException
 from app.common.exception.error_code import ErrorCode
+from app.common.executors import run_cpu_bound
 from app.containers.service_container import embedding_service, prompt_service
 from app.schemas.analysis_response import RagResult
 from app.schemas.document_request import DocumentRequest
+from app.services.agreement.ocr_cache import get_ocr_cache, make_cache_key
+from app.services.agreement.ocr_layout import OcrLayout
+from app.services.agreement.ocr_preprocess import check_page_count, \
+  preprocess_image, split_image_pages
 from app.services.agreement.vectorize_similarity import \
-  prepare_embedding_inputs, search_qdrant, parse_incorrect_text, \
-  LLM_REQUIRED_KEYS, VIOLATION_THRESHOLD
+  prepare_embedding_inputs, search_qdrant_many, parse_incorrect_text, \
+  resolve_search_outcome, SearchOutcome, LLM_REQUIRED_KEYS, \
+  VIOLATION_THRESHOLD
 from app.services.common.keyword_searcher import \
   get_sparse_embedding_async_client
 from app.services.common.llm_retry import retry_llm_call
+from app.services.common.pdf_service import render_pdf_pages
 from app.services.common.qdrant_utils import ensure_qdrant_collection
+from config.app_config import AppConfig
 
 
-@measure_time
-def extract_ocr(image_url: str) -> Tuple[str, List[dict]]:
-  image_response = requests.get(image_url)
-  image_data = image_response.content
-
-  # 이미지 열기 (바이너리로 읽은 데이터를 사용)
-
-  image = cv2.imdecode(np.frombuffer(image_data, np.uint8), cv2.IMREAD_COLOR)
-
-  # 1. 해상도 가로 세로 1/2 => 총 1/4 조정
-  height, width = image.shape[:2]
-  resize_ratio = 1
-  resized_image = cv2.resize(image, (
-    int(width * resize_ratio), int(height * resize_ratio)),
-                             interpolation=cv2.INTER_LINEAR)
-
-  # 2. 그레이스케일 변환
-  gray = cv2.cvtColor(resized_image, cv2.COLOR_BGR2GRAY)
-
-  # 3. 이진화 (OTSU : 자동으로 최적의 Thresholding)
-  _, binarized_img = cv2.threshold(gray, 0, 255,
-                                   cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+@async_measure_time
+async def extract_ocr_pages(image_urls: List[str]) -> List[
+  Tuple[str, OcrLayout]]:
+  # 여러 이미지 URL, 다중 프레임 TIFF, 스캔 PDF 를 페이지 순서대로 펼쳐 동시에 OCR
+  check_page_count(len(image_urls))
+  client = get_ocr_http_client()
+  semaphore = Semaphore(AppConfig.OCR_CONCURRENCY)
+
+  downloads = await asyncio.gather(
+      *[download_image(client, url, semaphore) for url in image_urls])
+  page_groups = await asyncio.gather(
+      *[run_cpu_bound(split_image_pages, data) for data in downloads])
+  pages = [page for group in page_groups for page in group]
+  check_page_count(len(pages))
+
+  return await asyncio.gather(
+      *[extract_ocr(client, page, semaphore) for page in pages])
+
+
+async def extract_ocr_pdf_pages(doc: fitz.Document,
+    page_numbers: List[int]) -> Dict[int, Tuple[str, OcrLayout]]:
+  # 텍스트 레이어가 없는 PDF 페이지만 렌더링해 동시에 OCR (페이지 번호는 1부터)
+  # 텍스트 페이지까지 실패시키지 않도록 한도를 넘는 스캔 페이지는 OCR 없이 기존 텍스트 레이어를 유지
+  skipped = page_numbers[AppConfig.OCR_MAX_PAGES:]
+  if skipped:
+    logging.warning(f"[extract_ocr_pdf_pages]: OCR 최대 페이지 수 초과, "
+                    f"{len(skipped)}개 스캔 페이지 OCR 생략 {skipped}")
+    metrics.increment("ocr.pdf_scanned_pages_skipped", len(skipped))
+    page_numbers = page_numbers[:AppConfig.OCR_MAX_PAGES]
+  client = get_ocr_http_client()
+  semaphore = Semaphore(AppConfig.OCR_CONCURRENCY)
+
+  async def extract_page(page_num: int) -> Tuple[str, OcrLayout]:
+    images = await run_cpu_bound(render_pdf_pages, doc, [page_num - 1],
+                                 AppConfig.OCR_PDF_RENDER_DPI)
+    return await extract_ocr(client, images[0], semaphore)
+
+  results = await asyncio.gather(
+      *[extract_page(page_num) for page_num in page_numbers])
+  metrics.increment("ocr.pdf_scanned_pages", len(page_numbers))
+  return dict(zip(page_numbers, results))
+
+
+async def download_image(client: httpx.AsyncClient, image_url: str,
+    semaphore: Semaphore) -> bytes:
+  # 문서 다운로드와 같은 크기 제한을 적용해, 거대한 이미지 URL 이 본문 전체를 메모리에 올리기 전에 차단
+  content = bytearray()
+  start = time.perf_counter()
+  async with semaphore:
+    try:
+      async with client.stream("GET", image_url) as response:
+        if response.status_code != 200:
+          raise CommonException(ErrorCode.FILE_LOAD_FAILED)
+
+        content_length = int(response.headers.get("Content-Length") or 0)
+        if content_length > AppConfig.DOWNLOAD_MAX_BYTES:
+          raise CommonException(ErrorCode.FILE_SIZE_EXCEEDED)
+
+        async for chunk in response.aiter_bytes(
+            chunk_size=AppConfig.DOWNLOAD_CHUNK_BYTES):
+          content += chunk
+          if len(content) > AppConfig.DOWNLOAD_MAX_BYTES:
+            raise CommonException(ErrorCode.FILE_SIZE_EXCEEDED)
+    except httpx.HTTPError:
+      raise CommonException(ErrorCode.S3_CLIENT_ERROR)
+
+  elapsed = time.perf_counter() - start
+  metrics.observe("download.bytes", len(content))
+  metrics.observe("download.seconds", elapsed)
+  return bytes(content)
+
+
+async def extract_ocr(client: httpx.AsyncClient, image_data: bytes,
+    semaphore: Semaphore) -> Tuple[str, OcrLayout]:
+  # 같은 이미지를 다시 검토하면 OCR 호출 없이 캐시된 필드를 사용
+  ocr_cache = get_ocr_cache()
+  fields = None
+  if ocr_cache:
+    cache_key = make_cache_key(image_data)
+    fields = await asyncio.to_thread(ocr_cache.get, cache_key)
+
+  if fields is None:
+    async with semaphore:
+      fields = await request_ocr_fields(client, image_data)
+    # 빈 결과는 OCR 오류일 수 있으므로 저장하지 않음
+    if ocr_cache and fields:
+      await asyncio.to_thread(ocr_cache.set, cache_key, fields)
+
+  layout = OcrLayout(fields)
+  full_text = layout.full_text + " " if fields else ""
+  return full_text, layout
+
+
+async def request_ocr_fields(client: httpx.AsyncClient,
+    image_data: bytes) -> List[dict]:
+  # 해상도 조정·이진화·인코딩은 CPU 실행기에서 수행
+  preprocess_start = time.perf_counter()
+  image = await run_cpu_bound(preprocess_image, image_data)
+  metrics.observe("ocr.preprocess_seconds",
+                  time.perf_counter() - preprocess_start)
 
   # OCR 요청 JSON 생성
 
   request_json = {
     'images': [
       {
-        'format': 'jpg',
+        'format': image.format,
         'name': 'demo',  # 요청 이름
         # 'rotate': True
       }
@@ -71,27 +159,33 @@ def extract_ocr(image_url: str) -> Tuple[str, List[dict]]:
   }
 
   api_url, headers = get_naver_ocr_client()
-  payload = {'message': json.dumps(request_json).encode('UTF-8')}
+  payload = {'message': json.dumps(request_json)}
 
-  # 전송을 위한 인코딩
-  files = [
-    ('file', (
-      'photo1_binary_low.jpg', cv2.imencode('.jpg', binarized_img)[1].tobytes(),
-      'image/jpeg'))  # 이진화된 이미지를 바이너리로 전송
-  ]
+  # 전처리된 이미지를 바이너리로 전송
+  files = {
+    'file': (f'document.{image.format}', image.content, image.mime_type)
+  }
 
+  request_start = time.perf_counter()
   try:
-    response = requests.request("POST", api_url, headers=headers, data=payload,
-                                files=files)
-  except Exception:
+    response = await client.post(api_url, headers=headers, data=payload,
+                                 files=files)
+    response.raise_for_status()
+  except httpx.HTTPError:
     raise AgreementException(ErrorCode.NAVER_OCR_REQUEST_FAIL)
+  finally:
+    metrics.observe("ocr.request_seconds", time.perf_counter() - request_start)
 
-  ocr_results = json.loads(response.text)
+  metrics.increment("ocr.images")
+  metrics.increment(f"ocr.format.{image.format}")
+  metrics.observe("ocr.original_bytes", len(image_data))
+  metrics.observe("ocr.bytes_sent", len(image.content))
 
-  image_height, image_width = binarized_img.shape[:2]
+  ocr_results = response.json()
 
-  all_texts_with_bounding_boxes = []
-  full_text = ""
+  image_height, image_width = image.height, image.width
+
+  fields = []
   current_idx = 0
 
   # OCR 결과에서 텍스트와 바운딩 박스를 묶어서 리스트로 저장
@@ -113,31 +207,28 @@ def extract_ocr(image_url: str) -> Tuple[str, List[dict]]:
       end_idx = start_idx + len(text)
 
       # 텍스트 인덱스와 바운딩 박스를 함께 저장
-      all_texts_with_bounding_boxes.append({
+      fields.append({
         'text': text,
         'bounding_box': relative_bounding_box,
         'start_idx': start_idx,
         'end_idx': end_idx
       })
+      current_idx = end_idx + 1
 
-      # full_text와 current_idx 갱신
-      full_text += text + " "
-      current_idx = len(full_text)
-
-  return full_text, all_texts_with_bounding_boxes
+  return fields
 
 
 @async_measure_time
 async def vectorize_and_calculate_similarity_ocr(
     combined_chunks: List[RagResult], document_request: DocumentRequest,
-    all_texts_with_bounding_boxes: List[dict]) -> List[RagResult]:
+    ocr_layouts: Dict[int, OcrLayout]) -> List[RagResult]:
   qd_client = get_qdrant_client()
   await ensure_qdrant_collection(qd_client, document_request.categoryName)
 
   embedding_inputs = await prepare_embedding_inputs(combined_chunks)
 
-  async with get_dense_embedding_async_client() as dense_client, \
-      get_sparse_embedding_async_client() as sparse_client:
+  dense_client = get_dense_embedding_async_client()
+  async with get_sparse_embedding_async_client() as sparse_client:
     dense_task = embedding_service.batch_embed_texts(dense_client,
                                                      embedding_inputs)
     sparse_task = embedding_service.batch_embed_texts_sparse(sparse_client,
@@ -146,12 +237,14 @@ async def vectorize_and_calculate_similarity_ocr(
                                                          sparse_task)
 
   semaphore = Semaphore(5)
+  search_outcomes = await search_qdrant_many(
+      qd_client, semaphore, document_request.categoryName, dense_vectors,
+      sparse_vectors)
+
+  prompt_client = get_prompt_async_client()
   tasks = [
-    process_clause_ocr(qd_client, chunk, dense_vec, sparse_vec,
-                       document_request.categoryName,
-                       all_texts_with_bounding_boxes, semaphore)
-    for chunk, dense_vec, sparse_vec in
-    zip(combined_chunks, dense_vectors, sparse_vectors)
+    process_clause_ocr(prompt_client, chunk, search_outcome, ocr_layouts)
+    for chunk, search_outcome in zip(combined_chunks, search_outcomes)
   ]
   results = await asyncio.gather(*tasks)
 
@@ -165,24 +258,19 @@ async def vectorize_and_calculate_similarity_ocr(
   return success_results
 
 
-async def process_clause_ocr(qd_client: AsyncQdrantClient,
-    rag_result: RagResult,
-    dense_vec: List[float], sparse_vec: SparseVector, collection_name: str,
-    all_texts_with_bounding_boxes: List[dict],
-    semaphore: Semaphore) -> ChunkProcessResult:
-  search_results = await search_qdrant(semaphore, collection_name,
-                                       dense_vec, sparse_vec,
-                                       qd_client)
+async def process_clause_ocr(prompt_client: AsyncAzureOpenAI,
+    rag_result: RagResult, search_outcome: SearchOutcome,
+    ocr_layouts: Dict[int, OcrLayout]) -> ChunkProcessResult:
+  search_results = resolve_search_outcome(search_outcome)
 
   parse_incorrect_text(rag_result)
 
-  async with get_prompt_async_client() as prompt_client:
-    corrected_result = await retry_llm_call(
-        prompt_service.correct_contract,
-        prompt_client, rag_result.incorrect_text.replace("\n", " "),
-        search_results,
-        required_keys=LLM_REQUIRED_KEYS
-    )
+  corrected_result = await retry_llm_call(
+      prompt_service.correct_contract,
+      prompt_client, rag_result.incorrect_text.replace("\n", " "),
+      search_results,
+      required_keys=LLM_REQUIRED_KEYS
+  )
   if not corrected_result:
     return ChunkProcessResult(status=ChunkProcessStatus.FAILURE)
 
@@ -197,16 +285,22 @@ async def process_clause_ocr(qd_client: AsyncQdrantClient,
 
   incorrect_part = corrected_result["incorrectPart"]
 
-  all_positions, part_position = \
-    await find_text_positions_ocr(rag_result, incorrect_part,
-                                  all_texts_with_bounding_boxes)
+  positions_by_page = await run_cpu_bound(
+      find_text_positions_ocr, rag_result, incorrect_part, ocr_layouts)
 
   rag_result.accuracy = score
   rag_result.corrected_text = corrected_result["correctedText"]
   rag_result.proof_text = corrected_result["proofText"]
 
-  rag_result.clause_data[0].position.extend(all_positions)
-  rag_result.clause_data[0].position_part.extend(part_position)
+  # 페이지마다 해당 페이지의 첫 clause_data 에 위치를 저장
+  assigned_pages = set()
+  for clause in rag_result.clause_data:
+    if clause.page in assigned_pages or clause.page not in positions_by_page:
+      continue
+    assigned_pages.add(clause.page)
+    all_positions, part_positions = positions_by_page[clause.page]
+    clause.position.extend(all_positions)
+    clause.position_part.extend(part_positions)
 
   if any(not clause.position for clause in rag_result.clause_data):
     logging.warning(f"원문 일치 position값 불러오지 못함")
@@ -216,9 +310,9 @@ async def process_clause_ocr(qd_client: AsyncQdrantClient,
                             result=rag_result)
 
 
-async def find_text_positions_ocr(rag_result: RagResult, incorrect_part: str,
-    all_texts_with_bounding_boxes: List[dict]) -> tuple[
-  List[tuple], List[tuple]]:
+def find_text_positions_ocr(rag_result: RagResult, incorrect_part: str,
+    ocr_layouts: Dict[int, OcrLayout]) -> Dict[
+  int, Tuple[List[tuple], List[tuple]]]:
   # +를 기준으로 문장을 나누고 뒤에 있는 부분만 사용
   clause_content = rag_result.incorrect_text.split('+', 1)
   if len(clause_content) > 1:
@@ -229,91 +323,45 @@ async def find_text_positions_ocr(rag_result: RagResult, incorrect_part: str,
   if len(part_clause_content) > 1:
     incorrect_part = part_clause_content[1].strip()
 
-  all_positions, part_positions = extract_bbox_positions(
-      rag_result.incorrect_text,
-      incorrect_part,
-      all_texts_with_bounding_boxes)
+  clause_parts = [
+    part.strip() for part in
+    rag_result.incorrect_text.split(CLAUSE_TEXT_SEPARATOR) if part.strip()
+  ]
+
+  # 조항이 걸친 페이지마다 그 페이지의 OCR 좌표계에서 위치를 찾음
+  positions_by_page = {}
+  for page in dict.fromkeys(clause.page for clause in rag_result.clause_data):
+    ocr_layout = ocr_layouts.get(page)
+    if ocr_layout is None:
+      continue
 
-  return all_positions, part_positions
+    all_positions, part_positions = [], []
+    for clause_part in clause_parts:
+      found_all, found_part = extract_bbox_positions(
+          clause_part,
+          incorrect_part,
+          ocr_layout)
+      all_positions.extend(found_all)
+      part_positions.extend(
+          position for position in found_part
+          if position not in part_positions)
+    positions_by_page[page] = (all_positions, part_positions)
+
+  return positions_by_page
 
 
 def extract_bbox_positions(
     clause_content: str,
     incorrect_part: str,
-    all_texts_with_bounding_boxes: List[dict]
+    ocr_layout: OcrLayout
 ) -> tuple[List[tuple], List[tuple]]:
-  full_text = " ".join(item['text'] for item in all_texts_with_bounding_boxes)
-
-  def get_position_range(target_text: str, base_start: int = 0) -> tuple[
-    int, int]:
-    start_idx = full_text.find(target_text, base_start)
-    end_idx = start_idx + len(target_text) if start_idx != -1 else -1
-    return start_idx, end_idx
-
-  def extract_bboxes(start_idx: int, end_idx: int) -> List[tuple]:
-    epsilon = None
-
-    matched_items = [
-      item for item in all_texts_with_bounding_boxes
-      if start_idx <= item['start_idx'] < end_idx
-    ]
-
-    grouped_texts = {}
-    for item in matched_items:
-      bounding_box = item['bounding_box']
-      center_y = sum(vertex['y'] for vertex in bounding_box) / len(bounding_box)
-
-      if epsilon is None:
-        y_values = [vertex['y'] for vertex in bounding_box]
-        group_height = max(y_values) - min(y_values)
-        epsilon = group_height * 0.5
-
-      abs_center_y = center_y
-      group_found = False
-      for y_group in grouped_texts:
-        if y_group - epsilon < abs_center_y < y_group + epsilon:
-          grouped_texts[y_group].append(item)
-          group_found = True
-          break
-      if not group_found:
-        grouped_texts[abs_center_y] = [item]
-
-    points_list = []
-    unique_relative_points = set()
-    for y_group in grouped_texts:
-      min_x_group = float('inf')
-      min_y_group = float('inf')
-      max_x_group = float('-inf')
-      max_y_group = float('-inf')
-
-      for item in grouped_texts[y_group]:
-        for vertex in item['bounding_box']:
-          abs_x = vertex['x']
-          abs_y = vertex['y']
-          min_x_group = min(min_x_group, abs_x)
-          min_y_group = min(min_y_group, abs_y)
-          max_x_group = max(max_x_group, abs_x)
-          max_y_group = max(max_y_group, abs_y)
-
-      min_x = min_x_group * 100
-      min_y = min_y_group * 100
-      width = (max_x_group - min_x_group) * 100
-      height = (max_y_group - min_y_group) * 100
-
-      points_tuple = (min_x, min_y, width, height)
-      if points_tuple not in unique_relative_points:
-        unique_relative_points.add(points_tuple)
-        points_list.append(points_tuple)
-
-    return points_list
-
   # 전체 문장 기준
-  clause_start_idx, clause_end_idx = get_position_range(clause_content)
+  clause_start_idx, clause_end_idx = ocr_layout.find(clause_content)
   # 부분 문장은 전체 문장 안에서만 찾기
-  part_start_idx, part_end_idx = get_position_range(incorrect_part,
-                                                    clause_start_idx)
+  part_start_idx, part_end_idx = ocr_layout.find(incorrect_part,
+                                                 clause_start_idx)
 
-  all_positions = extract_bboxes(clause_start_idx, clause_end_idx)
-  part_positions = extract_bboxes(part_start_idx, part_end_idx)
+  all_positions = ocr_layout.extract_bboxes(clause_start_idx, clause_end_idx)
+  part_positions = ocr_layout.extract_bboxes(part_start_idx, part_end_idx)
 
   return all_positions, part_positions
@@ -0,0 +1,67 @@
+import dataclasses
+import hashlib
+import json
+import logging
+import threading
+from typing import List, Optional
+
+import numpy as np
+
+from app.common import metrics
+from app.common.cache import LRUCache
+from app.models.vector import SparseEmbedding
+from app.schemas.analysis_response import SearchResult
+from config.app_config import AppConfig
+
+_cache: Optional["RetrievalCache"] = None
+_cache_lock = threading.Lock()
+
+
+def make_retrieval_key(collection_name: str, collection_version: str,
+    search_params: str, dense_vec: np.ndarray,
+    sparse_vec: SparseEmbedding) -> str:
+  # 미세한 부동소수 차이로 키가 갈리지 않도록 float16 으로 양자화한 벡터를 해시
+  digest = hashlib.sha256()
+  digest.update(np.asarray(dense_vec, dtype=np.float16).tobytes())
+  digest.update(np.asarray(sparse_vec.indices, dtype=np.int32).tobytes())
+  digest.update(np.asarray(sparse_vec.values, dtype=np.float16).tobytes())
+  return (f"{collection_name}:{collection_version}:{search_params}:"
+          f"{digest.hexdigest()}")
+
+
+class RetrievalCache:
+  # 정형 조항은 계약서마다 같은 기준 문단을 찾으므로 검색 결과를 워커 메모리에 보관
+  def __init__(self, memory_bytes: int):
+    self.memory = LRUCache(memory_bytes)
+
+  def get(self, key: str) -> Optional[List[SearchResult]]:
+    value = self.memory.get(key)
+    if value is None:
+      metrics.increment("retrieval_cache.miss")
+      return None
+
+    try:
+      results = [SearchResult(**item) for item in json.loads(value)]
+    except (ValueError, TypeError) as e:
+      logging.warning(f"[RetrievalCache]: 캐시 항목 손상 {e}")
+      self.memory.delete(key)
+      metrics.increment("retrieval_cache.miss")
+      return None
+    metrics.increment("retrieval_cache.hit")
+    return results
+
+  def set(self, key: str, results: List[SearchResult]) -> None:
+    value = json.dumps([dataclasses.asdict(result) for result in results],
+                       ensure_ascii=False, separators=(",", ":"))
+    self.memory.set(key, value.encode("utf-8"))
+
+
+def get_retrieval_cache() -> Optional[RetrievalCache]:
+  global _cache
+
+  if not AppConfig.RETRIEVAL_CACHE_ENABLED:
+    return None
+  with _cache_lock:
+    if _cache is None:
+      _cache = RetrievalCache(AppConfig.RETRIEVAL_CACHE_MEMORY_BYTES)
+    return _cache
@@ -1,50 +1,68 @@
 import asyncio
 import logging
 from asyncio import Semaphore
-from typing import List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Union
 
 import fitz
+import numpy as np
+from openai import AsyncAzureOpenAI
 from qdrant_client import AsyncQdrantClient
 from qdrant_client.http.models import Prefetch
-from qdrant_client.models import FusionQuery, Fusion
-from qdrant_client.models import QueryResponse, SparseVector
+from qdrant_client.models import FusionQuery, Fusion, QueryRequest
+from qdrant_client.models import QueryResponse
 
 from app.blueprints.agreement.agreement_exception import AgreementException
 from app.clients.openai_clients import get_prompt_async_client, \
   get_dense_embedding_async_client
 from app.clients.qdrant_client import get_qdrant_client
+from app.common import metrics
 from app.common.chunk_status import ChunkProcessResult, ChunkProcessStatus
 from app.common.constants import ARTICLE_CLAUSE_SEPARATOR, \
   CLAUSE_TEXT_SEPARATOR, MAX_RETRIES
 from app.common.decorators import async_measure_time
+from app.common.executors import run_cpu_bound
 from app.common.exception.custom_exception import CommonException
 from app.common.exception.error_code import ErrorCode
 from app.containers.service_container import embedding_service, prompt_service
+from app.models.vector import SparseEmbedding
 from app.schemas.analysis_response import RagResult, SearchResult
 from app.schemas.document_request import DocumentRequest
+from app.services.agreement.ocr_layout import OcrLayout
+from app.services.agreement.retrieval_cache import get_retrieval_cache, \
+  make_retrieval_key
+from app.services.common.collection_version import get_collection_version
 from app.services.common.keyword_searcher import \
   get_sparse_embedding_async_client
 from app.services.common.llm_retry import retry_llm_call
+from app.services.common.pdf_text_index import PdfTextIndex
 from app.services.common.qdrant_utils import ensure_qdrant_collection
+from config.app_config import AppConfig
 
 SEARCH_COUNT = 3
+PREFETCH_LIMIT = 10
+# 검색 방식이나 개수가 바뀌면 캐시된 검색 결과와 섞이지 않도록 키에 포함
+SEARCH_PARAMS = f"rrf:{PREFETCH_LIMIT}:{SEARCH_COUNT}"
 VIOLATION_THRESHOLD = 0.85
 
 LLM_REQUIRED_KEYS = {"clause_content", "correctedText", "proofText",
                      "violation_score"}
 
+# 조항별 검색 결과, 또는 그 조항을 처리할 때 다시 던질 검색 예외
+SearchOutcome = Union[List[SearchResult], BaseException]
+
 
 @async_measure_time
 async def vectorize_and_calculate_similarity(
     combined_chunks: List[RagResult], document_request: DocumentRequest,
-    byte_type_pdf: fitz.Document) -> List[RagResult]:
+    byte_type_pdf: fitz.Document,
+    ocr_layouts: Dict[int, OcrLayout]) -> Tuple[List[RagResult], int]:
   qd_client = get_qdrant_client()
   await ensure_qdrant_collection(qd_client, document_request.categoryName)
 
   embedding_inputs = await prepare_embedding_inputs(combined_chunks)
 
-  async with get_dense_embedding_async_client() as dense_client, \
-      get_sparse_embedding_async_client() as sparse_client:
+  dense_client = get_dense_embedding_async_client()
+  async with get_sparse_embedding_async_client() as sparse_client:
     dense_task = embedding_service.batch_embed_texts(dense_client,
                                                      embedding_inputs)
     sparse_task = embedding_service.batch_embed_texts_sparse(sparse_client,
@@ -54,11 +72,16 @@ async def vectorize_and_calculate_similarity(
 
   # ✅ 세마포어 외부로 이동하여 task 재사용성 향상
   semaphore = Semaphore(5)
+  search_outcomes = await search_qdrant_many(
+      qd_client, semaphore, document_request.categoryName, dense_vectors,
+      sparse_vectors)
+
+  prompt_client = get_prompt_async_client()
+  text_index = PdfTextIndex(byte_type_pdf)
   tasks = [
-    process_clause(qd_client, chunk, dense_vec, sparse_vec,
-                   document_request.categoryName, byte_type_pdf, semaphore)
-    for chunk, dense_vec, sparse_vec in
-    zip(combined_chunks, dense_vectors, sparse_vectors)
+    process_clause(prompt_client, chunk, search_outcome, text_index,
+                   ocr_layouts)
+    for chunk, search_outcome in zip(combined_chunks, search_outcomes)
   ]
   results = await asyncio.gather(*tasks)
 
@@ -70,7 +93,8 @@ async def vectorize_and_calculate_similarity(
   if not success_results and failure_score == len(combined_chunks):
     raise AgreementException(ErrorCode.CHUNK_ANALYSIS_FAILED)
 
-  return success_results
+  # 일부 조항 분석이 실패한 결과는 캐시하지 않도록 실패 건수를 함께 반환
+  return success_results, failure_score
 
 
 async def prepare_embedding_inputs(chunks: List[RagResult]) -> List[str]:
@@ -83,22 +107,19 @@ async def prepare_embedding_inputs(chunks: List[RagResult]) -> List[str]:
   return inputs
 
 
-async def process_clause(qd_client: AsyncQdrantClient, rag_result: RagResult,
-    dense_vec: List[float], sparse_vec: SparseVector,
-    collection_name: str, byte_type_pdf: fitz.Document,
-    semaphore: Semaphore) -> ChunkProcessResult:
-  search_results = await search_qdrant(semaphore, collection_name, dense_vec,
-                                       sparse_vec,
-                                       qd_client)
+async def process_clause(prompt_client: AsyncAzureOpenAI,
+    rag_result: RagResult, search_outcome: SearchOutcome,
+    text_index: PdfTextIndex,
+    ocr_layouts: Dict[int, OcrLayout]) -> ChunkProcessResult:
+  search_results = resolve_search_outcome(search_outcome)
   parse_incorrect_text(rag_result)
 
-  async with get_prompt_async_client() as prompt_client:
-    corrected_result = await retry_llm_call(
-        prompt_service.correct_contract,
-        prompt_client, rag_result.incorrect_text.replace("\n", " "),
-        search_results,
-        required_keys=LLM_REQUIRED_KEYS
-    )
+  corrected_result = await retry_llm_call(
+      prompt_service.correct_contract,
+      prompt_client, rag_result.incorrect_text.replace("\n", " "),
+      search_results,
+      required_keys=LLM_REQUIRED_KEYS
+  )
   if not corrected_result:
     return ChunkProcessResult(status=ChunkProcessStatus.FAILURE)
 
@@ -113,8 +134,10 @@ async def process_clause(qd_client: AsyncQdrantClient, rag_result: RagResult,
 
   incorrect_part = corrected_result["incorrectPart"]
 
-  all_positions, part_position = \
-    await find_text_positions(rag_result, incorrect_part, byte_type_pdf)
+  # 위치 검색은 CPU 작업이므로 다른 조항의 I/O를 막지 않도록 실행기로 보냄
+  all_positions, part_position = await run_cpu_bound(
+      find_text_positions, rag_result, incorrect_part, text_index,
+      ocr_layouts)
 
   rag_result.accuracy = score
   positions = await extract_positions_by_page(all_positions)
@@ -147,30 +170,108 @@ def parse_incorrect_text(rag_result: RagResult) -> None:
   rag_result.incorrect_text = rag_result.incorrect_text.replace("\n", " ")
 
 
-async def search_qdrant(semaphore: Semaphore, collection_name: str,
-    dense_vec: List[float], sparse_vec: SparseVector,
-    qd_client: AsyncQdrantClient) -> List[SearchResult]:
-  search_results = await search_collection(qd_client, semaphore,
-                                           collection_name, dense_vec,
-                                           sparse_vec)
-  return gather_search_results(search_results)
+def build_search_request(dense_vec: np.ndarray,
+    sparse_vec: SparseEmbedding) -> QueryRequest:
+  return QueryRequest(
+      prefetch=[
+        Prefetch(query=sparse_vec.to_qdrant(), using="sparse",
+                 limit=PREFETCH_LIMIT),
+        Prefetch(query=dense_vec.tolist(), using="dense",
+                 limit=PREFETCH_LIMIT),
+      ],
+      query=FusionQuery(fusion=Fusion.RRF),
+      limit=SEARCH_COUNT,
+      with_payload=True
+  )
+
+
+async def search_qdrant_many(qd_client: AsyncQdrantClient,
+    semaphore: Semaphore, collection_name: str,
+    dense_vectors: List[np.ndarray],
+    sparse_vectors: List[SparseEmbedding]) -> List[SearchOutcome]:
+  keys = await make_retrieval_keys(qd_client, collection_name, dense_vectors,
+                                   sparse_vectors)
+  retrieval_cache = get_retrieval_cache()
+  outcomes: List[Optional[SearchOutcome]] = [
+    retrieval_cache.get(key) if retrieval_cache and key else None
+    for key in keys
+  ]
+  missing = [i for i, outcome in enumerate(outcomes) if outcome is None]
+  if not missing:
+    return outcomes
+
+  # 조항마다 왕복하지 않고 배치 질의 API 로 여러 조항의 하이브리드 검색을 한 번에 요청
+  requests = [build_search_request(dense_vectors[i], sparse_vectors[i])
+              for i in missing]
+  batch_size = max(AppConfig.QDRANT_SEARCH_BATCH_SIZE, 1)
+  batches = await asyncio.gather(*[
+    search_batch(qd_client, semaphore, collection_name,
+                 requests[start:start + batch_size])
+    for start in range(0, len(requests), batch_size)
+  ])
+
+  fetched = [outcome for batch in batches for outcome in batch]
+  for i, outcome in zip(missing, fetched):
+    outcomes[i] = outcome
+    if retrieval_cache and keys[i] and not isinstance(outcome, BaseException):
+      retrieval_cache.set(keys[i], outcome)
+  return outcomes
+
+
+async def make_retrieval_keys(qd_client: AsyncQdrantClient,
+    collection_name: str,
+    dense_vectors: List[np.ndarray],
+    sparse_vectors: List[SparseEmbedding]) -> List[Optional[str]]:
+  # 컬렉션 버전이 키에 들어가므로 기준 문서가 적재·삭제되면 이전 검색 결과는 더 이상 조회되지 않음
+  if not get_retrieval_cache():
+    return [None] * len(dense_vectors)
+
+  collection_version = await get_collection_version(qd_client,
+                                                    collection_name)
+  if collection_version is None:
+    return [None] * len(dense_vectors)
+  return [
+    make_retrieval_key(collection_name, collection_version, SEARCH_PARAMS,
+                       dense_vec, sparse_vec)
+    for dense_vec, sparse_vec in zip(dense_vectors, sparse_vectors)
+  ]
+
+
+async def search_batch(qd_client: AsyncQdrantClient, semaphore: Semaphore,
+    collection_name: str, requests: List[QueryRequest]) -> List[SearchOutcome]:
+  try:
+    async with semaphore:
+      responses = await qd_client.query_batch_points(
+          collection_name=collection_name, requests=requests)
+  except Exception as e:
+    # 한 질의 때문에 배치 전체가 실패해도 나머지 조항은 영향받지 않도록 개별 검색으로 전환
+    logging.warning(f"[search_batch]: 배치 검색 실패, 개별 검색으로 전환 {e}")
+    metrics.increment("qdrant.search_batch_fallback")
+    return list(await asyncio.gather(*[
+      search_collection(qd_client, semaphore, collection_name, request)
+      for request in requests
+    ], return_exceptions=True))
+
+  metrics.observe("qdrant.search_batch_size", len(requests))
+  return [
+    gather_search_results(response) if response.points
+    else AgreementException(ErrorCode.NO_POINTS_FOUND)
+    for response in responses
+  ]
 
 
 async def search_collection(qd_client: AsyncQdrantClient,
     semaphore: Semaphore, collection_name: str,
-    dense_vec: List[float], sparse_vec: SparseVector) -> QueryResponse:
+    request: QueryRequest) -> List[SearchResult]:
   for attempt in range(1, MAX_RETRIES + 1):
     try:
       async with semaphore:
         search_results = await qd_client.query_points(
             collection_name=collection_name,
-            prefetch=[
-              Prefetch(query=sparse_vec, using="sparse", limit=10),
-              Prefetch(query=dense_vec, using="dense", limit=10),
-            ],
-            query=FusionQuery(fusion=Fusion.RRF),
-            limit=SEARCH_COUNT,
-            with_payload=True
+            prefetch=request.prefetch,
+            query=request.query,
+            limit=request.limit,
+            with_payload=request.with_payload
         )
         break
 
@@ -184,7 +285,14 @@ async def search_collection(qd_client: AsyncQdrantClient,
   if search_results is None or not search_results.points:
     raise AgreementException(ErrorCode.NO_POINTS_FOUND)
 
-  return search_results
+  return gather_search_results(search_results)
+
+
+def resolve_search_outcome(outcome: SearchOutcome) -> List[SearchResult]:
+  # 검색 실패는 기존과 같이 해당 조항을 처리할 때 예외로 드러냄
+  if isinstance(outcome, BaseException):
+    raise outcome
+  return outcome
 
 
 def gather_search_results(search_results: QueryResponse) -> List[SearchResult]:
@@ -232,21 +340,29 @@ def set_result_data(corrected_result: Optional[
     rag_result.clause_data[1].position_part = part_positions[1]
 
 
-def search_text_in_pdf(text: str, pdf_doc: fitz.Document, clause_data,
+def search_text_in_pdf(text: str, text_index: PdfTextIndex, clause_data,
+    ocr_layouts: Dict[int, OcrLayout],
     is_relative=True) -> dict[int, List[dict]]:
   positions_by_page = {}
-  # 페이지별 검색
+  # 페이지별 검색 (문서 색인에서 문자열 위치로 조회)
   for clause_part in clause_data:
     page_num = clause_part.page
-    page = pdf_doc.load_page(page_num - 1)
-
-    page_width = float(page.rect.width)
-    page_height = float(page.rect.height)
-
     page_positions = []
 
-    # 바로 검색
-    text_instances = page.search_for(text.strip())
+    # OCR 로 읽은 스캔 페이지는 렌더링 이미지 기준 상대 좌표(페이지와 같은 비율)를 그대로 사용
+    ocr_layout = ocr_layouts.get(page_num)
+    if ocr_layout is not None:
+      start_idx, end_idx = ocr_layout.find(text)
+      page_positions = [{"page": page_num, "bbox": bbox} for bbox in
+                        ocr_layout.extract_bboxes(start_idx, end_idx)]
+      if page_positions:
+        positions_by_page[page_num] = page_positions
+      continue
+
+    page_index = text_index.page(page_num)
+    page_width = page_index.width
+    page_height = page_index.height
+    text_instances = page_index.search(text)
     grouped_positions = {}
 
     for inst in text_instances:
@@ -294,8 +410,9 @@ def search_text_in_pdf(text: str, pdf_doc: fitz.Document, clause_data,
   return positions_by_page
 
 
-async def find_text_positions(rag_result: RagResult, incorrect_part: str,
-    pdf_document: fitz.Document) -> dict[str, dict[int, List[dict]]]:
+def find_text_positions(rag_result: RagResult, incorrect_part: str,
+    text_index: PdfTextIndex,
+    ocr_layouts: Dict[int, OcrLayout]) -> dict[str, dict[int, List[dict]]]:
   # incorrect_text 처리 (all_positions 용)
   clause_content_parts = rag_result.incorrect_text.split('+', 1)
   if len(clause_content_parts) > 1:
@@ -310,16 +427,16 @@ async def find_text_positions(rag_result: RagResult, incorrect_part: str,
     part = part.strip()
     if part == "":
       continue
-    partial_result = search_text_in_pdf(part, pdf_document,
-                                        rag_result.clause_data)
+    partial_result = search_text_in_pdf(part, text_index,
+                                        rag_result.clause_data, ocr_layouts)
     for page, boxes in partial_result.items():
       if page not in all_positions:
         all_positions[page] = []
       all_positions[page].extend(boxes)
 
   # incorrect_part는 그대로 검색
-  part_position = search_text_in_pdf(incorrect_part, pdf_document,
-                                     rag_result.clause_data)
+  part_position = search_text_in_pdf(incorrect_part, text_index,
+                                     rag_result.clause_data, ocr_layouts)
   for page, boxes in part_position.items():
     if page not in part_positions:
       part_positions[page] = []
@@ -2,73 +2,112 @@ import re
 from typing import List
 from typing import Optional, Tuple
 
-import matplotlib.pyplot as plt
-import nltk
 import numpy as np
-import tiktoken
-from langchain_text_splitters import RecursiveCharacterTextSplitter
-from nltk import find
-from sklearn.manifold import TSNE
 
 from app.blueprints.agreement.agreement_exception import AgreementException
 from app.blueprints.standard.standard_exception import StandardException
-from app.clients.openai_clients import get_embedding_sync_client
+from app.clients.openai_clients import get_dense_embedding_async_client, \
+  get_embedding_sync_client
 from app.common.constants import ARTICLE_CHUNK_PATTERN, \
   ARTICLE_CLAUSE_SEPARATOR, CLAUSE_HEADER_PATTERN, NUMBER_HEADER_PATTERN
 from app.common.exception.custom_exception import CommonException
+from app.common.executors import run_cpu_bound
 from app.common.exception.error_code import ErrorCode
 from app.containers.service_container import embedding_service
 from app.schemas.chunk_schema import ClauseChunk, DocumentChunk
 from app.schemas.chunk_schema import Document
+from app.services.common import token_counter
+from app.services.common.sentence_splitter import get_segmenter
 
 MIN_CLAUSE_BODY_LENGTH = 20
+CHUNK_TOKENIZER_MODEL = "gpt-4o-mini"
 
 
 def semantic_chunk(extracted_text: str, similarity_threshold: float = 0.9,
     max_tokens: int = 250, visualize: bool = False) -> List[ClauseChunk]:
+  sentences = split_chunkable_sentences(extracted_text)
+
+  embeddings = embedding_service.batch_sync_embed_texts(
+      get_embedding_sync_client(), sentences)
+
+  chunks = assemble_semantic_chunks(sentences, embeddings,
+                                    similarity_threshold, max_tokens)
+
+  if visualize:
+    try:
+      visualize_embeddings_3d(embeddings, sentences, chunks)
+    except Exception as e:
+      print(f"[시각화 오류] {e}")
+
+  if not chunks:
+    raise CommonException(ErrorCode.CHUNKING_FAIL)
+  return chunks
+
+
+async def semantic_chunk_many(texts: List[str],
+    similarity_threshold: float = 0.9, max_tokens: int = 250) -> \
+    List[List[ClauseChunk]]:
+  # 모든 텍스트의 문장을 먼저 나눈 뒤 한 번에 동시 임베딩하고, 청크 조립은 입력 순서대로 수행
+  sentence_groups = await run_cpu_bound(
+      lambda: [split_chunkable_sentences(text) for text in texts])
+
+  all_sentences = [s for sentences in sentence_groups for s in sentences]
+  embeddings = await embedding_service.batch_embed_texts(
+      get_dense_embedding_async_client(), all_sentences)
+
+  def assemble_all() -> List[List[ClauseChunk]]:
+    results = []
+    offset = 0
+    for sentences in sentence_groups:
+      group_embeddings = embeddings[offset:offset + len(sentences)]
+      offset += len(sentences)
+      chunks = assemble_semantic_chunks(sentences, group_embeddings,
+                                        similarity_threshold, max_tokens)
+      if not chunks:
+        raise CommonException(ErrorCode.CHUNKING_FAIL)
+      results.append(chunks)
+    return results
+
+  return await run_cpu_bound(assemble_all)
+
+
+def split_chunkable_sentences(extracted_text: str) -> List[str]:
   sentences = split_into_sentences(extracted_text)
   sentences = [s for s in sentences if len(s.strip()) > MIN_CLAUSE_BODY_LENGTH]
   if not sentences:
     raise StandardException(ErrorCode.CHUNKING_FAIL)
+  return sentences
+
 
-  with get_embedding_sync_client() as embedding_client:
-      embeddings = embedding_service.batch_sync_embed_texts(embedding_client, sentences)
+def assemble_semantic_chunks(sentences: List[str], embeddings: np.ndarray,
+    similarity_threshold: float, max_tokens: int) -> List[ClauseChunk]:
+  # 문장별 토큰 수는 한 번만 계산하고 청크 토큰 수는 누적 합으로 관리
+  similarities = adjacent_similarities(embeddings)
+  token_counts = token_counter.count_tokens_batch(sentences,
+                                                  CHUNK_TOKENIZER_MODEL)
 
   chunks = []
-  current_chunk = [sentences[0]]
-  prev_embedding = embeddings[0]
+  chunk_start = 0
+  chunk_tokens = token_counts[0]
 
   for i in range(1, len(sentences)):
-    similarity = cosine(prev_embedding, embeddings[i])
-    tentative_chunk = current_chunk + [sentences[i]]
-    token_len = count_tokens(" ".join(tentative_chunk))
+    chunk_tokens += token_counts[i]
 
-    if similarity < similarity_threshold or token_len > max_tokens:
-      chunk_text = " ".join(current_chunk)
+    if similarities[i - 1] < similarity_threshold or chunk_tokens > max_tokens:
+      chunk_text = " ".join(sentences[chunk_start:i])
       chunks.append(ClauseChunk(clause_content=chunk_text))
-      current_chunk = [sentences[i]]
-    else:
-      current_chunk.append(sentences[i])
+      chunk_start = i
+      chunk_tokens = token_counts[i]
 
-    prev_embedding = embeddings[i]
-
-  append_chunk_if_valid(chunks, current_chunk)
-
-  if visualize:
-    try:
-      visualize_embeddings_3d(embeddings, sentences, chunks)
-    except Exception as e:
-      print(f"[시각화 오류] {e}")
-
-  if not chunks:
-    raise CommonException(ErrorCode.CHUNKING_FAIL)
+  append_chunk_if_valid(chunks, sentences[chunk_start:])
   return chunks
 
 
-def cosine(a: List[float], b: List[float]) -> float:
-  a = np.array(a).flatten()
-  b = np.array(b).flatten()
-  return np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
+def adjacent_similarities(embeddings: np.ndarray) -> np.ndarray:
+  # i번째 값은 i번째 문장과 i+1번째 문장의 코사인 유사도
+  norms = np.linalg.norm(embeddings, axis=1)
+  dots = np.einsum("ij,ij->i", embeddings[:-1], embeddings[1:])
+  return dots / (norms[:-1] * norms[1:])
 
 
 def append_chunk_if_valid(chunks: List[ClauseChunk], current_chunk: List[str]):
@@ -77,8 +116,12 @@ def append_chunk_if_valid(chunks: List[ClauseChunk], current_chunk: List[str]):
     chunks.append(ClauseChunk(clause_content=chunk_text))
 
 
-def visualize_embeddings_3d(embeddings: List[List[float]], sentences: List[str],
+def visualize_embeddings_3d(embeddings: np.ndarray, sentences: List[str],
     chunks: List[ClauseChunk]):
+  # 디버그용 시각화 의존성은 워커 기동 시간을 늘리지 않도록 호출 시점에 로드
+  import matplotlib.pyplot as plt
+  from sklearn.manifold import TSNE
+
   for idx, chunk in enumerate(chunks):
     print(f"[청크 {idx}] 길이: {len(chunk.clause_content)} / 토큰 수: {count_tokens(chunk.clause_content)}")
 
@@ -86,7 +129,7 @@ def visualize_embeddings_3d(embeddings: List[List[float]], sentences: List[str],
   plt.rcParams['axes.unicode_minus'] = False
 
   tsne = TSNE(n_components=3, random_state=0, perplexity=5)
-  reduced = tsne.fit_transform(np.array(embeddings))
+  reduced = tsne.fit_transform(embeddings)
 
   fig = plt.figure(figsize=(10, 8))
   ax = fig.add_subplot(111, projection='3d')
@@ -100,21 +143,12 @@ def visualize_embeddings_3d(embeddings: List[List[float]], sentences: List[str],
   plt.savefig("semantic_embedding_result")
 
 
-def ensure_punkt():
-  try:
-    find('tokenizers/punkt')
-  except LookupError:
-    nltk.download('punkt')
-
-
-def split_into_sentences(extracted_text: str):
-  ensure_punkt()
-  return nltk.sent_tokenize(extracted_text)
+def split_into_sentences(extracted_text: str) -> List[str]:
+  return get_segmenter().split(extracted_text)
 
 
 def count_tokens(text: str) -> int:
-  encoding = tiktoken.encoding_for_model("gpt-4o-mini")
-  return len(encoding.encode(text))
+  return token_counter.count_tokens(text, CHUNK_TOKENIZER_MODEL)
 
 
 def split_text_by_pattern(text: str, pattern: str) -> List[str]:
@@ -123,17 +157,23 @@ def split_text_by_pattern(text: str, pattern: str) -> List[str]:
 
 def chunk_legal_terms(extracted_text: str) -> List[ClauseChunk]:
   chunks = []
+  for title, body in split_legal_terms(extracted_text):
+    clauses = semantic_chunk(body, max_tokens=150, similarity_threshold=0.3)
+    for clause in clauses:
+      clause.clause_number = title
+    chunks.extend(clauses)
+  return chunks
+
+
+def split_legal_terms(extracted_text: str) -> List[Tuple[str, str]]:
+  terms = []
   blocks = re.split(r'○\s\n*', extracted_text)
   for block in blocks:
     parts = block.split('\n', 1)
     if len(parts) == 2 and parts[1]:
       title, body = parts[0], parts[1]
-      title = title.split('(', 1)[0]
-      clauses = semantic_chunk(body, max_tokens=150, similarity_threshold=0.3)
-      for clause in clauses:
-        clause.clause_number = title
-      chunks.extend(clauses)
-  return chunks
+      terms.append((title.split('(', 1)[0], body))
+  return terms
 
 
 def chunk_by_article_and_clause_with_page(documents: List[Document],
@@ -330,6 +370,8 @@ def get_clause_pattern(clause_number: str) -> Optional[str]:
 
 
 def chunk_by_paragraph(documents: List[Document]) -> List[DocumentChunk]:
+  from langchain_text_splitters import RecursiveCharacterTextSplitter
+
   chunks = []
   text_splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
       chunk_size=300,
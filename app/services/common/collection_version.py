@@ -0,0 +1,74 @@
+import logging
+import uuid
+from typing import Optional
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import PointStruct
+
+# 컬렉션별 내용 버전을 보관하는 벡터 없는 Qdrant 컬렉션
+# 버전이 Qdrant 에 있으므로 어느 호스트에서 적재·삭제해도 모든 호스트의 캐시가 함께 무효화됨
+VERSION_COLLECTION = "collection_versions"
+INITIAL_VERSION = "0"
+
+# 매 조회마다 존재 확인 왕복을 하지 않도록 확인 결과를 프로세스 안에서 기억
+_version_collection_ready = False
+
+
+def version_point_id(collection_name: str) -> str:
+  return str(uuid.uuid5(uuid.NAMESPACE_URL, collection_name))
+
+
+async def ensure_version_collection(qd_client: AsyncQdrantClient) -> None:
+  global _version_collection_ready
+
+  if _version_collection_ready:
+    return
+  if await qd_client.collection_exists(collection_name=VERSION_COLLECTION):
+    _version_collection_ready = True
+    return
+  try:
+    await qd_client.create_collection(collection_name=VERSION_COLLECTION,
+                                      vectors_config={})
+  except Exception:
+    # 다른 워커가 먼저 만든 경우는 정상
+    if not await qd_client.collection_exists(
+        collection_name=VERSION_COLLECTION):
+      raise
+  _version_collection_ready = True
+
+
+async def get_collection_version(qd_client: AsyncQdrantClient,
+    collection_name: str) -> Optional[str]:
+  # 조회 실패 시 None 을 돌려 호출 측이 캐시를 건너뛰도록 함
+  global _version_collection_ready
+
+  try:
+    await ensure_version_collection(qd_client)
+    points = await qd_client.retrieve(
+        collection_name=VERSION_COLLECTION,
+        ids=[version_point_id(collection_name)], with_payload=True)
+  except Exception as e:
+    logging.warning(f"[get_collection_version]: 버전 조회 실패 {e}")
+    _version_collection_ready = False
+    return None
+  if not points:
+    return INITIAL_VERSION
+  return points[0].payload.get("version", INITIAL_VERSION)
+
+
+async def bump_collection_version(qd_client: AsyncQdrantClient,
+    collection_name: str) -> None:
+  # 기준 문서가 적재·삭제될 때마다 새 토큰으로 바꿔 이 컬렉션을 참조한 캐시 결과를 무효화
+  # 증가 대신 무작위 토큰을 써서 동시 갱신에도 읽기-수정-쓰기 경합이 없음
+  global _version_collection_ready
+
+  try:
+    await ensure_version_collection(qd_client)
+    await qd_client.upsert(
+        collection_name=VERSION_COLLECTION,
+        points=[PointStruct(id=version_point_id(collection_name), vector={},
+                            payload={"collection": collection_name,
+                                     "version": uuid.uuid4().hex})])
+  except Exception as e:
+    logging.warning(f"[bump_collection_version]: 버전 갱신 실패 {e}")
+    _version_collection_ready = False
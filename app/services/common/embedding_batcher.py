@@ -0,0 +1,23 @@
+from typing import List
+
+from app.services.common.token_counter import count_tokens_batch
+
+
+def pack_batches(inputs: List[str], max_size: int,
+    max_tokens: int) -> List[List[int]]:
+  # 입력 순서를 유지하면서 요청당 입력 개수와 토큰 한도를 넘지 않도록 묶음
+  batches: List[List[int]] = []
+  current: List[int] = []
+  current_tokens = 0
+
+  for i, tokens in enumerate(count_tokens_batch(inputs)):
+    if current and (len(current) >= max_size
+                    or current_tokens + tokens > max_tokens):
+      batches.append(current)
+      current, current_tokens = [], 0
+    current.append(i)
+    current_tokens += tokens
+
+  if current:
+    batches.append(current)
+  return batches
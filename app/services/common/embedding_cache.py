@@ -0,0 +1,116 @@
+import hashlib
+import os
+import re
+import unicodedata
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from app.common import metrics
+from app.common.cache import LRUCache, SqliteCache
+from app.models.vector import SparseEmbedding
+from config.app_config import AppConfig
+
+
+def normalize_text(text: str) -> str:
+  return re.sub(r'\s+', ' ', unicodedata.normalize("NFC", text)).strip()
+
+
+def make_cache_key(model: str, dimension: int, text: str) -> str:
+  text_hash = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+  return f"{model}:{dimension}:{text_hash}"
+
+
+class EmbeddingCache:
+  def __init__(self, memory_bytes: int, disk_path: Optional[str],
+      disk_bytes: int):
+    self.memory = LRUCache(memory_bytes)
+    self.disk = SqliteCache(disk_path, disk_bytes) if disk_path else None
+
+  # memory/disk 로 계층을 골라, 이벤트 루프에서는 메모리만 보고 SQLite 는 스레드에서 처리할 수 있게 함
+  def get_dense(self, model: str, dimension: int, texts: List[str],
+      memory: bool = True, disk: bool = True) -> List[Optional[np.ndarray]]:
+    keys = [make_cache_key(model, dimension, text) for text in texts]
+    return [
+      None if value is None else np.frombuffer(value, dtype=np.float32)
+      for value in self._get_many("dense", keys, memory, disk)
+    ]
+
+  def set_dense(self, model: str, dimension: int, texts: List[str],
+      vectors: np.ndarray, memory: bool = True, disk: bool = True) -> None:
+    self._set_many({
+      make_cache_key(model, dimension, text): vector.tobytes()
+      for text, vector in zip(texts, vectors)
+    }, memory, disk)
+
+  def get_sparse(self, model: str, texts: List[str], memory: bool = True,
+      disk: bool = True) -> List[Optional[SparseEmbedding]]:
+    keys = [make_cache_key(model, 0, text) for text in texts]
+    return [
+      None if value is None else unpack_sparse(value)
+      for value in self._get_many("sparse", keys, memory, disk)
+    ]
+
+  def set_sparse(self, model: str, texts: List[str],
+      vectors: List[SparseEmbedding], memory: bool = True,
+      disk: bool = True) -> None:
+    self._set_many({
+      make_cache_key(model, 0, text): pack_sparse(vector)
+      for text, vector in zip(texts, vectors)
+    }, memory, disk)
+
+  def _get_many(self, kind: str, keys: List[str], memory: bool = True,
+      disk: bool = True) -> List[Optional[bytes]]:
+    values: List[Optional[bytes]] = [None] * len(keys)
+    if memory:
+      values = [self.memory.get(key) for key in keys]
+      metrics.increment(f"embedding_cache.{kind}.memory_hit",
+                        sum(v is not None for v in values))
+
+    missing = [key for key, value in zip(keys, values) if value is None]
+    if disk and missing and self.disk:
+      found: Dict[str, bytes] = self.disk.get_many(set(missing))
+      for i, key in enumerate(keys):
+        if values[i] is None and key in found:
+          values[i] = found[key]
+          self.memory.set(key, found[key])
+      metrics.increment(f"embedding_cache.{kind}.disk_hit", len(found))
+
+    # 메모리만 본 단계에서 디스크 조회가 남아 있으면 미스는 디스크 단계에서 집계
+    if disk or not self.disk:
+      metrics.increment(f"embedding_cache.{kind}.miss",
+                        sum(v is None for v in values))
+    return values
+
+  def _set_many(self, entries: Dict[str, bytes], memory: bool = True,
+      disk: bool = True) -> None:
+    if memory:
+      for key, value in entries.items():
+        self.memory.set(key, value)
+    if disk and self.disk:
+      self.disk.set_many(entries)
+
+
+def pack_sparse(vector: SparseEmbedding) -> bytes:
+  indices = np.asarray(vector.indices, dtype=np.int32)
+  values = np.asarray(vector.values, dtype=np.float32)
+  return np.int32(len(indices)).tobytes() + indices.tobytes() + values.tobytes()
+
+
+def unpack_sparse(data: bytes) -> SparseEmbedding:
+  count = int(np.frombuffer(data, dtype=np.int32, count=1)[0])
+  indices = np.frombuffer(data, dtype=np.int32, count=count, offset=4)
+  values = np.frombuffer(data, dtype=np.float32, count=count,
+                         offset=4 + 4 * count)
+  return SparseEmbedding(indices=indices, values=values)
+
+
+def create_embedding_cache() -> Optional[EmbeddingCache]:
+  if not AppConfig.EMBEDDING_CACHE_ENABLED:
+    return None
+  return EmbeddingCache(
+      memory_bytes=AppConfig.EMBEDDING_CACHE_MEMORY_BYTES,
+      disk_path=os.path.join(AppConfig.CACHE_DIR, "embeddings.sqlite3")
+      if AppConfig.EMBEDDING_CACHE_DISK_BYTES else None,
+      disk_bytes=AppConfig.EMBEDDING_CACHE_DISK_BYTES
+  )
@@ -1,83 +1,226 @@
 import asyncio
-from typing import List
+import base64
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
 import numpy as np
 from openai import AsyncAzureOpenAI, AzureOpenAI
-from qdrant_client.http.models import SparseVector
+from openai.types import Embedding
 
+from app.common.constants import EMBEDDING_DIMENSION, MAX_RETRIES
 from app.common.decorators import async_measure_time
+from app.common.executors import run_cpu_bound
 from app.common.exception.custom_exception import CommonException
 from app.common.exception.error_code import ErrorCode
+from app.models.vector import SparseEmbedding
+from app.services.common.embedding_batcher import pack_batches
+from app.services.common.embedding_cache import EmbeddingCache
 from app.services.common.keyword_searcher import FastEmbedSparseWrapper
-
-MAX_BATCH_SIZE = 32
+from config.app_config import AppConfig
 
 
 class EmbeddingService:
-  def __init__(self, deployment_name):
+  def __init__(self, deployment_name, cache: Optional[EmbeddingCache] = None):
     self.deployment_name = deployment_name
+    self.cache = cache
 
   @async_measure_time
   async def batch_embed_texts(self, embedding_client: AsyncAzureOpenAI,
-      inputs: List[str]) -> List[List[float]]:
+      inputs: List[str]) -> np.ndarray:
+    embeddings, missing = await self._lookup_dense_async(inputs)
+    semaphore = asyncio.Semaphore(AppConfig.EMBEDDING_CONCURRENCY)
 
-    all_embeddings = []
-    for i in range(0, len(inputs), MAX_BATCH_SIZE):
-      batch = inputs[i:i + MAX_BATCH_SIZE]
-      try:
-        embeddings = await self.embed_texts(embedding_client, batch)
-        all_embeddings.extend(embeddings)
-      except Exception:
-        raise CommonException(ErrorCode.EMBEDDING_FAILED)
-    return all_embeddings
+    async def embed_batch(rows: List[int]) -> None:
+      async with semaphore:
+        embeddings[rows] = await self._embed_with_retry(
+            embedding_client, [inputs[i] for i in rows])
+
+    await asyncio.gather(
+        *[embed_batch(rows) for rows in self._pack_batches(inputs, missing)])
+
+    await self._store_dense_async(inputs, embeddings, missing)
+    return embeddings
 
   @async_measure_time
   async def batch_embed_texts_sparse(self, wrapper: FastEmbedSparseWrapper,
-      inputs: list[str]) -> List[SparseVector]:
-    loop = asyncio.get_event_loop()
-    sparse_embeddings = await loop.run_in_executor(None, wrapper.embed, inputs)
-
-    return [
-      SparseVector(indices=se.indices.tolist(), values=se.values.tolist())
-      for se in sparse_embeddings
-    ]
+      inputs: list[str]) -> List[SparseEmbedding]:
+    cached: List[Optional[SparseEmbedding]] = [None] * len(inputs)
+    if self.cache:
+      cached = self.cache.get_sparse(wrapper.model_name, inputs, disk=False)
+      missing = [i for i, vector in enumerate(cached) if vector is None]
+      if missing and self.cache.disk:
+        found = await asyncio.to_thread(
+            self.cache.get_sparse, wrapper.model_name,
+            [inputs[i] for i in missing], memory=False)
+        for i, vector in zip(missing, found):
+          cached[i] = vector
+    missing = [i for i, vector in enumerate(cached) if vector is None]
+    missing_inputs = [inputs[i] for i in missing]
+
+    if missing_inputs:
+      sparse_embeddings = await run_cpu_bound(wrapper.embed, missing_inputs)
+      new_vectors = [
+        SparseEmbedding(indices=se.indices, values=se.values)
+        for se in sparse_embeddings
+      ]
+      if self.cache:
+        self.cache.set_sparse(wrapper.model_name, missing_inputs, new_vectors,
+                              disk=False)
+        if self.cache.disk:
+          await asyncio.to_thread(self.cache.set_sparse, wrapper.model_name,
+                                  missing_inputs, new_vectors, memory=False)
+      for i, vector in zip(missing, new_vectors):
+        cached[i] = vector
+
+    return cached
 
   async def embed_texts(self, embedding_client: AsyncAzureOpenAI,
-      sentences: List[str]) -> List[List[float]]:
+      sentences: List[str]) -> np.ndarray:
+    # base64 응답을 그대로 float32 행렬로 복원해 float 리스트 파싱을 생략
     response = await embedding_client.embeddings.create(
         input=sentences,
         model=self.deployment_name,
-        encoding_format="float"
+        encoding_format="base64"
     )
 
     if not response or not response.data or not response.data[0].embedding:
       raise CommonException(ErrorCode.EMBEDDING_FAILED)
 
-    return [np.array(d.embedding, dtype=np.float32).tolist() for d in
-            response.data]
+    return decode_embeddings(response.data, len(sentences))
 
   def batch_sync_embed_texts(self, embedding_client: AzureOpenAI,
-      inputs: List[str]) -> List[List[float]]:
-    all_embeddings = []
-    for i in range(0, len(inputs), MAX_BATCH_SIZE):
-      batch = inputs[i:i + MAX_BATCH_SIZE]
-      try:
-        embeddings = self.get_embeddings(embedding_client, batch)
-        all_embeddings.extend(embeddings)
-      except Exception:
-        raise CommonException(ErrorCode.EMBEDDING_FAILED)
-    return all_embeddings
+      inputs: List[str]) -> np.ndarray:
+    embeddings, missing = self._lookup_dense(inputs)
+
+    def embed_batch(rows: List[int]) -> None:
+      embeddings[rows] = self._sync_embed_with_retry(
+          embedding_client, [inputs[i] for i in rows])
+
+    with ThreadPoolExecutor(
+        max_workers=AppConfig.EMBEDDING_CONCURRENCY) as executor:
+      list(executor.map(embed_batch, self._pack_batches(inputs, missing)))
+
+    self._store_dense(inputs, embeddings, missing)
+    return embeddings
 
   def get_embeddings(self, embedding_client: AzureOpenAI,
-      sentences: List[str]) -> List[List[float]]:
+      sentences: List[str]) -> np.ndarray:
     response = embedding_client.embeddings.create(
         input=sentences,
         model=self.deployment_name,
-        encoding_format="float"
+        encoding_format="base64"
     )
 
     if not response or not response.data or not response.data[0].embedding:
       raise CommonException(ErrorCode.EMBEDDING_FAILED)
 
-    return [np.array(d.embedding, dtype=np.float32).tolist() for d in
-            response.data]
+    return decode_embeddings(response.data, len(sentences))
+
+  async def _embed_with_retry(self, embedding_client: AsyncAzureOpenAI,
+      batch: List[str]) -> np.ndarray:
+    # 실패한 배치만 재시도
+    for attempt in range(1, MAX_RETRIES + 1):
+      try:
+        return await self.embed_texts(embedding_client, batch)
+      except Exception as e:
+        if attempt == MAX_RETRIES:
+          raise CommonException(ErrorCode.EMBEDDING_FAILED)
+        logging.warning(
+            f"[EmbeddingService]: 임베딩 재요청 발생 {attempt}/{MAX_RETRIES} {e}")
+        await asyncio.sleep(0.5 * attempt)
+
+  def _sync_embed_with_retry(self, embedding_client: AzureOpenAI,
+      batch: List[str]) -> np.ndarray:
+    for attempt in range(1, MAX_RETRIES + 1):
+      try:
+        return self.get_embeddings(embedding_client, batch)
+      except Exception as e:
+        if attempt == MAX_RETRIES:
+          raise CommonException(ErrorCode.EMBEDDING_FAILED)
+        logging.warning(
+            f"[EmbeddingService]: 임베딩 재요청 발생 {attempt}/{MAX_RETRIES} {e}")
+        time.sleep(0.5 * attempt)
+
+  @staticmethod
+  def _pack_batches(inputs: List[str], rows: List[int]) -> List[List[int]]:
+    # 캐시에 없는 행만 묶어서 결과 행렬의 행 번호 목록으로 반환
+    return [
+      [rows[i] for i in batch]
+      for batch in pack_batches([inputs[i] for i in rows],
+                                AppConfig.EMBEDDING_MAX_BATCH_SIZE,
+                                AppConfig.EMBEDDING_MAX_BATCH_TOKENS)
+    ]
+
+  def _lookup_dense(self, inputs: List[str]) -> Tuple[np.ndarray, List[int]]:
+    embeddings = np.empty((len(inputs), EMBEDDING_DIMENSION), dtype=np.float32)
+    if not self.cache:
+      return embeddings, list(range(len(inputs)))
+
+    missing = []
+    cached = self.cache.get_dense(self.deployment_name, EMBEDDING_DIMENSION,
+                                  inputs)
+    for i, vector in enumerate(cached):
+      if vector is None:
+        missing.append(i)
+      else:
+        embeddings[i] = vector
+    return embeddings, missing
+
+  def _store_dense(self, inputs: List[str], embeddings: np.ndarray,
+      rows: List[int]) -> None:
+    if self.cache and rows:
+      self.cache.set_dense(self.deployment_name, EMBEDDING_DIMENSION,
+                           [inputs[i] for i in rows], embeddings[rows])
+
+  # 비동기 경로: 워커 루프에서는 메모리 LRU 만 보고, 다른 워커의 쓰기 잠금을 기다릴 수 있는 SQLite 는 스레드로 넘김
+  async def _lookup_dense_async(self, inputs: List[str]) -> Tuple[
+    np.ndarray, List[int]]:
+    embeddings = np.empty((len(inputs), EMBEDDING_DIMENSION), dtype=np.float32)
+    if not self.cache:
+      return embeddings, list(range(len(inputs)))
+
+    cached = self.cache.get_dense(self.deployment_name, EMBEDDING_DIMENSION,
+                                  inputs, disk=False)
+    missing = [i for i, vector in enumerate(cached) if vector is None]
+    if missing and self.cache.disk:
+      found = await asyncio.to_thread(
+          self.cache.get_dense, self.deployment_name, EMBEDDING_DIMENSION,
+          [inputs[i] for i in missing], memory=False)
+      for i, vector in zip(missing, found):
+        cached[i] = vector
+
+    missing = []
+    for i, vector in enumerate(cached):
+      if vector is None:
+        missing.append(i)
+      else:
+        embeddings[i] = vector
+    return embeddings, missing
+
+  async def _store_dense_async(self, inputs: List[str], embeddings: np.ndarray,
+      rows: List[int]) -> None:
+    if not self.cache or not rows:
+      return
+    texts = [inputs[i] for i in rows]
+    vectors = embeddings[rows]
+    self.cache.set_dense(self.deployment_name, EMBEDDING_DIMENSION, texts,
+                         vectors, disk=False)
+    if self.cache.disk:
+      await asyncio.to_thread(self.cache.set_dense, self.deployment_name,
+                              EMBEDDING_DIMENSION, texts, vectors,
+                              memory=False)
+
+
+def decode_embeddings(data: List[Embedding], count: int) -> np.ndarray:
+  # 응답이 모자라거나 index 가 어긋나면 채워지지 않은 행이 그대로 반환·캐시되므로 거부
+  if len(data) != count or \
+      sorted(d.index for d in data) != list(range(count)):
+    raise CommonException(ErrorCode.EMBEDDING_FAILED)
+
+  embeddings = np.empty((count, EMBEDDING_DIMENSION), dtype=np.float32)
+  for d in data:
+    embeddings[d.index] = np.frombuffer(base64.b64decode(d.embedding),
+                                        dtype=np.float32)
+  return embeddings
@@ -1,56 +1,120 @@
 import asyncio
 import re
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
-from app.common.constants import CLAUSE_TEXT_SEPARATOR, ARTICLE_CHUNK_PATTERN, \
-  NUMBER_HEADER_PATTERN
+import fitz
+
+from app.common.constants import CLAUSE_TEXT_SEPARATOR
 from app.common.exception.custom_exception import CommonException
+from app.common.executors import run_cpu_bound
 from app.common.exception.error_code import ErrorCode
 from app.common.file_type import FileType
-from app.schemas.analysis_response import RagResult, ClauseData
+from app.schemas.analysis_response import AnalysisResponse, RagResult, \
+  ClauseData
 from app.schemas.chunk_schema import ClauseChunk
 from app.schemas.chunk_schema import Document
 from app.schemas.chunk_schema import DocumentChunk, DocumentMetadata
 from app.schemas.document_request import DocumentRequest
-from app.services.agreement.ocr_service import extract_ocr, \
-  vectorize_and_calculate_similarity_ocr
+from app.services.agreement.analysis_cache import find_cached_analysis, \
+  store_analysis
+from app.services.agreement.ocr_layout import OcrLayout
+from app.services.agreement.ocr_service import extract_ocr_pages, \
+  extract_ocr_pdf_pages, vectorize_and_calculate_similarity_ocr
 from app.services.agreement.vectorize_similarity import \
   vectorize_and_calculate_similarity
-from app.services.common.chunking_service import \
-  chunk_by_article_and_clause_with_page, semantic_chunk, chunk_legal_terms, \
-  chunk_by_paragraph
+from app.services.common.chunking_service import chunk_by_paragraph, \
+  semantic_chunk_many, split_legal_terms
 from app.services.common.pdf_service import preprocess_pdf
+from app.services.common.s3_service import DownloadedFile, s3_download
+from app.services.common.structure_parser import detect_structure, \
+  parse_structured_documents
+from app.services.standard.vector_store.vector_processor import \
+  vectorize_and_save
 
 
-def ocr_service(document_request: DocumentRequest):
-  full_text, all_texts_with_bounding_boxes = extract_ocr(document_request.url)
+# 동기 단계는 워커 이벤트 루프를 막지 않도록 다운로드·파싱은 스레드로, 청킹은 CPU 실행기로 넘김
+async def ocr_service(document_request: DocumentRequest) -> Tuple[
+  List[RagResult], int, int]:
+  pages = await extract_ocr_pages(document_request.page_urls())
 
   documents: List[Document] = [
-    Document(page_content=full_text, metadata=DocumentMetadata(page=1))]
-
-  document_chunks = chunk_agreement_documents(documents)
+    Document(page_content=full_text, metadata=DocumentMetadata(page=page))
+    for page, (full_text, _) in enumerate(pages, start=1)
+    if full_text.strip()
+  ]
+  if not documents:
+    raise CommonException(ErrorCode.NO_TEXTS_EXTRACTED)
+  ocr_layouts = {page: layout for page, (_, layout) in
+                 enumerate(pages, start=1)}
+
+  document_chunks = await run_cpu_bound(chunk_agreement_documents, documents)
   combined_chunks = combine_chunks_by_clause_number(document_chunks)
 
   # 입력값이 다르기에 함수가 분리되어야 함
-  chunks = asyncio.run(
-      vectorize_and_calculate_similarity_ocr(combined_chunks, document_request,
-                                             all_texts_with_bounding_boxes))
+  chunks = await vectorize_and_calculate_similarity_ocr(
+      combined_chunks, document_request, ocr_layouts)
+
+  return chunks, len(combined_chunks), len(pages)
 
-  return chunks, len(combined_chunks), len(documents)
 
+async def load_pdf_documents(downloaded: DownloadedFile) -> Tuple[
+  List[Document], fitz.Document, Dict[int, OcrLayout]]:
+  documents, fitz_document, scanned_pages = await asyncio.to_thread(
+      preprocess_pdf, downloaded)
 
-def pdf_agreement_service(document_request: DocumentRequest) -> Tuple[
+  # 스캔 페이지만 OCR 해 같은 Document 목록에 페이지 순서대로 병합
+  ocr_layouts: Dict[int, OcrLayout] = {}
+  if scanned_pages:
+    ocr_pages = await extract_ocr_pdf_pages(fitz_document, scanned_pages)
+    documents = [document for document in documents
+                 if document.metadata.page not in ocr_pages]
+    for page, (full_text, layout) in ocr_pages.items():
+      ocr_layouts[page] = layout
+      if full_text.strip():
+        documents.append(Document(page_content=full_text.strip(),
+                                  metadata=DocumentMetadata(page=page)))
+    documents.sort(key=lambda document: document.metadata.page)
+
+  if not documents:
+    raise CommonException(ErrorCode.NO_TEXTS_EXTRACTED)
+  return documents, fitz_document, ocr_layouts
+
+
+async def pdf_agreement_service(document_request: DocumentRequest) -> Tuple[
   List[RagResult], int, int]:
-  documents, fitz_document = preprocess_pdf(document_request)
-  document_chunks = chunk_agreement_documents(documents)
+  downloaded = await asyncio.to_thread(s3_download, document_request.url)
+
+  # 같은 문서·카테고리·기준 문서 버전·프롬프트 조합은 저장된 분석 결과를 그대로 반환
+  cache_key, cached = await find_cached_analysis(downloaded.sha256,
+                                                 document_request.categoryName)
+  if cached:
+    downloaded.file.close()
+    return cached.chunks, cached.total_chunks, cached.total_page
+
+  documents, fitz_document, ocr_layouts = await load_pdf_documents(downloaded)
+  document_chunks = await run_cpu_bound(chunk_agreement_documents, documents)
   combined_chunks = combine_chunks_by_clause_number(document_chunks)
-  chunks = asyncio.run(
-      vectorize_and_calculate_similarity(combined_chunks, document_request,
-                                         fitz_document))
+  chunks, failures = await vectorize_and_calculate_similarity(
+      combined_chunks, document_request, fitz_document, ocr_layouts)
 
+  if not failures:
+    await store_analysis(cache_key, AnalysisResponse(
+        total_page=len(documents), chunks=chunks,
+        total_chunks=len(combined_chunks)))
   return chunks, len(combined_chunks), len(documents)
 
 
+async def standard_ingestion_service(document_request: DocumentRequest) -> \
+    List[str]:
+  downloaded = await asyncio.to_thread(s3_download, document_request.url)
+  documents, _, _ = await load_pdf_documents(downloaded)
+  chunks = await chunk_standard_texts(documents, document_request.categoryName)
+
+  await vectorize_and_save(chunks, document_request)
+
+  return [normalize_spacing(doc.page_content) for doc in documents]
+
+
 def extract_file_type(url: str) -> FileType:
   try:
     ext = url.split(".")[-1].strip().upper()
@@ -59,32 +123,33 @@ def extract_file_type(url: str) -> FileType:
     raise CommonException(ErrorCode.UNSUPPORTED_FILE_TYPE)
 
 
-def chunk_standard_texts(documents: List[Document], category: str,
+async def chunk_standard_texts(documents: List[Document], category: str,
     page_batch_size: int = 50) -> List[ClauseChunk]:
-  all_clauses = []
-
-  for start in range(0, len(documents), page_batch_size):
-    batch_docs = documents[start:start + page_batch_size]
-    extracted_text = "\n".join(doc.page_content for doc in batch_docs)
-
-    if category == "법률용어":
-      all_clauses.extend(chunk_legal_terms(extracted_text))
-    else:
-      article_chunks = semantic_chunk(extracted_text, similarity_threshold=0.3)
-      all_clauses.extend(article_chunks)
+  # 페이지 배치를 순차 처리하지 않고 전체 문장을 한 번에 동시 임베딩
+  batch_texts = [
+    "\n".join(
+        doc.page_content for doc in documents[start:start + page_batch_size])
+    for start in range(0, len(documents), page_batch_size)
+  ]
+
+  if category == "법률용어":
+    terms = [term for text in batch_texts for term in split_legal_terms(text)]
+    chunk_groups = await semantic_chunk_many(
+        [body for _, body in terms], max_tokens=150, similarity_threshold=0.3)
+    for (title, _), clauses in zip(terms, chunk_groups):
+      for clause in clauses:
+        clause.clause_number = title
+  else:
+    chunk_groups = await semantic_chunk_many(batch_texts,
+                                             similarity_threshold=0.3)
 
-  return all_clauses
+  return [clause for clauses in chunk_groups for clause in clauses]
 
 
 def chunk_agreement_documents(documents: List[Document]) -> List[DocumentChunk]:
-  if re.findall(ARTICLE_CHUNK_PATTERN, documents[0].page_content,
-                flags=re.DOTALL):
-    chunks = chunk_by_article_and_clause_with_page(documents,
-                                                   ARTICLE_CHUNK_PATTERN)
-  elif re.findall(NUMBER_HEADER_PATTERN, documents[0].page_content,
-                  flags=re.DOTALL):
-    chunks = chunk_by_article_and_clause_with_page(documents,
-                                                   NUMBER_HEADER_PATTERN)
+  pattern = detect_structure(documents[0].page_content)
+  if pattern:
+    chunks = parse_structured_documents(documents, pattern)
   else:
     chunks = chunk_by_paragraph(documents)
 
@@ -1,14 +1,35 @@
 from contextlib import asynccontextmanager
-from fastembed import SparseTextEmbedding
+
+from app.services.common.model_registry import model_registry, get_model_async
+from config.app_config import AppConfig
+
+SPARSE_MODEL_NAME = "prithivida/Splade_PP_en_v1"
+
 
 class FastEmbedSparseWrapper:
     def __init__(self, model_name: str):
-        self.model = SparseTextEmbedding(model_name=model_name)
+        from fastembed import SparseTextEmbedding
+
+        self.model_name = model_name
+        self.model = SparseTextEmbedding(model_name=model_name,
+                                         cache_dir=AppConfig.MODEL_CACHE_DIR)
 
     def embed(self, texts: list[str]) -> list:
         return list(self.model.embed(texts))
 
+    def warmup(self) -> None:
+        # ONNX 세션 초기화 비용을 첫 요청 전에 미리 지불
+        self.embed(["warmup"])
+
+
+model_registry.register(
+    SPARSE_MODEL_NAME,
+    lambda: FastEmbedSparseWrapper(SPARSE_MODEL_NAME),
+    warmup=FastEmbedSparseWrapper.warmup
+)
+
+
 @asynccontextmanager
 async def get_sparse_embedding_async_client():
-    wrapper = FastEmbedSparseWrapper("prithivida/Splade_PP_en_v1")
+    wrapper = await get_model_async(SPARSE_MODEL_NAME)
     yield wrapper
@@ -0,0 +1,63 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+
+class ModelRegistry:
+  def __init__(self):
+    self._loaders: Dict[str, Callable[[], Any]] = {}
+    self._warmups: Dict[str, Callable[[Any], None]] = {}
+    self._models: Dict[str, Any] = {}
+    self._load_times: Dict[str, float] = {}
+    self._locks: Dict[str, threading.Lock] = {}
+
+  def register(self, name: str, loader: Callable[[], Any],
+      warmup: Optional[Callable[[Any], None]] = None) -> None:
+    self._loaders[name] = loader
+    self._locks[name] = threading.Lock()
+    if warmup:
+      self._warmups[name] = warmup
+
+  def get(self, name: str) -> Any:
+    model = self._models.get(name)
+    if model is not None:
+      return model
+
+    # 같은 모델을 여러 스레드가 동시에 로딩하지 않도록 모델별 잠금
+    with self._locks[name]:
+      if name not in self._models:
+        start_time = time.perf_counter()
+        model = self._loaders[name]()
+        if name in self._warmups:
+          self._warmups[name](model)
+        self._load_times[name] = time.perf_counter() - start_time
+        self._models[name] = model
+        logging.info(
+            f"[ModelRegistry]: {name} 로딩 완료 {self._load_times[name]:.4f}초")
+      return self._models[name]
+
+  def warmup(self, names: Optional[Iterable[str]] = None) -> Dict[str, float]:
+    for name in names or list(self._loaders):
+      try:
+        self.get(name)
+      except Exception as e:
+        logging.error(f"[ModelRegistry]: {name} 로딩 실패 {e}")
+    return self.load_times()
+
+  def load_times(self) -> Dict[str, float]:
+    return dict(self._load_times)
+
+
+model_registry = ModelRegistry()
+
+
+async def get_model_async(name: str) -> Any:
+  loop = asyncio.get_running_loop()
+  return await loop.run_in_executor(None, model_registry.get, name)
+
+
+async def warmup_models() -> Dict[str, float]:
+  loop = asyncio.get_running_loop()
+  return await loop.run_in_executor(None, model_registry.warmup)
@@ -1,26 +1,48 @@
-import io
-from typing import List, Tuple
+import logging
+import math
+import mmap
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional, Tuple, Union
 
 import fitz
 
+from app.common.event_loop import register_shutdown_hook
 from app.common.exception.custom_exception import CommonException
 from app.common.exception.error_code import ErrorCode
 from app.schemas.chunk_schema import Document, DocumentMetadata
-from app.schemas.document_request import DocumentRequest
-from app.services.common.s3_service import s3_get_object
+from app.services.common.s3_service import DownloadedFile
+from config.app_config import AppConfig
+from workers.pdf_text import extract_page_texts
 
+# PyMuPDF는 멀티스레드 동시 접근을 지원하지 않으므로 워커 내 fitz 호출을 직렬화
+fitz_lock = threading.RLock()
 
-def convert_to_bytes_io(s3_stream: bytes) -> io.BytesIO:
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_pid: Optional[int] = None
+_pool_lock = threading.Lock()
+
+
+def read_pdf_buffer(downloaded: DownloadedFile) -> Union[bytes, memoryview]:
+  # 작은 파일은 바이트로 읽고, 디스크로 넘친 큰 파일은 mmap 으로 매핑해 복사 없이 fitz 에 넘김
+  # (fitz 문서가 버퍼를 참조하므로 문서가 살아 있는 동안 매핑도 유지됨)
+  # 병렬 추출이 임시 파일 경로를 다시 열 수 있도록 파일은 호출 측이 닫음
   try:
-    return io.BytesIO(s3_stream)
-  except Exception:
+    if not downloaded.spilled:
+      return downloaded.file.read()
+    return memoryview(
+        mmap.mmap(downloaded.file.fileno(), 0, access=mmap.ACCESS_READ))
+  except (OSError, ValueError):
     raise CommonException(ErrorCode.CONVERT_TO_IO_FAILED)
 
 
-def extract_fitz_document_from_pdf_io(
-    pdf_bytes_io: io.BytesIO) -> fitz.Document:
+def extract_fitz_document(pdf_buffer: Union[bytes, memoryview]) -> fitz.Document:
   try:
-    return fitz.open(stream=pdf_bytes_io, filetype="pdf")
+    return fitz.open(stream=pdf_buffer, filetype="pdf")
   except Exception:
     raise CommonException(ErrorCode.FILE_FORMAT_INVALID)
 
@@ -45,13 +67,139 @@ def parse_pdf_to_documents(doc: fitz.Document) -> List[Document]:
   return documents
 
 
-def preprocess_pdf(document_request: DocumentRequest) -> Tuple[
-  List[Document], fitz.Document]:
-  s3_stream = s3_get_object(document_request.url)
-  pdf_bytes_io = convert_to_bytes_io(s3_stream)
-  fitz_document = extract_fitz_document_from_pdf_io(pdf_bytes_io)
-  documents = parse_pdf_to_documents(fitz_document)
+def render_pdf_pages(doc: fitz.Document, page_numbers: List[int],
+    dpi: int) -> List[bytes]:
+  # 텍스트 레이어가 없는 스캔 페이지를 OCR 에 보낼 그레이스케일 PNG 로 렌더링
+  images: List[bytes] = []
+  try:
+    with fitz_lock:
+      for page_number in page_numbers:
+        pixmap = doc.load_page(page_number).get_pixmap(
+            dpi=dpi, colorspace=fitz.csGRAY, alpha=False)
+        images.append(pixmap.tobytes("png"))
+  except Exception:
+    raise CommonException(ErrorCode.PDF_LOAD_FAILED)
+  return images
+
+
+def get_pdf_process_pool() -> ProcessPoolExecutor:
+  # fork 는 요청 스레드와 이벤트 루프 스레드가 도는 워커에서 안전하지 않으므로 spawn 사용
+  global _pool, _pool_pid
+
+  with _pool_lock:
+    if _pool is None or _pool_pid != os.getpid():
+      _pool = ProcessPoolExecutor(
+          max_workers=AppConfig.PDF_EXTRACT_PROCESSES,
+          mp_context=multiprocessing.get_context("spawn"))
+      _pool_pid = os.getpid()
+    return _pool
+
+
+def shutdown_pdf_process_pool() -> None:
+  global _pool
+
+  with _pool_lock:
+    pool, _pool = _pool, None
+  if pool is not None and _pool_pid == os.getpid():
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def close_pdf_process_pool() -> None:
+  shutdown_pdf_process_pool()
+
+
+register_shutdown_hook(close_pdf_process_pool)
+
+
+def split_page_ranges(page_count: int, parts: int) -> List[Tuple[int, int]]:
+  size = math.ceil(page_count / max(parts, 1))
+  return [(start, min(start + size, page_count))
+          for start in range(0, page_count, size)]
+
+
+def parse_pdf_to_documents_in_pool(pool: ProcessPoolExecutor, pdf_path: str,
+    page_count: int, parts: int) -> List[Document]:
+  # 각 프로세스가 같은 임시 파일을 열어 맡은 페이지 구간만 추출하고, 결과는 페이지 순서대로 병합
+  futures = [
+    (start, pool.submit(extract_page_texts, pdf_path, start, stop))
+    for start, stop in split_page_ranges(page_count, parts)
+  ]
+
+  documents: List[Document] = []
+  for start, future in futures:
+    for offset, text in enumerate(future.result()):
+      if text:
+        documents.append(Document(
+            page_content=text,
+            metadata=DocumentMetadata(page=start + offset + 1)
+        ))
+  return documents
+
+
+def parse_pdf_to_documents_parallel(pdf_bytes: Union[bytes, memoryview],
+    page_count: int, pdf_path: Optional[str] = None) -> List[Document]:
+  # 이미 디스크에 있는 다운로드 파일은 경로만 넘기고, 메모리의 작은 파일만 임시 파일로 기록
+  if pdf_path:
+    return parse_pdf_to_documents_in_pool(
+        get_pdf_process_pool(), pdf_path, page_count,
+        AppConfig.PDF_EXTRACT_PROCESSES * 2)
+
+  with tempfile.NamedTemporaryFile(suffix=".pdf") as pdf_file:
+    pdf_file.write(pdf_bytes)
+    pdf_file.flush()
+    return parse_pdf_to_documents_in_pool(
+        get_pdf_process_pool(), pdf_file.name, page_count,
+        AppConfig.PDF_EXTRACT_PROCESSES * 2)
+
+
+def use_parallel_extraction(page_count: int) -> bool:
+  return AppConfig.PDF_EXTRACT_PROCESSES > 1 \
+    and page_count >= AppConfig.PDF_PARALLEL_PAGE_THRESHOLD
+
+
+def find_scanned_pages(doc: fitz.Document,
+    documents: List[Document]) -> List[int]:
+  # 텍스트 레이어가 (거의) 없고 이미지가 페이지 대부분을 덮는 페이지만 OCR 대상으로 선정
+  text_lengths = {document.metadata.page: len(document.page_content)
+                  for document in documents}
+  scanned_pages: List[int] = []
+
+  with fitz_lock:
+    for page in doc:
+      page_num = page.number + 1
+      if text_lengths.get(page_num, 0) >= AppConfig.OCR_SCANNED_PAGE_MAX_CHARS:
+        continue
+
+      page_area = abs(page.rect)
+      image_area = sum(abs(fitz.Rect(info["bbox"]) & page.rect)
+                       for info in page.get_image_info())
+      if page_area and image_area / page_area >= \
+          AppConfig.OCR_SCANNED_PAGE_MIN_IMAGE_RATIO:
+        scanned_pages.append(page_num)
+  return scanned_pages
+
+
+def preprocess_pdf(downloaded: DownloadedFile) -> Tuple[
+  List[Document], fitz.Document, List[int]]:
+  with downloaded.file:
+    pdf_buffer = read_pdf_buffer(downloaded)
+    with fitz_lock:
+      fitz_document = extract_fitz_document(pdf_buffer)
+      page_count = fitz_document.page_count
+
+    documents = None
+    if use_parallel_extraction(page_count):
+      try:
+        documents = parse_pdf_to_documents_parallel(pdf_buffer, page_count,
+                                                    downloaded.path)
+      except Exception as e:
+        logging.warning(f"[preprocess_pdf]: 병렬 추출 실패, 순차 추출로 전환 {e}")
+        if isinstance(e, BrokenProcessPool):
+          shutdown_pdf_process_pool()
+
+  if documents is None:
+    with fitz_lock:
+      documents = parse_pdf_to_documents(fitz_document)
 
-  if not documents:
-    raise CommonException(ErrorCode.NO_TEXTS_EXTRACTED)
-  return documents, fitz_document
+  # 텍스트가 전혀 없는지는 스캔 페이지 OCR 후에 판단
+  return documents, fitz_document, find_scanned_pages(fitz_document, documents)
@@ -0,0 +1,137 @@
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import fitz
+import numpy as np
+
+from app.services.common.pdf_service import fitz_lock
+
+WHITESPACE = re.compile(r'\s+')
+NO_CHAR = -1
+
+
+@dataclass
+class PageTextIndex:
+  width: float
+  height: float
+  # 공백을 한 칸으로 정규화한 페이지 문자열과, 각 글자의 원본 문자 번호 (줄바꿈으로 넣은 공백은 -1)
+  text: str
+  offsets: np.ndarray
+  # 공백을 모두 제거한 페이지 문자열과 원본 문자 번호
+  compact_text: str
+  compact_offsets: np.ndarray
+  # 원본 문자별 bbox (x0, y0, x1, y1)와 줄 번호
+  bboxes: np.ndarray
+  lines: np.ndarray
+
+  def search(self, text: str) -> List[Tuple[float, float, float, float]]:
+    # 정확히(공백 정규화) 일치하는 위치를 먼저 찾고, 없으면 공백을 무시하고 찾음
+    needle = normalize(WHITESPACE.sub(" ", text.strip()))
+    rects = self._search(self.text, self.offsets, needle)
+    if not rects:
+      rects = self._search(self.compact_text, self.compact_offsets,
+                           WHITESPACE.sub("", needle))
+    return rects
+
+  def _search(self, haystack: str, offsets: np.ndarray,
+      needle: str) -> List[Tuple[float, float, float, float]]:
+    rects = []
+    if not needle:
+      return rects
+
+    start = haystack.find(needle)
+    while start != -1:
+      chars = offsets[start:start + len(needle)]
+      rects.extend(self._line_rects(chars[chars != NO_CHAR]))
+      start = haystack.find(needle, start + len(needle))
+    return rects
+
+  def _line_rects(self, chars: np.ndarray) -> List[
+    Tuple[float, float, float, float]]:
+    # page.search_for 처럼 한 번의 일치를 줄 단위 사각형으로 나눔
+    if not len(chars):
+      return []
+    line_ids = self.lines[chars]
+    breaks = np.flatnonzero(np.diff(line_ids)) + 1
+    rects = []
+    for group in np.split(chars, breaks):
+      boxes = self.bboxes[group]
+      rects.append((float(boxes[:, 0].min()), float(boxes[:, 1].min()),
+                    float(boxes[:, 2].max()), float(boxes[:, 3].max())))
+    return rects
+
+
+class PdfTextIndex:
+  # 문서당 한 번, 페이지별로 처음 조회될 때 글자/bbox 색인을 만들어 재사용
+  def __init__(self, pdf_document: fitz.Document):
+    self.pdf_document = pdf_document
+    self._pages: Dict[int, PageTextIndex] = {}
+
+  def page(self, page_num: int) -> PageTextIndex:
+    index = self._pages.get(page_num)
+    if index is None:
+      with fitz_lock:
+        index = self._pages.get(page_num)
+        if index is None:
+          page = self.pdf_document.load_page(page_num - 1)
+          index = build_page_index(page)
+          self._pages[page_num] = index
+    return index
+
+  def search(self, page_num: int, text: str) -> List[
+    Tuple[float, float, float, float]]:
+    return self.page(page_num).search(text)
+
+
+def build_page_index(page: fitz.Page) -> PageTextIndex:
+  # 검색과 같은 추출 플래그를 써서 search_for 가 보는 글자와 bbox 를 그대로 사용
+  raw = page.get_text("rawdict", flags=fitz.TEXTFLAGS_SEARCH)
+
+  bboxes: List[Tuple[float, float, float, float]] = []
+  lines: List[int] = []
+  text: List[str] = []
+  offsets: List[int] = []
+  compact_text: List[str] = []
+  compact_offsets: List[int] = []
+
+  line_id = 0
+  for block in raw["blocks"]:
+    for line in block.get("lines", []):
+      if text and text[-1] != " ":
+        text.append(" ")
+        offsets.append(NO_CHAR)
+
+      for span in line["spans"]:
+        for char in span["chars"]:
+          c = normalize(char["c"])
+          char_id = len(bboxes)
+          bboxes.append(tuple(char["bbox"]))
+          lines.append(line_id)
+
+          if c.isspace():
+            if text and text[-1] != " ":
+              text.append(" ")
+              offsets.append(char_id)
+            continue
+          text.append(c)
+          offsets.append(char_id)
+          compact_text.append(c)
+          compact_offsets.append(char_id)
+      line_id += 1
+
+  return PageTextIndex(
+      width=float(page.rect.width),
+      height=float(page.rect.height),
+      text="".join(text),
+      offsets=np.array(offsets, dtype=np.int32),
+      compact_text="".join(compact_text),
+      compact_offsets=np.array(compact_offsets, dtype=np.int32),
+      bboxes=np.array(bboxes, dtype=np.float64).reshape(-1, 4),
+      lines=np.array(lines, dtype=np.int32)
+  )
+
+
+def normalize(text: str) -> str:
+  # search_for 와 같이 대소문자를 구분하지 않되, 글자 수가 바뀌는 변환은 하지 않음
+  return "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
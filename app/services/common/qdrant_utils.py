@@ -5,8 +5,10 @@ from qdrant_client.http.models import VectorParams, Distance, SparseVectorParams
 from qdrant_client.models import Filter, FieldCondition, MatchValue
 
 from app.blueprints.standard.standard_exception import StandardException
+from app.common.constants import EMBEDDING_DIMENSION
 from app.common.exception.custom_exception import CommonException
 from app.common.exception.error_code import ErrorCode
+from app.services.common.collection_version import bump_collection_version
 
 
 async def ensure_qdrant_collection(qd_client: AsyncQdrantClient,
@@ -27,7 +29,8 @@ async def create_qdrant_collection(qd_client: AsyncQdrantClient,
         collection_name=collection_name,
 
         vectors_config={
-          "dense": VectorParams(size=1536, distance=Distance.COSINE)
+          "dense": VectorParams(size=EMBEDDING_DIMENSION,
+                              distance=Distance.COSINE)
         },
         sparse_vectors_config={"sparse": SparseVectorParams()}
     )
@@ -44,6 +47,9 @@ async def upload_points_to_qdrant(qd_client: AsyncQdrantClient, collection_name,
     await qd_client.upsert(collection_name=collection_name, points=points)
   except (ConnectTimeout, ResponseHandlingException):
     raise CommonException(ErrorCode.QDRANT_CONNECTION_TIMEOUT)
+  finally:
+    # 타임아웃이어도 서버에는 반영됐을 수 있으므로 항상 이 컬렉션을 참조한 분석 캐시를 무효화
+    await bump_collection_version(qd_client, collection_name)
 
 
 async def point_exists(qd_client: AsyncQdrantClient, collection_name: str,
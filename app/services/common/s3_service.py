@@ -1,45 +1,116 @@
+import hashlib
+import io
+import logging
 import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from typing import IO, Optional
 
-import boto3
 import requests
-from botocore.response import StreamingBody
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from app.common import metrics
 from app.common.exception.custom_exception import CommonException
 from app.common.exception.error_code import ErrorCode
-from config.s3_config import AWS_S3_BUCKET_REGION
+from config.app_config import AppConfig
 
 load_dotenv()
 
-def s3_connection():
-  try:
-    return boto3.client(
-        service_name="s3",
-        region_name=AWS_S3_BUCKET_REGION,
-        aws_access_key_id=os.getenv("AWS_ACCESS_KEY"),
-        aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY")
-    )
-  except Exception:
-    raise CommonException(ErrorCode.S3_CLIENT_ERROR)
+_session: Optional[requests.Session] = None
+_session_pid: Optional[int] = None
+_session_lock = threading.Lock()
+
+
+@dataclass
+class DownloadedFile:
+  # 임계값까지는 메모리에, 넘으면 디스크 임시 파일에 저장된 본문
+  file: IO[bytes]
+  size: int
+  sha256: str
+  # 디스크로 넘친 경우의 임시 파일 경로 (다른 프로세스가 복사 없이 같은 파일을 열 수 있음)
+  path: Optional[str] = None
+
+  @property
+  def spilled(self) -> bool:
+    return self.path is not None
 
-s3 = s3_connection()
 
+def get_download_session() -> requests.Session:
+  # 요청마다 새 연결을 맺지 않도록 워커 프로세스당 커넥션 풀을 가진 세션 하나를 공유
+  global _session, _session_pid
+
+  with _session_lock:
+    if _session is None or _session_pid != os.getpid():
+      adapter = HTTPAdapter(
+          pool_connections=AppConfig.DOWNLOAD_POOL_SIZE,
+          pool_maxsize=AppConfig.DOWNLOAD_POOL_SIZE,
+          # 재시도가 끝나도 RetryError 대신 마지막 응답을 돌려 상태 코드 검사에서 FILE_LOAD_FAILED 로 처리
+          max_retries=Retry(total=2, backoff_factor=0.3,
+                            status_forcelist=(500, 502, 503, 504),
+                            allowed_methods=("GET",),
+                            raise_on_status=False))
+      session = requests.Session()
+      session.mount("https://", adapter)
+      session.mount("http://", adapter)
+      _session = session
+      _session_pid = os.getpid()
+    return _session
+
+
+def s3_download(url: str) -> DownloadedFile:
+  # 본문을 통째로 메모리에 올리지 않고 청크 단위로 기록하다가, 임계값을 넘으면 이름 있는 임시 파일로 옮김
+  file: IO[bytes] = io.BytesIO()
+  path: Optional[str] = None
+  size = 0
+  digest = hashlib.sha256()
+  start = time.perf_counter()
 
-def s3_get_object(url: str) -> bytes:
   try:
-    response = requests.get(url, timeout=10)
+    with get_download_session().get(
+        url, stream=True, timeout=(AppConfig.DOWNLOAD_CONNECT_TIMEOUT,
+                                   AppConfig.DOWNLOAD_READ_TIMEOUT)) as response:
+      if response.status_code != 200:
+        raise CommonException(ErrorCode.FILE_LOAD_FAILED)
 
-    if response.status_code != 200:
-      raise CommonException(ErrorCode.FILE_LOAD_FAILED)
+      content_length = int(response.headers.get("Content-Length") or 0)
+      if content_length > AppConfig.DOWNLOAD_MAX_BYTES:
+        raise CommonException(ErrorCode.FILE_SIZE_EXCEEDED)
 
-    return response.content
+      for chunk in response.iter_content(
+          chunk_size=AppConfig.DOWNLOAD_CHUNK_BYTES):
+        size += len(chunk)
+        if size > AppConfig.DOWNLOAD_MAX_BYTES:
+          raise CommonException(ErrorCode.FILE_SIZE_EXCEEDED)
+        file.write(chunk)
+        digest.update(chunk)
+        if path is None and size > AppConfig.DOWNLOAD_SPOOL_MAX_BYTES:
+          spill = tempfile.NamedTemporaryFile()
+          spill.write(file.getvalue())
+          file = spill
+          path = spill.name
 
-  except Exception:
+  except CommonException:
+    file.close()
+    raise
+  except Exception as e:
+    file.close()
+    logging.warning(f"[s3_download]: 다운로드 실패 {e}")
     raise CommonException(ErrorCode.S3_CLIENT_ERROR)
 
+  elapsed = time.perf_counter() - start
+  metrics.observe("download.bytes", size)
+  metrics.observe("download.seconds", elapsed)
+  if elapsed > 0:
+    metrics.observe("download.bytes_per_second", size / elapsed)
 
-def read_s3_stream(s3_stream: StreamingBody):
-  try:
-    return s3_stream.read()
-  except (OSError, IOError):
-    raise CommonException(ErrorCode.S3_STREAM_READ_FAILED)
+  file.flush()
+  file.seek(0)
+  downloaded = DownloadedFile(file=file, size=size, sha256=digest.hexdigest(),
+                              path=path)
+  if downloaded.spilled:
+    metrics.increment("download.spilled")
+  return downloaded
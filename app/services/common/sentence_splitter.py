@@ -0,0 +1,94 @@
+import re
+from typing import List, Optional
+
+from app.services.common.model_registry import model_registry
+from config.app_config import AppConfig
+
+HANGUL = re.compile(r'[가-힣]')
+# 괄호 밖의 경계만 인정하기 위해 괄호와 경계 후보를 한 번에 토큰화
+SEGMENT_TOKEN = re.compile(
+    r'(?P<open>[(（\[])'
+    r'|(?P<close>[)）\]])'
+    # 다. / 함. / 한다). 처럼 한글이나 닫는 괄호·따옴표 뒤의 문장 부호 (가. 목록 번호는 제외)
+    r'|(?P<end>(?<=[가-힣)）"\'」』])(?<!^[가나다라마바사아자차카타파하])'
+    r'(?<!\s[가나다라마바사아자차카타파하])[.?!](?=\s|$))'
+    # ①②③ 항 번호 (②항에 따라 같은 참조는 제외), 줄 머리의 1. / (1) / 가. 목록
+    r'|(?P<item>(?=[①-⑳](?!\s*항))'
+    r'|\n(?=[ \t]*(?:\d{1,2}\.|\(\d{1,2}\)|[가나다라마바사아자차카타파하]\.)\s))'
+)
+# 닫히지 않은 괄호 때문에 나머지 문서 전체가 한 문장이 되지 않도록 제한
+MAX_PARENTHESIS_SPAN = 300
+
+
+class KoreanLegalSegmenter:
+  def split(self, text: str) -> List[str]:
+    if not HANGUL.search(text):
+      return get_segmenter("punkt").split(text)
+
+    sentences: List[str] = []
+    start = 0
+    depth = 0
+    opened_at = 0
+
+    for token in SEGMENT_TOKEN.finditer(text):
+      kind = token.lastgroup
+      if kind == "open":
+        if depth == 0:
+          opened_at = token.start()
+        depth += 1
+        continue
+      if kind == "close":
+        depth = max(depth - 1, 0)
+        continue
+      # 줄 머리 목록 번호는 괄호 안이라도 새 문장으로 봄
+      line_item = kind == "item" and token.group() == "\n"
+      if depth and not line_item \
+          and token.start() - opened_at <= MAX_PARENTHESIS_SPAN:
+        continue
+
+      depth = 0
+      cut = token.end() if kind == "end" else token.start()
+      append_sentence(sentences, text[start:cut])
+      start = cut
+
+    append_sentence(sentences, text[start:])
+    return sentences
+
+
+class PunktSegmenter:
+  def __init__(self, language: str = "english"):
+    import nltk
+    from nltk.tokenize import PunktTokenizer
+
+    # 리소스 확인과 토크나이저 로딩은 로딩 시 한 번만 수행
+    try:
+      nltk.find('tokenizers/punkt_tab')
+    except LookupError:
+      nltk.download('punkt_tab')
+    self._tokenizer = PunktTokenizer(language)
+
+  def split(self, text: str) -> List[str]:
+    return self._tokenizer.tokenize(text)
+
+
+def append_sentence(sentences: List[str], sentence: str):
+  sentence = sentence.strip()
+  if sentence:
+    sentences.append(sentence)
+
+
+def segmenter_model_name(name: str) -> str:
+  return f"sentence-segmenter:{name}"
+
+
+def register_segmenter(name: str, loader) -> None:
+  model_registry.register(segmenter_model_name(name), loader)
+
+
+def get_segmenter(name: Optional[str] = None):
+  return model_registry.get(
+      segmenter_model_name(name or AppConfig.SENTENCE_SEGMENTER))
+
+
+register_segmenter("korean", KoreanLegalSegmenter)
+register_segmenter("punkt", PunktSegmenter)
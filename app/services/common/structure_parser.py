@@ -0,0 +1,132 @@
+import re
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional, Pattern, Tuple
+
+from app.common.constants import ARTICLE_BOUNDARY_PATTERN, \
+  ARTICLE_CHUNK_PATTERN, ARTICLE_CLAUSE_SEPARATOR, \
+  ARTICLE_SECTION_HEADER_PATTERN, NUMBER_BOUNDARY_PATTERN, \
+  NUMBER_HEADER_PATTERN, NUMBER_SECTION_HEADER_PATTERN
+from app.schemas.chunk_schema import Document, DocumentChunk
+from app.services.common.chunking_service import MIN_CLAUSE_BODY_LENGTH, \
+  append_preamble, parse_article_header, parse_number_header
+
+CLAUSE_MARKER = re.compile(r'①|1\.|\(1\)')
+CLAUSE_SPLIT_PATTERNS = {
+  '①': re.compile(r'([\n\s]*[①-⑨])'),
+  '1.': re.compile(r'(\n\s*\d+\.)'),
+  '(1)': re.compile(r'(\n\s*\(\d+\))'),
+}
+
+
+@dataclass(frozen=True)
+class StructureGrammar:
+  header: Pattern
+  header_group: int
+  boundary: Pattern
+  parse_header: Callable[[str], Tuple[int, str]]
+
+
+GRAMMARS = {
+  ARTICLE_CHUNK_PATTERN: StructureGrammar(
+      header=re.compile(ARTICLE_SECTION_HEADER_PATTERN),
+      header_group=0,
+      boundary=re.compile(ARTICLE_BOUNDARY_PATTERN),
+      parse_header=parse_article_header
+  ),
+  NUMBER_HEADER_PATTERN: StructureGrammar(
+      header=re.compile(NUMBER_SECTION_HEADER_PATTERN),
+      header_group=1,
+      boundary=re.compile(NUMBER_BOUNDARY_PATTERN),
+      parse_header=parse_number_header
+  ),
+}
+
+
+def detect_structure(text: str) -> Optional[str]:
+  for pattern in (ARTICLE_CHUNK_PATTERN, NUMBER_HEADER_PATTERN):
+    if GRAMMARS[pattern].header.search(text):
+      return pattern
+  return None
+
+
+def scan_sections(text: str, grammar: StructureGrammar) -> \
+    Iterator[Tuple[int, str, str]]:
+  # 헤더를 찾고 다음 경계 토큰까지를 본문으로 자르는 방식으로 페이지를 한 번만 훑음
+  # (청크 패턴의 findall 결과와 동일한 헤더/본문 쌍을 반환)
+  pos = 0
+  while True:
+    match = grammar.header.search(text, pos)
+    if not match:
+      return
+    boundary = grammar.boundary.search(text, match.end())
+    end = boundary.start() if boundary else len(text)
+    yield match.start(), match.group(grammar.header_group), \
+      text[match.end():end]
+    pos = end
+
+
+def parse_structured_documents(documents: List[Document],
+    pattern: str) -> List[DocumentChunk]:
+  grammar = GRAMMARS[pattern]
+  chunks: List[DocumentChunk] = []
+
+  for doc in documents:
+    page = doc.metadata.page
+    page_text = doc.page_content
+    order_index = 1
+    sections = list(scan_sections(page_text, grammar))
+
+    if not starts_with_header(page_text, grammar):
+      preamble = page_text[:sections[0][0]] if sections else page_text
+      order_index, chunks = append_preamble(chunks, preamble, page,
+                                            order_index)
+
+    for _, header, body in sections:
+      article_number, article_title = grammar.parse_header(header)
+      order_index = append_section(chunks, article_number, article_title,
+                                   body.strip(), page, order_index)
+
+  return chunks
+
+
+def starts_with_header(page_text: str, grammar: StructureGrammar) -> bool:
+  for line in page_text.strip().splitlines():
+    if not line.strip().startswith("페이지"):
+      return bool(grammar.header.match(line))
+  return False
+
+
+def append_section(chunks: List[DocumentChunk], article_number: int,
+    article_title: str, article_body: str, page: int, order_index: int) -> int:
+  marker = CLAUSE_MARKER.match(article_body)
+
+  if not marker:
+    if len(article_body) >= MIN_CLAUSE_BODY_LENGTH:
+      chunks.append(DocumentChunk(
+          clause_content=f"{article_title}{ARTICLE_CLAUSE_SEPARATOR}\n{article_body}",
+          page=page,
+          order_index=order_index,
+          clause_number=f"제{article_number}조 1항"
+      ))
+      order_index += 1
+    return order_index
+
+  clause_chunks = CLAUSE_SPLIT_PATTERNS[marker.group()].split(
+      "\n\n" + article_body)
+  for j in range(1, len(clause_chunks), 2):
+    clause_number = clause_chunks[j].strip()
+    if clause_number.endswith("."):
+      clause_number = clause_number[:-1]
+
+    clause_content = clause_chunks[j + 1].strip() if j + 1 < len(
+        clause_chunks) else ""
+
+    if len(clause_content) >= MIN_CLAUSE_BODY_LENGTH:
+      chunks.append(DocumentChunk(
+          clause_content=f"{article_title}{ARTICLE_CLAUSE_SEPARATOR}\n{clause_content}",
+          page=page,
+          order_index=order_index,
+          clause_number=f"제{article_number}조 {clause_number}항"
+      ))
+      order_index += 1
+  return order_index
@@ -0,0 +1,21 @@
+from functools import lru_cache
+from typing import List
+
+import tiktoken
+
+from app.common.constants import EMBEDDING_MODEL
+
+
+@lru_cache(maxsize=None)
+def get_encoding(model: str = EMBEDDING_MODEL) -> tiktoken.Encoding:
+  return tiktoken.encoding_for_model(model)
+
+
+def count_tokens(text: str, model: str = EMBEDDING_MODEL) -> int:
+  return len(get_encoding(model).encode_ordinary(text))
+
+
+def count_tokens_batch(texts: List[str],
+    model: str = EMBEDDING_MODEL) -> List[int]:
+  return [len(tokens) for tokens in
+          get_encoding(model).encode_ordinary_batch(texts)]
@@ -8,6 +8,7 @@ from app.clients.qdrant_client import get_qdrant_client
 from app.common.exception.custom_exception import CommonException
 from app.common.exception.error_code import ErrorCode
 from app.schemas.success_code import SuccessCode
+from app.services.common.collection_version import bump_collection_version
 from app.services.common.qdrant_utils import point_exists
 
 
@@ -36,5 +37,6 @@ async def delete_by_standard_id(standard_id: int, collection_name: str) -> Succe
 
   except (ConnectTimeout, ResponseHandlingException):
     raise CommonException(ErrorCode.QDRANT_CONNECTION_TIMEOUT)
-
+  finally:
+    await bump_collection_version(qd_client, collection_name)
   return SuccessCode.DELETE_SUCCESS
\ No newline at end of file
@@ -30,16 +30,17 @@ async def vectorize_and_save(chunks: List[ClauseChunk],
   await ensure_qdrant_collection(qd_client, pdf_request.categoryName)
 
   semaphore = asyncio.Semaphore(5)
-  async with get_prompt_async_client() as prompt_client:
-    results = await asyncio.gather(*[
-      make_clause_payload(prompt_client, article, pdf_request, semaphore)
-      for article in chunks
-    ])
+  prompt_client = get_prompt_async_client()
+  results = await asyncio.gather(*[
+    make_clause_payload(prompt_client, article, pdf_request, semaphore)
+    for article in chunks
+  ])
 
-  embedding_inputs = [point.embedding_input() for point in results if point]
+  payloads = [payload for payload in results if payload]
+  embedding_inputs = [payload.embedding_input() for payload in payloads]
 
-  async with get_dense_embedding_async_client() as dense_client, \
-      get_sparse_embedding_async_client() as sparse_client:
+  dense_client = get_dense_embedding_async_client()
+  async with get_sparse_embedding_async_client() as sparse_client:
     dense_task = embedding_service.batch_embed_texts(dense_client,
                                                      embedding_inputs)
     sparse_task = embedding_service.batch_embed_texts_sparse(sparse_client,
@@ -49,13 +50,12 @@ async def vectorize_and_save(chunks: List[ClauseChunk],
 
   final_points = []
   try:
-    for payload, dense_vec, sparse_vec in zip(results, dense_vectors,
+    for payload, dense_vec, sparse_vec in zip(payloads, dense_vectors,
                                               sparse_vectors):
-      if payload and dense_vec and sparse_vec:
-        final_points.append(build_point(payload, {
-          "dense": dense_vec,
-          "sparse": sparse_vec
-        }))
+      final_points.append(build_point(payload, {
+        "dense": dense_vec,
+        "sparse": sparse_vec
+      }))
   except Exception:
     raise StandardException(ErrorCode.BUILD_POINT_FAILED)
 
@@ -70,8 +70,8 @@ def build_point(payload: VectorPayload, vectors: dict) -> PointStruct:
   return PointStruct(
       id=uuid.uuid4().hex,
       vector={
-        "dense": vectors["dense"],
-        "sparse": vectors["sparse"],
+        "dense": vectors["dense"].tolist(),
+        "sparse": vectors["sparse"].to_qdrant(),
       },
       payload=payload.to_dict()
   )
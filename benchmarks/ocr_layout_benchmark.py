@@ -0,0 +1,176 @@
+"""OCR bbox 위치 추출 벤치마크: 기존 선형 스캔 경로와 OcrLayout 색인 경로 비교
+
+  python -m benchmarks.ocr_layout_benchmark --fields 2000 --clauses 50
+"""
+import argparse
+import random
+import time
+from typing import List
+
+from app.services.agreement.ocr_layout import OcrLayout
+from app.services.agreement.ocr_service import extract_bbox_positions
+
+WORDS = ["계약", "당사자는", "본", "계약에서", "정한", "의무를", "성실히", "이행하여야",
+         "하며", "제3자에게", "양도할", "수", "없다.", "금액", "12,000원", "합계"]
+FIELDS_PER_LINE = 25
+
+
+def make_fields(count: int, seed: int = 7) -> List[dict]:
+  # 조밀한 스캔 문서처럼 한 줄에 여러 필드가 놓이고 줄마다 y 가 약간씩 흔들림
+  rng = random.Random(seed)
+  lines = (count + FIELDS_PER_LINE - 1) // FIELDS_PER_LINE
+  line_height = 0.9 / lines
+  fields = []
+  current_idx = 0
+  for i in range(count):
+    row, col = divmod(i, FIELDS_PER_LINE)
+    text = rng.choice(WORDS)
+    top = 0.05 + row * line_height + rng.uniform(-0.1, 0.1) * line_height
+    bottom = top + line_height * 0.8
+    left = 0.02 + col * (0.96 / FIELDS_PER_LINE)
+    right = left + 0.96 / FIELDS_PER_LINE * 0.9
+    fields.append({
+      'text': text,
+      'bounding_box': [{'x': left, 'y': top}, {'x': right, 'y': top},
+                       {'x': right, 'y': bottom}, {'x': left, 'y': bottom}],
+      'start_idx': current_idx,
+      'end_idx': current_idx + len(text)
+    })
+    current_idx += len(text) + 1
+  return fields
+
+
+def make_queries(fields: List[dict], count: int, seed: int = 11):
+  # 여러 줄에 걸친 조항과 그 안의 부분 문장
+  rng = random.Random(seed)
+  queries = []
+  for _ in range(count):
+    start = rng.randrange(len(fields) - 1)
+    stop = min(len(fields), start + rng.randint(5, 120))
+    words = [field['text'] for field in fields[start:stop]]
+    part_start = rng.randrange(len(words))
+    part = words[part_start:part_start + rng.randint(1, 10)]
+    queries.append((" ".join(words), " ".join(part)))
+  return queries
+
+
+def legacy_extract_bbox_positions(clause_content: str, incorrect_part: str,
+    all_texts_with_bounding_boxes: List[dict]):
+  # 변경 전 ocr_service.extract_bbox_positions
+  full_text = " ".join(item['text'] for item in all_texts_with_bounding_boxes)
+
+  def get_position_range(target_text: str, base_start: int = 0):
+    start_idx = full_text.find(target_text, base_start)
+    end_idx = start_idx + len(target_text) if start_idx != -1 else -1
+    return start_idx, end_idx
+
+  def extract_bboxes(start_idx: int, end_idx: int) -> List[tuple]:
+    epsilon = None
+
+    matched_items = [
+      item for item in all_texts_with_bounding_boxes
+      if start_idx <= item['start_idx'] < end_idx
+    ]
+
+    grouped_texts = {}
+    for item in matched_items:
+      bounding_box = item['bounding_box']
+      center_y = sum(vertex['y'] for vertex in bounding_box) / len(bounding_box)
+
+      if epsilon is None:
+        y_values = [vertex['y'] for vertex in bounding_box]
+        group_height = max(y_values) - min(y_values)
+        epsilon = group_height * 0.5
+
+      group_found = False
+      for y_group in grouped_texts:
+        if y_group - epsilon < center_y < y_group + epsilon:
+          grouped_texts[y_group].append(item)
+          group_found = True
+          break
+      if not group_found:
+        grouped_texts[center_y] = [item]
+
+    points_list = []
+    unique_relative_points = set()
+    for y_group in grouped_texts:
+      min_x_group = float('inf')
+      min_y_group = float('inf')
+      max_x_group = float('-inf')
+      max_y_group = float('-inf')
+
+      for item in grouped_texts[y_group]:
+        for vertex in item['bounding_box']:
+          min_x_group = min(min_x_group, vertex['x'])
+          min_y_group = min(min_y_group, vertex['y'])
+          max_x_group = max(max_x_group, vertex['x'])
+          max_y_group = max(max_y_group, vertex['y'])
+
+      points_tuple = (min_x_group * 100, min_y_group * 100,
+                      (max_x_group - min_x_group) * 100,
+                      (max_y_group - min_y_group) * 100)
+      if points_tuple not in unique_relative_points:
+        unique_relative_points.add(points_tuple)
+        points_list.append(points_tuple)
+
+    return points_list
+
+  clause_start_idx, clause_end_idx = get_position_range(clause_content)
+  part_start_idx, part_end_idx = get_position_range(incorrect_part,
+                                                    clause_start_idx)
+  return extract_bboxes(clause_start_idx, clause_end_idx), \
+    extract_bboxes(part_start_idx, part_end_idx)
+
+
+def legacy_path(fields: List[dict], queries):
+  return [legacy_extract_bbox_positions(clause, part, fields)
+          for clause, part in queries]
+
+
+def layout_path(fields: List[dict], queries):
+  # 이미지당 한 번 색인을 만들고 모든 조항에 재사용
+  layout = OcrLayout(fields)
+  return [extract_bbox_positions(clause, part, layout)
+          for clause, part in queries]
+
+
+def measure(func, fields: List[dict], queries, repeat: int):
+  best = float("inf")
+  result = None
+  for _ in range(repeat):
+    start = time.perf_counter()
+    result = func(fields, queries)
+    best = min(best, time.perf_counter() - start)
+  return best, result
+
+
+def main():
+  parser = argparse.ArgumentParser()
+  parser.add_argument("--fields", type=int, default=2000)
+  parser.add_argument("--clauses", type=int, default=50)
+  parser.add_argument("--repeat", type=int, default=5)
+  args = parser.parse_args()
+
+  fields = make_fields(args.fields)
+  queries = make_queries(fields, args.clauses)
+
+  legacy_time, legacy_result = measure(legacy_path, fields, queries,
+                                       args.repeat)
+  layout_time, layout_result = measure(layout_path, fields, queries,
+                                       args.repeat)
+  if legacy_result != layout_result:
+    raise SystemExit("두 경로의 bbox 결과가 다릅니다")
+
+  build_start = time.perf_counter()
+  OcrLayout(fields)
+  build_time = time.perf_counter() - build_start
+
+  boxes = sum(len(all_boxes) for all_boxes, _ in layout_result)
+  print(f"fields={args.fields} clauses={args.clauses} line_boxes={boxes}")
+  print(f"  legacy  {legacy_time * 1000:8.2f} ms")
+  print(f"  layout  {layout_time * 1000:8.2f} ms (build {build_time * 1000:.2f} ms)")
+  print(f"  speedup {legacy_time / layout_time:8.1f}x")
+
+
+if __name__ == "__main__":
+  main()
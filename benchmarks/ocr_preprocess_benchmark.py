@@ -0,0 +1,83 @@
+"""OCR 전처리 벤치마크: 기존 원본 해상도 JPEG 경로와 적응형 전처리의 전송 크기·처리 시간
+
+  python -m benchmarks.ocr_preprocess_benchmark --width 4032 --height 3024
+"""
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from app.services.agreement.ocr_preprocess import preprocess_image
+
+LINE = "Article {n}. The parties shall perform the obligations in good faith."
+
+
+def make_photo(width: int, height: int, text_height: int, seed: int = 3) -> bytes:
+  # 휴대폰으로 찍은 계약서처럼 조명 기울기와 잡음이 있는 고해상도 사진
+  rng = np.random.default_rng(seed)
+  gradient = np.linspace(170, 235, width, dtype=np.float32)
+  image = np.tile(gradient, (height, 1))
+  image += rng.normal(0, 6, (height, width)).astype(np.float32)
+  image = np.clip(image, 0, 255).astype(np.uint8)
+
+  font_scale = text_height / 22
+  thickness = max(int(font_scale * 2), 1)
+  line_gap = int(text_height * 1.8)
+  for n, y in enumerate(range(line_gap * 2, height - line_gap, line_gap)):
+    cv2.putText(image, LINE.format(n=n + 1), (width // 20, y),
+                cv2.FONT_HERSHEY_SIMPLEX, font_scale, 30, thickness,
+                cv2.LINE_AA)
+
+  color = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+  return cv2.imencode('.jpg', color, [cv2.IMWRITE_JPEG_QUALITY, 92])[1].tobytes()
+
+
+def legacy_preprocess(image_data: bytes) -> bytes:
+  # 변경 전 extract_ocr 의 전처리 경로
+  image = cv2.imdecode(np.frombuffer(image_data, np.uint8), cv2.IMREAD_COLOR)
+  height, width = image.shape[:2]
+  resized_image = cv2.resize(image, (width, height),
+                             interpolation=cv2.INTER_LINEAR)
+  gray = cv2.cvtColor(resized_image, cv2.COLOR_BGR2GRAY)
+  _, binarized_img = cv2.threshold(gray, 0, 255,
+                                   cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+  return cv2.imencode('.jpg', binarized_img)[1].tobytes()
+
+
+def measure(func, image_data: bytes, repeat: int):
+  best = float("inf")
+  result = None
+  for _ in range(repeat):
+    start = time.perf_counter()
+    result = func(image_data)
+    best = min(best, time.perf_counter() - start)
+  return best, result
+
+
+def main():
+  parser = argparse.ArgumentParser()
+  parser.add_argument("--width", type=int, default=4032)
+  parser.add_argument("--height", type=int, default=3024)
+  parser.add_argument("--text-height", type=int, default=60)
+  parser.add_argument("--repeat", type=int, default=3)
+  args = parser.parse_args()
+
+  image_data = make_photo(args.width, args.height, args.text_height)
+  legacy_time, legacy_bytes = measure(legacy_preprocess, image_data,
+                                      args.repeat)
+  adaptive_time, adaptive = measure(preprocess_image, image_data, args.repeat)
+
+  print(f"photo {args.width}x{args.height} text={args.text_height}px "
+        f"original={len(image_data) / 1024:.0f} KiB")
+  print(f"  legacy    {len(legacy_bytes) / 1024:8.0f} KiB "
+        f"{legacy_time * 1000:8.1f} ms  {args.width}x{args.height} jpg")
+  print(f"  adaptive  {len(adaptive.content) / 1024:8.0f} KiB "
+        f"{adaptive_time * 1000:8.1f} ms  "
+        f"{adaptive.width}x{adaptive.height} {adaptive.format} "
+        f"(scale {adaptive.scale:.2f})")
+  print(f"  upload reduction {len(legacy_bytes) / len(adaptive.content):.1f}x")
+
+
+if __name__ == "__main__":
+  main()
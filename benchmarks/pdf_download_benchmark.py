@@ -0,0 +1,117 @@
+"""PDF 다운로드 벤치마크: 기존 requests.get + BytesIO 경로와 스트리밍 다운로드 + mmap 경로의 최대 RSS
+
+  python -m benchmarks.pdf_download_benchmark --megabytes 100
+"""
+import argparse
+import functools
+import http.server
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import fitz
+
+PAGE_IMAGE_SIDE = 1024
+
+
+def make_pdf(path: str, megabytes: int) -> None:
+  # 압축되지 않는 무작위 이미지로 페이지를 채워 원하는 크기의 기준 문서를 만듦
+  doc = fitz.open()
+  image_bytes = PAGE_IMAGE_SIDE * PAGE_IMAGE_SIDE * 3
+  pages = max(megabytes * 1024 * 1024 // image_bytes, 1)
+  for number in range(pages):
+    page = doc.new_page()
+    page.insert_text((72, 72), f"제{number + 1}조 기준 문서 본문", fontname="korea")
+    pixmap = fitz.Pixmap(fitz.csRGB, PAGE_IMAGE_SIDE, PAGE_IMAGE_SIDE,
+                         os.urandom(image_bytes), 0)
+    page.insert_image(fitz.Rect(72, 100, 520, 548), pixmap=pixmap)
+  doc.save(path, deflate=False)
+
+
+def legacy_open(url: str) -> fitz.Document:
+  # 변경 전 s3_get_object + convert_to_bytes_io + fitz.open 경로
+  import requests
+
+  content = requests.get(url, timeout=10).content
+  return fitz.open(stream=io.BytesIO(content), filetype="pdf")
+
+
+def streaming_open(url: str) -> fitz.Document:
+  from app.services.common.pdf_service import extract_fitz_document, \
+    read_pdf_buffer
+  from app.services.common.s3_service import s3_download
+
+  return extract_fitz_document(read_pdf_buffer(s3_download(url)))
+
+
+def run_mode(mode: str, url: str) -> None:
+  # 모듈 import 비용은 제외하고, 요청이 끝날 때까지 문서를 쥐고 있는 상황의 최대 RSS 를 측정
+  import requests  # noqa: F401
+  import app.services.common.pdf_service  # noqa: F401
+
+  baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+  start = time.perf_counter()
+  doc = (legacy_open if mode == "legacy" else streaming_open)(url)
+  text = "".join(page.get_text("text") for page in doc)
+  elapsed = time.perf_counter() - start
+  peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+  print(json.dumps({"mode": mode, "seconds": elapsed, "chars": len(text),
+                    "rss_growth_mb": (peak - baseline) / 1024}))
+
+
+class QuietHandler(http.server.SimpleHTTPRequestHandler):
+  def log_message(self, *args) -> None:
+    pass
+
+
+def serve(directory: str) -> http.server.ThreadingHTTPServer:
+  handler = functools.partial(QuietHandler, directory=directory)
+  server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+  threading.Thread(target=server.serve_forever, daemon=True).start()
+  return server
+
+
+def main():
+  parser = argparse.ArgumentParser()
+  parser.add_argument("--megabytes", type=int, default=100)
+  parser.add_argument("--mode", choices=("legacy", "streaming"))
+  parser.add_argument("--url")
+  args = parser.parse_args()
+
+  if args.mode:
+    run_mode(args.mode, args.url)
+    return
+
+  with tempfile.TemporaryDirectory() as directory:
+    make_pdf(os.path.join(directory, "standard.pdf"), args.megabytes)
+    size = os.path.getsize(os.path.join(directory, "standard.pdf"))
+    server = serve(directory)
+    url = f"http://127.0.0.1:{server.server_port}/standard.pdf"
+
+    print(f"pdf {size / 1024 / 1024:.1f} MiB")
+    results = {}
+    for mode in ("legacy", "streaming"):
+      # 모드마다 새 프로세스에서 실행해 최대 RSS 가 서로 섞이지 않게 함
+      output = subprocess.run(
+          [sys.executable, "-m", "benchmarks.pdf_download_benchmark",
+           "--mode", mode, "--url", url],
+          check=True, capture_output=True, text=True,
+          env={**os.environ, "PREWARM_CLIENTS": "false",
+               "PREWARM_MODELS": "false"}).stdout
+      results[mode] = json.loads(output.strip().splitlines()[-1])
+      print(f"  {mode:9} rss +{results[mode]['rss_growth_mb']:7.1f} MB "
+            f"{results[mode]['seconds'] * 1000:8.1f} ms")
+    server.shutdown()
+
+    if results["legacy"]["chars"] != results["streaming"]["chars"]:
+      raise SystemExit("두 경로의 추출 결과가 다릅니다")
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,65 @@
+"""PDF 텍스트 추출 확장성 벤치마크: 순차 추출과 프로세스 풀 페이지 병렬 추출 비교
+
+  python -m benchmarks.pdf_extract_benchmark --pages 300 --processes 1 2 4 8
+"""
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import fitz
+
+from app.services.common.pdf_service import parse_pdf_to_documents, \
+  parse_pdf_to_documents_in_pool
+
+LINE = "제{n}조(목적) 이 계약은 갑과 을 사이의 용역 제공에 관한 사항을 정함을 목적으로 한다. "
+
+
+def make_pdf(path: str, pages: int) -> None:
+  with fitz.open() as doc:
+    for number in range(1, pages + 1):
+      page = doc.new_page()
+      text = "\n".join(LINE.format(n=number) * 2 for _ in range(40))
+      page.insert_text((36, 48), text, fontname="korea", fontsize=6)
+    doc.save(path)
+
+
+def main():
+  parser = argparse.ArgumentParser()
+  parser.add_argument("--pages", type=int, default=300)
+  parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4, 8])
+  args = parser.parse_args()
+
+  with tempfile.TemporaryDirectory() as directory:
+    pdf_path = os.path.join(directory, "benchmark.pdf")
+    make_pdf(pdf_path, args.pages)
+
+    start = time.perf_counter()
+    with fitz.open(pdf_path) as doc:
+      expected = parse_pdf_to_documents(doc)
+    serial = time.perf_counter() - start
+    print(f"cpus={os.cpu_count()} pages={args.pages}")
+    print(f"serial        {serial:7.3f}s")
+
+    context = multiprocessing.get_context("spawn")
+    for processes in args.processes:
+      with ProcessPoolExecutor(max_workers=processes,
+                               mp_context=context) as pool:
+        # 프로세스 기동 비용은 풀이 재사용되므로 측정에서 제외
+        parse_pdf_to_documents_in_pool(pool, pdf_path, processes, processes)
+
+        start = time.perf_counter()
+        documents = parse_pdf_to_documents_in_pool(pool, pdf_path, args.pages,
+                                                   processes * 2)
+        elapsed = time.perf_counter() - start
+
+      if documents != expected:
+        raise SystemExit(f"processes={processes}: 순차 추출 결과와 다릅니다")
+      print(f"processes={processes:<3} {elapsed:7.3f}s  "
+            f"speedup {serial / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+  main()
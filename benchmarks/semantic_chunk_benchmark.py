@@ -0,0 +1,96 @@
+"""semantic_chunk 조립 단계 마이크로 벤치마크 (임베딩 API 호출 제외)
+
+  python -m benchmarks.semantic_chunk_benchmark --pages 500
+"""
+import argparse
+import time
+
+import numpy as np
+
+from app.common.constants import EMBEDDING_DIMENSION
+from app.services.common import token_counter
+from app.services.common.chunking_service import assemble_semantic_chunks, \
+  CHUNK_TOKENIZER_MODEL
+
+SENTENCES_PER_PAGE = 12
+SENTENCE_TEMPLATES = [
+  "제{n}조에 따른 계약 당사자는 상대방의 서면 동의 없이 본 계약상의 권리와 의무를 제3자에게 양도할 수 없다.",
+  "근로자는 소정근로시간을 초과하여 근무한 경우 근로기준법에 따라 연장근로수당을 지급받을 권리를 가진다.",
+  "수급인은 하자담보책임기간 동안 발생한 하자에 대하여 도급인의 요청이 있는 경우 지체 없이 보수하여야 한다.",
+  "당사자 일방이 본 계약을 위반한 경우 상대방은 14일 이상의 기간을 정하여 이행을 최고한 후 계약을 해지할 수 있다.",
+]
+
+
+def make_sentences(pages: int):
+  count = pages * SENTENCES_PER_PAGE
+  return [SENTENCE_TEMPLATES[i % len(SENTENCE_TEMPLATES)].format(n=i // 7 + 1)
+          for i in range(count)]
+
+
+def make_embeddings(count: int) -> np.ndarray:
+  # 인접 문장끼리 유사도가 서서히 변하도록 랜덤 워크로 생성
+  rng = np.random.default_rng(0)
+  steps = rng.normal(scale=0.3, size=(count, EMBEDDING_DIMENSION))
+  return np.cumsum(steps, axis=0).astype(np.float32)
+
+
+def legacy_semantic_chunk(sentences, embeddings, similarity_threshold,
+    max_tokens):
+  # 기존 구현: 문장마다 누적 청크 전체를 재인코딩하고 코사인을 한 쌍씩 계산
+  import tiktoken
+
+  def count_tokens(text):
+    encoding = tiktoken.encoding_for_model(CHUNK_TOKENIZER_MODEL)
+    return len(encoding.encode(text))
+
+  def cosine(a, b):
+    a = np.array(a).flatten()
+    b = np.array(b).flatten()
+    return np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
+
+  chunks = []
+  current_chunk = [sentences[0]]
+  prev_embedding = embeddings[0]
+  for i in range(1, len(sentences)):
+    similarity = cosine(prev_embedding, embeddings[i])
+    tentative_chunk = current_chunk + [sentences[i]]
+    token_len = count_tokens(" ".join(tentative_chunk))
+    if similarity < similarity_threshold or token_len > max_tokens:
+      chunks.append(" ".join(current_chunk))
+      current_chunk = [sentences[i]]
+    else:
+      current_chunk.append(sentences[i])
+    prev_embedding = embeddings[i]
+  chunks.append(" ".join(current_chunk))
+  return chunks
+
+
+def measure(label, func, *args):
+  start = time.perf_counter()
+  result = func(*args)
+  elapsed = time.perf_counter() - start
+  print(f"{label:<10} {elapsed:8.3f}s  chunks={len(result)}")
+  return elapsed
+
+
+def main():
+  parser = argparse.ArgumentParser()
+  parser.add_argument("--pages", type=int, default=500)
+  parser.add_argument("--threshold", type=float, default=0.3)
+  parser.add_argument("--max-tokens", type=int, default=250)
+  args = parser.parse_args()
+
+  sentences = make_sentences(args.pages)
+  embeddings = make_embeddings(len(sentences))
+  token_counter.get_encoding(CHUNK_TOKENIZER_MODEL)
+  print(f"pages={args.pages} sentences={len(sentences)}")
+
+  legacy = measure("legacy", legacy_semantic_chunk, sentences, embeddings,
+                   args.threshold, args.max_tokens)
+  current = measure("current", assemble_semantic_chunks, sentences,
+                    embeddings, args.threshold, args.max_tokens)
+  print(f"speedup    {legacy / current:8.1f}x")
+
+
+if __name__ == "__main__":
+  main()
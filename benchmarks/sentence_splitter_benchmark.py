@@ -0,0 +1,71 @@
+"""문장 분리 처리량 벤치마크: 기존 punkt 경로와 한국어 규칙 기반 분리기 비교
+
+  python -m benchmarks.sentence_splitter_benchmark --pages 500
+
+기존 경로(호출마다 nltk.find 후 sent_tokenize)는 punkt_tab 리소스가 설치되어 있어야 측정되며,
+없으면 학습되지 않은 punkt 토크나이저로 대신 측정한다.
+"""
+import argparse
+import time
+from typing import Callable, List
+
+from app.services.common.sentence_splitter import get_segmenter
+
+PAGE_BATCH_SIZE = 50
+PAGE_TEMPLATE = """제{n}조(계약의 목적) ① 이 계약은 "갑"과 "을" 사이의 용역 제공에 관한 사항(이하 "용역"이라 한다. 다만 부수 업무는 제외한다)을 정함을 목적으로 한다. ② 을은 제1항 및 ③항에 따른 업무를 성실히 수행하여야 한다.
+1. 계약기간은 2024. 1. 1.부터 2024. 12. 31.까지로 한다.
+2. 대금은 매월 말일에 지급함.
+가. 세부 지급 방법은 별도로 정함.
+나. 지연 시 지연이자를 가산함.
+③ 당사자 일방이 본 계약을 위반한 경우 상대방은 14일 이상의 기간을 정하여 이행을 최고한 후 계약을 해지할 수 있다. 이 경우 손해배상을 청구할 수 있다.
+"""
+
+
+def make_page_batches(pages: int) -> List[str]:
+  page_texts = [PAGE_TEMPLATE.format(n=page) for page in range(1, pages + 1)]
+  return ["\n".join(page_texts[start:start + PAGE_BATCH_SIZE])
+          for start in range(0, pages, PAGE_BATCH_SIZE)]
+
+
+def legacy_split(text: str) -> List[str]:
+  # 변경 전 split_into_sentences: 호출마다 리소스 경로 탐색 후 punkt 분리
+  import nltk
+
+  nltk.find('tokenizers/punkt_tab')
+  return nltk.sent_tokenize(text)
+
+
+def measure(label: str, split: Callable[[str], List[str]], batches: List[str]):
+  start = time.perf_counter()
+  sentences = [s for batch in batches for s in split(batch)]
+  elapsed = time.perf_counter() - start
+
+  chars = sum(len(batch) for batch in batches)
+  average = sum(len(s) for s in sentences) / len(sentences)
+  print(f"{label:<8} {chars / elapsed / 1e6:8.2f} M chars/s  "
+        f"sentences={len(sentences):<7} avg_len={average:6.1f}")
+
+
+def main():
+  parser = argparse.ArgumentParser()
+  parser.add_argument("--pages", type=int, default=500)
+  args = parser.parse_args()
+
+  batches = make_page_batches(args.pages)
+  korean = get_segmenter("korean")
+
+  try:
+    legacy_split(batches[0])
+  except LookupError:
+    # 리소스가 없으면 학습 파라미터 없는 punkt 로 같은 알고리즘의 처리량만 측정
+    from nltk.tokenize import PunktSentenceTokenizer
+
+    print("punkt_tab 리소스가 없어 학습되지 않은 punkt(punkt*)로 대신 측정")
+    measure("punkt*", PunktSentenceTokenizer().tokenize, batches)
+  else:
+    measure("legacy", legacy_split, batches)
+  measure("korean", korean.split, batches)
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,97 @@
+"""워커 기동(create_app) 시간과 모듈별 import 비용 측정
+
+  python -m benchmarks.startup_profile            # 모듈별 import 비용 상위 목록
+  python -m benchmarks.startup_profile --check    # 시간/메모리 예산 초과 시 종료 코드 1
+
+기동 시 네트워크를 쓰지 않도록 클라이언트/모델 예열은 끄고 별도 프로세스에서 측정한다.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+DEFAULT_MAX_SECONDS = 4.0
+DEFAULT_MAX_RSS_MB = 256
+
+BOOT_SCRIPT = """
+import json, resource, time
+start = time.perf_counter()
+from app import create_app
+create_app()
+elapsed = time.perf_counter() - start
+rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+print(json.dumps({"seconds": elapsed, "rss_mb": rss_mb}))
+"""
+
+
+def run_boot(import_time: bool) -> Tuple[dict, str]:
+  env = dict(os.environ, PREWARM_CLIENTS="false", PREWARM_MODELS="false")
+  command = [sys.executable]
+  if import_time:
+    command += ["-X", "importtime"]
+  command += ["-c", BOOT_SCRIPT]
+
+  completed = subprocess.run(command, env=env, capture_output=True, text=True,
+                             check=True)
+  result = json.loads(completed.stdout.strip().splitlines()[-1])
+  return result, completed.stderr
+
+
+def parse_import_times(stderr: str) -> List[Tuple[str, int, int]]:
+  # "import time: self [us] | cumulative | imported package" 형식
+  rows = []
+  for line in stderr.splitlines():
+    if not line.startswith("import time:") or "imported package" in line:
+      continue
+    self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+    rows.append((name.strip(), int(self_us), int(cumulative_us)))
+  return rows
+
+
+def self_time_by_package(rows: List[Tuple[str, int, int]]) -> Dict[str, int]:
+  totals: Dict[str, int] = defaultdict(int)
+  for name, self_us, _ in rows:
+    totals[name.split(".")[0]] += self_us
+  return totals
+
+
+def main():
+  parser = argparse.ArgumentParser()
+  parser.add_argument("--top", type=int, default=20)
+  parser.add_argument("--check", action="store_true",
+                      help="예산 초과 시 0이 아닌 종료 코드 반환")
+  parser.add_argument("--max-seconds", type=float, default=DEFAULT_MAX_SECONDS)
+  parser.add_argument("--max-rss-mb", type=float, default=DEFAULT_MAX_RSS_MB)
+  args = parser.parse_args()
+
+  if not args.check:
+    _, stderr = run_boot(import_time=True)
+    rows = parse_import_times(stderr)
+
+    print(f"{'cumulative(ms)':>14}  module")
+    for name, _, cumulative_us in sorted(rows, key=lambda r: -r[2])[:args.top]:
+      print(f"{cumulative_us / 1000:14.1f}  {name}")
+
+    print(f"\n{'self(ms)':>14}  top-level package")
+    packages = sorted(self_time_by_package(rows).items(), key=lambda r: -r[1])
+    for name, self_us in packages[:args.top]:
+      print(f"{self_us / 1000:14.1f}  {name}")
+    print()
+
+  # importtime 계측 오버헤드가 섞이지 않도록 예산은 별도 프로세스에서 측정
+  result, _ = run_boot(import_time=False)
+  print(f"create_app: {result['seconds']:.2f}s "
+        f"(budget {args.max_seconds:.2f}s), "
+        f"max RSS: {result['rss_mb']:.0f}MB (budget {args.max_rss_mb:.0f}MB)")
+
+  if args.check and (result["seconds"] > args.max_seconds
+                     or result["rss_mb"] > args.max_rss_mb):
+    print("startup budget exceeded")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,101 @@
+"""조/항 구조 파싱 벤치마크: 기존 정규식 경로와 단일 패스 파서의 100페이지당 처리 시간
+
+  python -m benchmarks.structure_parser_benchmark --pages 500
+"""
+import argparse
+import re
+import time
+from typing import List
+
+from app.common.constants import ARTICLE_CHUNK_PATTERN, NUMBER_HEADER_PATTERN
+from app.schemas.chunk_schema import Document, DocumentMetadata
+from app.services.common.chunking_service import \
+  chunk_by_article_and_clause_with_page
+from app.services.common.structure_parser import detect_structure, \
+  parse_structured_documents
+
+ARTICLES_PER_PAGE = 4
+CLAUSE_BODY = ("계약 당사자는 본 계약에서 정한 의무를 성실히 이행하여야 하며, "
+               "제{ref}조에 따른 통지 없이 이를 제3자에게 양도할 수 없다. ")
+
+
+def make_article_pages(pages: int) -> List[Document]:
+  documents = []
+  article = 1
+  for page in range(1, pages + 1):
+    lines = [f"페이지 {page}"]
+    if page > 1:
+      lines.append(f"③ 전항의 경우 {CLAUSE_BODY.format(ref=article - 1)}")
+    for _ in range(ARTICLES_PER_PAGE):
+      lines.append(f"제{article}조(계약의 목적 {article})")
+      for marker in "①②③":
+        lines.append(marker + " " + CLAUSE_BODY.format(ref=article) * 2)
+      article += 1
+    documents.append(Document(page_content="\n".join(lines),
+                              metadata=DocumentMetadata(page=page)))
+  return documents
+
+
+def make_number_pages(pages: int) -> List[Document]:
+  documents = []
+  number = 1
+  for page in range(1, pages + 1):
+    lines = []
+    for _ in range(ARTICLES_PER_PAGE):
+      lines.append(f"{number % 100}. 계약 조건 {number}: "
+                   + CLAUSE_BODY.format(ref=number) * 3)
+      number += 1
+    documents.append(Document(page_content="\n".join(lines),
+                              metadata=DocumentMetadata(page=page)))
+  return documents
+
+
+def regex_path(documents: List[Document]):
+  # 변경 전 chunk_agreement_documents 의 패턴 판별 및 청킹 경로
+  first_page = documents[0].page_content
+  if re.findall(ARTICLE_CHUNK_PATTERN, first_page, flags=re.DOTALL):
+    return chunk_by_article_and_clause_with_page(documents,
+                                                 ARTICLE_CHUNK_PATTERN)
+  if re.findall(NUMBER_HEADER_PATTERN, first_page, flags=re.DOTALL):
+    return chunk_by_article_and_clause_with_page(documents,
+                                                 NUMBER_HEADER_PATTERN)
+  return []
+
+
+def parser_path(documents: List[Document]):
+  pattern = detect_structure(documents[0].page_content)
+  return parse_structured_documents(documents, pattern) if pattern else []
+
+
+def measure(func, documents: List[Document], repeat: int):
+  best = float("inf")
+  result = None
+  for _ in range(repeat):
+    start = time.perf_counter()
+    result = func(documents)
+    best = min(best, time.perf_counter() - start)
+  return best, result
+
+
+def main():
+  parser = argparse.ArgumentParser()
+  parser.add_argument("--pages", type=int, default=500)
+  parser.add_argument("--repeat", type=int, default=5)
+  args = parser.parse_args()
+
+  for name, documents in (("article", make_article_pages(args.pages)),
+                          ("number", make_number_pages(args.pages))):
+    regex_time, regex_chunks = measure(regex_path, documents, args.repeat)
+    parser_time, parser_chunks = measure(parser_path, documents, args.repeat)
+    if regex_chunks != parser_chunks:
+      raise SystemExit(f"[{name}] 두 경로의 청크 결과가 다릅니다")
+
+    per_100 = 100 / args.pages * 1000
+    print(f"[{name}] pages={args.pages} chunks={len(parser_chunks)}")
+    print(f"  regex   {regex_time * per_100:8.2f} ms / 100 pages")
+    print(f"  parser  {parser_time * per_100:8.2f} ms / 100 pages")
+    print(f"  speedup {regex_time / parser_time:8.1f}x")
+
+
+if __name__ == "__main__":
+  main()
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from dotenv import load_dotenv
 
 
@@ -9,3 +10,101 @@ class AppConfig:
   APP_ENV = os.getenv("APP_ENV", "dev")
   QDRANT_HOST = "qdrant" if APP_ENV == "prod" else "localhost"
   QDRANT_PORT = 6333
+  QDRANT_GRPC_PORT = 6334
+  QDRANT_PREFER_GRPC = os.getenv("QDRANT_PREFER_GRPC", "false").lower() == "true"
+  QDRANT_TIMEOUT = int(os.getenv("QDRANT_TIMEOUT", "60"))
+  QDRANT_MAX_CONNECTIONS = int(os.getenv("QDRANT_MAX_CONNECTIONS", "20"))
+  QDRANT_MAX_KEEPALIVE_CONNECTIONS = int(
+      os.getenv("QDRANT_MAX_KEEPALIVE_CONNECTIONS", "10"))
+  QDRANT_KEEPALIVE_EXPIRY = float(os.getenv("QDRANT_KEEPALIVE_EXPIRY", "30"))
+  QDRANT_SEARCH_BATCH_SIZE = int(os.getenv("QDRANT_SEARCH_BATCH_SIZE", "16"))
+  RETRIEVAL_CACHE_ENABLED = \
+    os.getenv("RETRIEVAL_CACHE_ENABLED", "true").lower() == "true"
+  RETRIEVAL_CACHE_MEMORY_BYTES = int(
+      os.getenv("RETRIEVAL_CACHE_MEMORY_BYTES", str(32 * 1024 * 1024)))
+
+  PREWARM_CLIENTS = os.getenv("PREWARM_CLIENTS", "true").lower() == "true"
+  OPENAI_HTTP2 = os.getenv("OPENAI_HTTP2", "true").lower() == "true"
+  OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "50"))
+  OPENAI_MAX_KEEPALIVE_CONNECTIONS = int(
+      os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS", "20"))
+  OPENAI_KEEPALIVE_EXPIRY = float(os.getenv("OPENAI_KEEPALIVE_EXPIRY", "60"))
+  OPENAI_PREWARM_CONNECTIONS = int(os.getenv("OPENAI_PREWARM_CONNECTIONS", "4"))
+
+  PREWARM_MODELS = os.getenv("PREWARM_MODELS", "true").lower() == "true"
+  MODEL_CACHE_DIR = os.getenv("MODEL_CACHE_DIR")
+
+  CACHE_DIR = os.getenv("CACHE_DIR", os.path.join(tempfile.gettempdir(),
+                                                  "contract-ai-cache"))
+  EMBEDDING_CACHE_ENABLED = \
+    os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+  EMBEDDING_CACHE_MEMORY_BYTES = int(
+      os.getenv("EMBEDDING_CACHE_MEMORY_BYTES", str(64 * 1024 * 1024)))
+  EMBEDDING_CACHE_DISK_BYTES = int(
+      os.getenv("EMBEDDING_CACHE_DISK_BYTES", str(1024 * 1024 * 1024)))
+
+  EMBEDDING_MAX_BATCH_SIZE = int(os.getenv("EMBEDDING_MAX_BATCH_SIZE", "32"))
+  EMBEDDING_MAX_BATCH_TOKENS = int(
+      os.getenv("EMBEDDING_MAX_BATCH_TOKENS", "8191"))
+  EMBEDDING_CONCURRENCY = int(os.getenv("EMBEDDING_CONCURRENCY", "4"))
+
+  SENTENCE_SEGMENTER = os.getenv("SENTENCE_SEGMENTER", "korean")
+
+  PDF_PARALLEL_PAGE_THRESHOLD = int(
+      os.getenv("PDF_PARALLEL_PAGE_THRESHOLD", "100"))
+  PDF_EXTRACT_PROCESSES = int(os.getenv("PDF_EXTRACT_PROCESSES", "4"))
+
+  DOWNLOAD_POOL_SIZE = int(os.getenv("DOWNLOAD_POOL_SIZE", "10"))
+  DOWNLOAD_CONNECT_TIMEOUT = float(os.getenv("DOWNLOAD_CONNECT_TIMEOUT", "10"))
+  DOWNLOAD_READ_TIMEOUT = float(os.getenv("DOWNLOAD_READ_TIMEOUT", "30"))
+  DOWNLOAD_CHUNK_BYTES = int(os.getenv("DOWNLOAD_CHUNK_BYTES", str(1024 * 1024)))
+  DOWNLOAD_SPOOL_MAX_BYTES = int(
+      os.getenv("DOWNLOAD_SPOOL_MAX_BYTES", str(8 * 1024 * 1024)))
+  DOWNLOAD_MAX_BYTES = int(
+      os.getenv("DOWNLOAD_MAX_BYTES", str(200 * 1024 * 1024)))
+
+  CPU_EXECUTOR_WORKERS = int(
+      os.getenv("CPU_EXECUTOR_WORKERS", str(min(4, os.cpu_count() or 1))))
+  EVENT_LOOP_MONITOR_ENABLED = \
+    os.getenv("EVENT_LOOP_MONITOR_ENABLED", "true").lower() == "true"
+  EVENT_LOOP_MONITOR_INTERVAL = float(
+      os.getenv("EVENT_LOOP_MONITOR_INTERVAL", "0.1"))
+  EVENT_LOOP_LAG_THRESHOLD = float(os.getenv("EVENT_LOOP_LAG_THRESHOLD", "0.1"))
+
+  OCR_TARGET_TEXT_HEIGHT = int(os.getenv("OCR_TARGET_TEXT_HEIGHT", "32"))
+  OCR_TARGET_DPI = int(os.getenv("OCR_TARGET_DPI", "300"))
+  OCR_MAX_IMAGE_SIDE = int(os.getenv("OCR_MAX_IMAGE_SIDE", "4096"))
+  OCR_JPEG_QUALITY = int(os.getenv("OCR_JPEG_QUALITY", "80"))
+  OCR_CONCURRENCY = int(os.getenv("OCR_CONCURRENCY", "4"))
+  OCR_MAX_CONNECTIONS = int(os.getenv("OCR_MAX_CONNECTIONS", "10"))
+  OCR_KEEPALIVE_EXPIRY = float(os.getenv("OCR_KEEPALIVE_EXPIRY", "60"))
+  OCR_TIMEOUT = float(os.getenv("OCR_TIMEOUT", "60"))
+  OCR_MAX_PAGES = int(os.getenv("OCR_MAX_PAGES", "50"))
+  OCR_PDF_RENDER_DPI = int(os.getenv("OCR_PDF_RENDER_DPI", "300"))
+  OCR_SCANNED_PAGE_MAX_CHARS = int(
+      os.getenv("OCR_SCANNED_PAGE_MAX_CHARS", "30"))
+  OCR_SCANNED_PAGE_MIN_IMAGE_RATIO = float(
+      os.getenv("OCR_SCANNED_PAGE_MIN_IMAGE_RATIO", "0.5"))
+  OCR_CACHE_ENABLED = os.getenv("OCR_CACHE_ENABLED", "true").lower() == "true"
+  OCR_CACHE_TTL_SECONDS = float(
+      os.getenv("OCR_CACHE_TTL_SECONDS", str(7 * 24 * 60 * 60)))
+  OCR_CACHE_DISK_BYTES = int(
+      os.getenv("OCR_CACHE_DISK_BYTES", str(256 * 1024 * 1024)))
+
+  # 분석·검색 캐시는 Qdrant 의 collection_versions 에 저장된 컬렉션 버전으로 무효화됨
+  # 버전은 이 서비스의 기준 문서 적재·삭제 경로에서만 갱신되므로, Qdrant 를 직접 수정하면
+  # 분석 캐시는 TTL 동안, 검색 캐시는 워커가 재시작될 때까지 이전 결과를 반환할 수 있음
+  ANALYSIS_CACHE_ENABLED = \
+    os.getenv("ANALYSIS_CACHE_ENABLED", "true").lower() == "true"
+  ANALYSIS_CACHE_TTL_SECONDS = float(
+      os.getenv("ANALYSIS_CACHE_TTL_SECONDS", str(30 * 24 * 60 * 60)))
+  ANALYSIS_CACHE_DISK_BYTES = int(
+      os.getenv("ANALYSIS_CACHE_DISK_BYTES", str(256 * 1024 * 1024)))
+  SINGLE_FLIGHT_ENABLED = \
+    os.getenv("SINGLE_FLIGHT_ENABLED", "true").lower() == "true"
+  SINGLE_FLIGHT_LEASE_SECONDS = float(
+      os.getenv("SINGLE_FLIGHT_LEASE_SECONDS", "60"))
+  SINGLE_FLIGHT_WAIT_SECONDS = float(
+      os.getenv("SINGLE_FLIGHT_WAIT_SECONDS", "600"))
+  SINGLE_FLIGHT_POLL_INTERVAL = float(
+      os.getenv("SINGLE_FLIGHT_POLL_INTERVAL", "0.25"))
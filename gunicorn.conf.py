@@ -0,0 +1,14 @@
+import os
+
+bind = "0.0.0.0:5000"
+workers = int(os.getenv("GUNICORN_WORKERS", "4"))
+
+# 요청 스레드들이 워커당 하나의 이벤트 루프를 공유해 여러 문서의 LLM/Qdrant I/O를 겹쳐 처리
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+timeout = 3600
+
+
+def worker_exit(server, worker):
+  from app.common.event_loop import shutdown_event_loop
+  shutdown_event_loop()
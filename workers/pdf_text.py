@@ -0,0 +1,11 @@
+from typing import List
+
+import fitz
+
+
+# 프로세스 풀에서 실행되는 함수. spawn 된 프로세스가 app 패키지 전체를 import 하지 않도록
+# 앱 밖의 가벼운 모듈에 둔다.
+def extract_page_texts(pdf_path: str, start: int, stop: int) -> List[str]:
+  with fitz.open(pdf_path) as doc:
+    return [doc[number].get_text("text").strip() for number in
+            range(start, stop)]